@@ -0,0 +1,277 @@
+# app_load_test.py
+"""Headless load test of the Streamlit app with simulated clinician sessions
+
+Each session is a streamlit AppTest (no browser, no network) that walks the
+app like a user: changing dashboard filters, running predictions, switching
+explorer charts and downloading exports. Sessions in one worker process share
+its caches the way sessions share a server process. AppTest swaps a global
+runtime for every rerun, so reruns within a worker are serialized and
+concurrency comes from running several worker processes.
+
+Reports rerun latency percentiles per page and per action, throughput, the
+memory the shared data costs once per process and the extra memory of each
+session.
+
+Usage: python benchmarks/app_load_test.py [--sessions 8] [--workers 2] [--actions 20]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(PROJECT_ROOT, 'streamlit_app.py')
+
+PAGES = ["📊 Dashboard", "🤖 Predictions", "🔍 Data Explorer", "⚙️ Settings"]
+CHART_TYPES = ["Scatter Plot", "Histogram", "Box Plot", "Violin Plot", "Correlation Matrix"]
+GENDERS = ['Male', 'Female', 'Other']
+
+# action -> relative frequency in a session
+ACTION_WEIGHTS = {
+    'dashboard_filter': 4,
+    'predict': 3,
+    'explorer_chart': 3,
+    'export': 1,
+    'settings': 1
+}
+
+
+def rss_mb():
+    """Resident memory of this process in MB (peak RSS where /proc is unavailable)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2
+    except (OSError, ValueError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+
+
+def _record_media_managers():
+    """Keep each rerun's media file manager so deferred downloads can be 'clicked' afterwards
+
+    AppTest builds a fresh MediaFileManager per rerun and drops it when the
+    run ends; download_button callables registered during the run live there.
+    """
+    from streamlit.testing.v1 import app_test
+
+    class RecordingMediaFileManager(app_test.MediaFileManager):
+        last = None
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            RecordingMediaFileManager.last = self
+
+    app_test.MediaFileManager = RecordingMediaFileManager
+    return RecordingMediaFileManager
+
+
+class Session:
+    """One simulated clinician driving an AppTest instance"""
+
+    def __init__(self, session_id, seed, timeout, media_managers):
+        from streamlit.testing.v1 import AppTest
+
+        self.session_id = session_id
+        self.rng = random.Random(seed)
+        self.at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        self.page = PAGES[0]
+        self.records = []
+        self.media_managers = media_managers
+        self.media_manager = None   # manager of this session's latest run, holding its deferred downloads
+
+    def _timed(self, action, fn):
+        previous_manager = self.media_managers.last
+        started = time.perf_counter()
+        error = None
+        try:
+            fn()
+            if self.at.exception:
+                error = str(self.at.exception[0].message)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        # A run builds a new manager; keep it now, before other sessions' runs replace .last
+        if self.media_managers.last is not previous_manager:
+            self.media_manager = self.media_managers.last
+        self.records.append({
+            'session': self.session_id,
+            'page': self.page,
+            'action': action,
+            'ms': (time.perf_counter() - started) * 1000,
+            'error': error
+        })
+
+    def load(self):
+        self._timed('load', self.at.run)
+
+    def goto(self, page):
+        if self.page != page:
+            self.page = page
+            self._timed('navigate', lambda: self.at.sidebar.radio[0].set_value(page).run())
+
+    def dashboard_filter(self):
+        self.goto(PAGES[0])
+        low = self.rng.randint(18, 60)
+        high = self.rng.randint(low + 5, 90)
+        genders = self.rng.sample(GENDERS, self.rng.randint(1, 3))
+
+        def change():
+            sidebar = self.at.sidebar
+            [s for s in sidebar.slider if s.label == "Age Range"][0].set_value((low, high))
+            [m for m in sidebar.multiselect if m.label == "Gender"][0].set_value(genders)
+            self.at.run()
+        self._timed('dashboard_filter', change)
+
+    def predict(self):
+        self.goto(PAGES[1])
+        age = self.rng.randint(18, 95)
+
+        def submit():
+            [n for n in self.at.number_input if n.label == "Age"][0].set_value(age)
+            [b for b in self.at.button if "Calculate Risk" in b.label][0].click().run()
+        self._timed('predict', submit)
+
+    def explorer_chart(self):
+        self.goto(PAGES[2])
+        chart_type = self.rng.choice(CHART_TYPES)
+        self._timed('explorer_chart', lambda: [
+            s for s in self.at.selectbox if s.label == "Chart Type"][0].set_value(chart_type).run())
+
+    def export(self):
+        """Click a download button: run its deferred export like the server would"""
+        self.goto(self.rng.choice([PAGES[0], PAGES[2]]))
+        buttons = [b for b in self.at.get('download_button') if b.proto.deferred_file_id]
+        if not buttons or self.media_manager is None:
+            return
+        button = self.rng.choice(buttons)
+        manager = self.media_manager
+        self._timed('export', lambda: manager.execute_deferred(button.proto.deferred_file_id))
+
+    def settings(self):
+        self.goto(PAGES[3])
+
+    def step(self):
+        action = self.rng.choices(list(ACTION_WEIGHTS), weights=list(ACTION_WEIGHTS.values()))[0]
+        getattr(self, action)()
+
+
+def run_worker(task):
+    """Drive a group of sessions round-robin in this process; returns records and memory"""
+    worker_id, n_sessions, n_actions, seed, timeout = task
+    media_managers = _record_media_managers()
+
+    rss_start = rss_mb()
+    sessions = []
+    for i in range(n_sessions):
+        session = Session(f"w{worker_id}-s{i}", seed * 1000 + worker_id * 100 + i, timeout, media_managers)
+        session.load()
+        sessions.append(session)
+        if i == 0:
+            # The first session also pays for the shared data, indexes and model
+            rss_first = rss_mb()
+
+    rss_loaded = rss_mb()
+    started = time.perf_counter()
+    for _ in range(n_actions):
+        for session in sessions:
+            session.step()
+    elapsed = time.perf_counter() - started
+
+    return {
+        'worker': worker_id,
+        'sessions': n_sessions,
+        'seconds': elapsed,
+        'shared_mb': rss_first - rss_start,
+        'per_session_mb': (rss_loaded - rss_first) / (n_sessions - 1) if n_sessions > 1 else None,
+        'rss_end_mb': rss_mb(),
+        'records': [r for s in sessions for r in s.records]
+    }
+
+
+def summarize(records, by):
+    """count and p50/p95/p99 rerun latency per value of `by`"""
+    rows = []
+    for name in sorted({r[by] for r in records}):
+        ms = np.array([r['ms'] for r in records if r[by] == name and not r['error']])
+        errors = sum(1 for r in records if r[by] == name and r['error'])
+        if len(ms):
+            p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+        else:
+            p50 = p95 = p99 = float('nan')
+        rows.append({by: name, 'count': len(ms), 'errors': errors, 'p50_ms': p50, 'p95_ms': p95, 'p99_ms': p99})
+    return rows
+
+
+def print_summary(title, rows, by):
+    print(f"\n{title}")
+    print(f"{by:<20}{'count':>8}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for row in rows:
+        print(f"{row[by]:<20}{row['count']:>8}{row['errors']:>8}"
+              f"{row['p50_ms']:>10.0f}{row['p95_ms']:>10.0f}{row['p99_ms']:>10.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sessions', type=int, default=8, help="Total simulated sessions")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--actions', type=int, default=20, help="Actions per session after the first load")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--timeout', type=float, default=120, help="Seconds before a rerun counts as hung")
+    parser.add_argument('--json', default=None, help="Also write all records and summaries to this file")
+    args = parser.parse_args()
+
+    n_workers = max(1, min(args.workers or os.cpu_count() or 1, args.sessions))
+    per_worker = [args.sessions // n_workers + (i < args.sessions % n_workers) for i in range(n_workers)]
+    tasks = [(i, n, args.actions, args.seed, args.timeout) for i, n in enumerate(per_worker)]
+
+    print(f"🚀 APP LOAD TEST ({args.sessions} sessions on {n_workers} worker(s), {args.actions} actions each)")
+    print("=" * 66)
+
+    started = time.perf_counter()
+    if n_workers == 1:
+        results = [run_worker(tasks[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            results = list(pool.map(run_worker, tasks))
+    wall = time.perf_counter() - started
+
+    records = [r for result in results for r in result['records']]
+    actions = [r for r in records if r['action'] != 'load']
+    by_page = summarize(records, 'page')
+    by_action = summarize(records, 'action')
+    print_summary("📄 Rerun latency by page", by_page, 'page')
+    print_summary("🖱️ Rerun latency by action", by_action, 'action')
+
+    busy = max(result['seconds'] for result in results)
+    session_mb = [result['per_session_mb'] for result in results if result['per_session_mb'] is not None]
+    errors = [r for r in records if r['error']]
+    print(f"\n⚡ Throughput: {len(actions) / busy:,.1f} actions/s across {n_workers} worker(s) "
+          f"({len(actions):,} actions in {busy:.1f}s; {wall:.1f}s including startup)")
+    print(f"💾 Shared data per process: {np.mean([r['shared_mb'] for r in results]):,.1f} MB")
+    if session_mb:
+        print(f"💾 Memory per extra session: {np.mean(session_mb):,.1f} MB")
+    print(f"💾 Peak worker RSS: {max(r['rss_end_mb'] for r in results):,.1f} MB")
+    if errors:
+        print(f"❌ {len(errors)} rerun(s) failed, e.g. {errors[0]['action']} on {errors[0]['page']}: {errors[0]['error']}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                'sessions': args.sessions, 'workers': n_workers, 'actions': args.actions,
+                'throughput_actions_per_s': len(actions) / busy,
+                'by_page': by_page, 'by_action': by_action,
+                'workers_detail': [{k: v for k, v in r.items() if k != 'records'} for r in results],
+                'records': records
+            }, f, indent=2)
+        print(f"📁 Results written to {args.json}")
+
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
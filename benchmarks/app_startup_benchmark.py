@@ -0,0 +1,168 @@
+# app_startup_benchmark.py
+"""Cold-start cost of the Streamlit app: imports, first paint and first visit to each page
+
+Every trial runs in a fresh interpreter, like the first session after a
+server restart. Streamlit itself is imported before the clock starts, since
+a running server has already loaded it. Reported per trial:
+
+  first content    the first visible element sent to the browser
+  first paint      the whole first script run (imports, data, dashboard render)
+  rerun            a second run of the same page, once everything is warm
+  first <page>     the first navigation to each other page (lazy imports)
+
+plus the heaviest modules imported for first paint and for the other pages,
+from python -X importtime.
+
+Usage: python benchmarks/app_startup_benchmark.py [--trials 5] [--script streamlit_app.py]
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SCRIPT = os.path.join(PROJECT_ROOT, 'streamlit_app.py')
+OTHER_PAGES = ["🤖 Predictions", "🔍 Data Explorer", "⚙️ Settings"]
+APP_MARKER = '### app start ###'
+PAGES_MARKER = '### first paint done ###'
+
+
+# Runs the app inside a timer, so AppTest's own per-run overhead is not counted, and
+# notes when the first visible element is sent (the browser paints as elements stream in)
+WRAPPER = """
+import runpy, sys, time, types
+from streamlit.runtime.scriptrunner_utils.script_run_context import ScriptRunContext
+
+_timings = sys.modules.get('_startup_timings')
+if _timings is None:
+    _timings = sys.modules['_startup_timings'] = types.ModuleType('_startup_timings')
+    _enqueue = ScriptRunContext.enqueue
+
+    def enqueue(self, msg):
+        if _timings.first_content is None and msg.HasField('delta') and msg.delta.HasField('new_element'):
+            element = msg.delta.new_element
+            # Injected stylesheets are not something the user sees
+            if not (element.HasField('markdown') and element.markdown.body.lstrip().startswith('<style')):
+                _timings.first_content = time.perf_counter() - _timings.started
+        _enqueue(self, msg)
+    ScriptRunContext.enqueue = enqueue
+
+_timings.first_content = None
+_timings.started = time.perf_counter()
+try:
+    runpy.run_path({script!r}, run_name='__main__')
+finally:
+    _timings.last = time.perf_counter() - _timings.started
+"""
+
+
+def run_child(script):
+    """One cold start in this (fresh) process; prints a JSON result on stdout"""
+    import tempfile
+    from streamlit.testing.v1 import AppTest
+
+    with tempfile.NamedTemporaryFile('w', suffix='.py', delete=False) as f:
+        f.write(WRAPPER.format(script=script))
+        wrapper = f.name
+
+    try:
+        print(APP_MARKER, file=sys.stderr, flush=True)
+        at = AppTest.from_file(wrapper, default_timeout=300)
+        timings = lambda: sys.modules['_startup_timings'].last
+
+        at.run()
+        result = {
+            'first_content': sys.modules['_startup_timings'].first_content,
+            'first_paint': timings(),
+            'plotly_loaded_at_first_paint': 'plotly' in sys.modules
+        }
+        print(PAGES_MARKER, file=sys.stderr, flush=True)
+
+        at.run()
+        result['rerun'] = timings()
+
+        for page in OTHER_PAGES:
+            at.sidebar.radio[0].set_value(page).run()
+            result[f'first {page}'] = timings()
+
+        result['errors'] = [str(e.message) for e in at.exception]
+    finally:
+        os.unlink(wrapper)
+    print(json.dumps(result))
+
+
+def heaviest_imports(stderr, start, end=None, top=8):
+    """(module, cumulative ms) of the slowest top-level imports between two markers of -X importtime output"""
+    _, _, part = stderr.partition(start)
+    if end:
+        part = part.partition(end)[0]
+    imports = []
+    for line in part.splitlines():
+        match = re.match(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)', line)
+        # Only imports at the outermost level, so nested modules are not counted twice
+        if match and len(match.group(3)) <= 1:
+            imports.append((match.group(4), int(match.group(2)) / 1000))
+    return sorted(imports, key=lambda item: -item[1])[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--script', default=DEFAULT_SCRIPT)
+    parser.add_argument('--trials', type=int, default=5)
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return run_child(args.script)
+
+    script = os.path.abspath(args.script)
+    print(f"🚀 APP STARTUP BENCHMARK ({os.path.relpath(script, PROJECT_ROOT)}, {args.trials} cold starts)")
+    print("=" * 60)
+
+    trials = []
+    import_stderr = None
+    for i in range(args.trials):
+        command = [sys.executable]
+        if i == 0:
+            command += ['-X', 'importtime']
+        command += [os.path.abspath(__file__), '--child', '--script', script]
+        proc = subprocess.run(command, cwd=PROJECT_ROOT, capture_output=True, text=True)
+        lines = [line for line in proc.stdout.splitlines() if line.startswith('{')]
+        if proc.returncode != 0 or not lines:
+            print(f"❌ Trial {i + 1} failed:\n{proc.stderr[-2000:]}")
+            return 1
+        if i == 0:
+            # importtime adds its own overhead, so this trial only supplies the import breakdown
+            import_stderr = proc.stderr
+            continue
+        trials.append(json.loads(lines[-1]))
+
+    if not trials:
+        print("ℹ️ Need at least 2 trials: the first one is used for the import breakdown")
+        return 1
+
+    errors = [e for trial in trials for e in trial['errors']]
+    metrics = [key for key in trials[0] if key not in ('errors', 'plotly_loaded_at_first_paint')]
+    print(f"{'':<26}{'min ms':>10}{'median ms':>12}{'max ms':>10}")
+    for key in metrics:
+        values = sorted(trial[key] * 1000 for trial in trials)
+        print(f"{key:<26}{values[0]:>10.0f}{values[len(values) // 2]:>12.0f}{values[-1]:>10.0f}")
+    print(f"\nplotly imported before first paint: {trials[0]['plotly_loaded_at_first_paint']}")
+
+    print("\n📦 Heaviest top-level imports before first paint (cumulative ms)")
+    for module, ms in heaviest_imports(import_stderr, APP_MARKER, PAGES_MARKER):
+        print(f"   {module:<40}{ms:>10.1f}")
+    print("\n📦 ... and on the first visit to the other pages")
+    for module, ms in heaviest_imports(import_stderr, PAGES_MARKER):
+        print(f"   {module:<40}{ms:>10.1f}")
+
+    if errors:
+        print(f"\n❌ App raised: {errors[0]}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+# inference_load_test.py
+"""Throughput vs latency of BatchScoringService under concurrent clients
+
+Usage: python benchmarks/inference_load_test.py [--model heuristic|logistic|forest]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.modeling.model_inference import BatchScoringService, FEATURE_COLUMNS, predict_risk
+from src.modeling.model_registry import LoadedModel
+
+
+def make_patients(n, seed=0):
+    """Random patient rows in FEATURE_COLUMNS order"""
+    rng = np.random.default_rng(seed)
+    return np.column_stack([
+        rng.integers(18, 90, n),
+        rng.normal(25, 5, n),
+        rng.integers(0, 2, n),
+        rng.integers(0, 2, n),
+        rng.poisson(1.5, n),
+        rng.integers(1, 30, n),
+        rng.normal(120, 20, n)
+    ]).astype(np.float64)
+
+
+def make_model(kind):
+    """None for the heuristic, otherwise a small scikit-learn model wrapped like a registry entry"""
+    if kind == 'heuristic':
+        return None
+
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.linear_model import LogisticRegression
+
+    X = make_patients(5000, seed=1)
+    y = (predict_risk(X) > 0.5).astype(int)
+    estimator = LogisticRegression(max_iter=500) if kind == 'logistic' else RandomForestClassifier(100, n_jobs=1)
+    return LoadedModel('load-test', 'v0000', estimator.fit(X, y), {'feature_columns': FEATURE_COLUMNS})
+
+
+def run_clients(score_one, n_clients, duration, patients):
+    """Closed-loop clients: each sends one patient, waits for the score, repeats"""
+    latencies = [[] for _ in range(n_clients)]
+    stop_at = time.perf_counter() + duration
+
+    def client(i):
+        j = i
+        while time.perf_counter() < stop_at:
+            started = time.perf_counter()
+            score_one(patients[j % len(patients)])
+            latencies[i].append(time.perf_counter() - started)
+            j += n_clients
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(n_clients)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    all_latencies = np.concatenate([np.array(l) for l in latencies]) * 1000
+    return {
+        'throughput': len(all_latencies) / elapsed,
+        'p50_ms': float(np.percentile(all_latencies, 50)),
+        'p95_ms': float(np.percentile(all_latencies, 95)),
+        'p99_ms': float(np.percentile(all_latencies, 99))
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--model', choices=['heuristic', 'logistic', 'forest'], default='forest')
+    parser.add_argument('--clients', type=int, nargs='+', default=[1, 8, 32, 128])
+    parser.add_argument('--wait-ms', type=float, nargs='+', default=[0.5, 2.0, 5.0])
+    parser.add_argument('--duration', type=float, default=3.0)
+    args = parser.parse_args()
+
+    model = make_model(args.model)
+    patients = make_patients(10_000)
+
+    print(f"🚀 INFERENCE LOAD TEST (model={args.model}, {args.duration:.0f}s per run)")
+    print("=" * 78)
+    print(f"{'mode':<18}{'clients':>8}{'req/s':>12}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'batch':>10}")
+
+    for n_clients in args.clients:
+        # Baseline: every request scored on its own, as the form did before
+        def score_direct(row):
+            return predict_risk(row.reshape(1, -1), model)
+
+        result = run_clients(score_direct, n_clients, args.duration, patients)
+        print(f"{'per-request':<18}{n_clients:>8}{result['throughput']:>12,.0f}"
+              f"{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}{result['p99_ms']:>10.2f}{1:>10.1f}")
+
+        for wait_ms in args.wait_ms:
+            service = BatchScoringService(model_provider=lambda: model, max_wait_ms=wait_ms)
+            result = run_clients(service.score, n_clients, args.duration, patients)
+            metrics = service.metrics()
+            service.close()
+            print(f"{f'batched {wait_ms:g}ms':<18}{n_clients:>8}{result['throughput']:>12,.0f}"
+                  f"{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}{result['p99_ms']:>10.2f}"
+                  f"{metrics.get('mean_batch_size', 0):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+# pipeline_benchmark.py
+"""Wall time, throughput and peak memory of every pipeline stage at several scales
+
+Data comes from the synthetic cohort generator, and extraction runs the real
+query against a local SQLite stand-in for the warehouse. Each run is appended
+to a JSON history and compared against a stored baseline; stages that got
+slower or hungrier than --threshold allows are flagged and the exit status
+is 1.
+
+Usage: python benchmarks/pipeline_benchmark.py [--scales 10k 1m 10m] [--stages clean_ dashboard_]
+       python benchmarks/pipeline_benchmark.py --scales 10k 1m --save-baseline
+"""
+import argparse
+import contextlib
+import datetime
+import gc
+import io
+import json
+import math
+import os
+import platform
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from data.synthetic.cohort_generator import generate_cohort, patient_journey
+from data.processed.data_extraction import extract_patient_journey
+from data.processed.data_cleaning import HealthcareDataCleaner
+from data.tableau.tableau_preparation import prepare_for_tableau
+from tests.statistical_testing import perform_statistical_tests
+from src.app.filter_index import FilterIndex
+from src.app.olap_cube import OlapCube
+from src.modeling.model_inference import score_cohort
+
+SCALES = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000, '10m': 10_000_000}
+
+RESULTS_DIR = os.path.join(PROJECT_ROOT, 'benchmarks', 'results')
+HISTORY_FILE = os.path.join(RESULTS_DIR, 'history.json')
+BASELINE_FILE = os.path.join(RESULTS_DIR, 'baseline.json')
+
+# Rows each generated patient contributes on average, with headroom so a scale is always filled
+ADMISSIONS_PER_PATIENT = 1.5
+JOURNEY_ROWS_PER_PATIENT = 4.0
+
+# A typical dashboard filter: two genders, both outcomes, ages 30-80
+DASHBOARD_GENDERS = ['Male', 'Female']
+DASHBOARD_READMISSION = [0, 1]
+DASHBOARD_AGE_RANGE = (30, 80)
+
+NOISE_FLOOR_SECONDS = 0.005   # slowdowns smaller than this are never flagged
+
+
+# ========== DATA ==========
+def make_inputs(rows, seed=42):
+    """(admissions, journey) frames with `rows` rows each, from the synthetic cohort generator"""
+    admissions, _ = generate_cohort(math.ceil(rows / ADMISSIONS_PER_PATIENT), seed=seed, with_labs=False)
+    admissions = admissions.head(rows).reset_index(drop=True)
+
+    journey_admissions, lab_events = generate_cohort(math.ceil(rows / JOURNEY_ROWS_PER_PATIENT), seed=seed + 1)
+    journey = patient_journey(journey_admissions, lab_events).head(rows)
+    return admissions, journey
+
+
+def _datediff(end, start):
+    """MySQL DATEDIFF for the SQLite stand-in: whole days between the date parts"""
+    if end is None or start is None:
+        return None
+    return (datetime.date.fromisoformat(end[:10]) - datetime.date.fromisoformat(start[:10])).days
+
+
+def load_standin_db(journey, path):
+    """A SQLite database with the warehouse tables the extraction query joins"""
+    conn = sqlite3.connect(path)
+    conn.create_function('DATEDIFF', 2, _datediff, deterministic=True)
+
+    patients = journey.drop_duplicates('patient_id')[['patient_id', 'gender', 'admission_age']]
+    admissions = journey.drop_duplicates('admission_id')[
+        ['admission_id', 'patient_id', 'admission_date', 'discharge_date', 'diagnosis']]
+    lab_events = journey[['admission_id', 'item_id', 'lab_value', 'lab_unit', 'lab_time']].rename(
+        columns={'lab_value': 'valuenum', 'lab_unit': 'valueuom', 'lab_time': 'charttime'})
+
+    patients.to_sql('patients', conn, index=False)
+    admissions.to_sql('admissions', conn, index=False)
+    lab_events.to_sql('lab_events', conn, index=False, chunksize=100_000)
+    conn.execute('CREATE INDEX admissions_patient ON admissions (patient_id)')
+    conn.execute('CREATE INDEX lab_events_admission ON lab_events (admission_id)')
+    conn.commit()
+    return conn
+
+
+# ========== STAGES ==========
+def _in_directory(path, fn):
+    """Run fn with path as the working directory (prepare_for_tableau writes to the cwd)"""
+    def run():
+        cwd = os.getcwd()
+        os.chdir(path)
+        try:
+            return fn()
+        finally:
+            os.chdir(cwd)
+    return run
+
+
+def dashboard_aggregates(cube):
+    cells = cube.slice(DASHBOARD_GENDERS, DASHBOARD_READMISSION, DASHBOARD_AGE_RANGE)
+    return cube.kpis(cells), cube.by_age_band(cells), cube.by_month(cells)
+
+
+def pipeline_stages(admissions, journey, workdir):
+    """(name, rows, callable) for every benchmarked step; setup work happens here, outside the timings"""
+    conn = load_standin_db(journey, os.path.join(workdir, 'standin.db'))
+    with contextlib.redirect_stdout(io.StringIO()):
+        cleaned = HealthcareDataCleaner(journey).handle_missing_values().create_feature().df
+    index = FilterIndex(admissions)
+    cube = OlapCube(admissions)
+    dashboard_filter = (
+        {'gender': DASHBOARD_GENDERS, 'readmission_30d': DASHBOARD_READMISSION},
+        {'age': DASHBOARD_AGE_RANGE}
+    )
+
+    return [
+        ('extract_patient_journey', len(journey), lambda: extract_patient_journey(conn)),
+        ('clean_handle_missing_values', len(journey), lambda: HealthcareDataCleaner(journey).handle_missing_values()),
+        ('clean_create_feature', len(journey), lambda: HealthcareDataCleaner(journey).create_feature()),
+        ('clean_detect_outliers_iqr', len(journey),
+         lambda: HealthcareDataCleaner(journey).detect_outliers_iqr('length_of_stay')),
+        ('prepare_for_tableau', len(cleaned), _in_directory(workdir, lambda: prepare_for_tableau(cleaned))),
+        ('statistical_tests', len(admissions), lambda: perform_statistical_tests(admissions)),
+        ('dashboard_index_build', len(admissions), lambda: FilterIndex(admissions)),
+        ('dashboard_filter', len(admissions), lambda: index.positions(*dashboard_filter)),
+        ('dashboard_cube_build', len(admissions), lambda: OlapCube(admissions)),
+        ('dashboard_aggregate', len(admissions), lambda: dashboard_aggregates(cube)),
+        ('batch_scoring', len(admissions), lambda: score_cohort(admissions)),
+    ], conn
+
+
+def measure(fn, rows, repeat=3, trace_memory=True):
+    """Best wall time over `repeat` runs, then one traced run for peak memory
+
+    Memory is measured separately because tracemalloc slows Python-heavy code
+    down enough to distort the timings.
+    """
+    times = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            gc.collect()
+            started = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - started)
+
+        peak_mb = None
+        if trace_memory:
+            gc.collect()
+            tracemalloc.start()
+            try:
+                fn()
+                peak_mb = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+            finally:
+                tracemalloc.stop()
+
+    seconds = min(times)
+    return {
+        'rows': rows,
+        'seconds': seconds,
+        'rows_per_second': rows / seconds if seconds > 0 else None,
+        'peak_mb': peak_mb
+    }
+
+
+# ========== HISTORY & BASELINE ==========
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_json(path, default):
+    if not os.path.exists(path):
+        return default
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_json(path, value):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(value, f, indent=2)
+
+
+def find_regressions(run, baseline, threshold):
+    """Stages whose time or peak memory grew by more than threshold against the baseline"""
+    base = {(r['scale'], r['stage']): r for r in baseline.get('results', []) if 'error' not in r}
+    regressions = []
+    for result in run['results']:
+        old = base.get((result['scale'], result['stage']))
+        if old is None or 'error' in result:
+            continue
+
+        if (result['seconds'] > old['seconds'] * (1 + threshold)
+                and result['seconds'] - old['seconds'] > NOISE_FLOOR_SECONDS):
+            regressions.append((result['scale'], result['stage'], 'time', old['seconds'], result['seconds']))
+        if (result.get('peak_mb') and old.get('peak_mb')
+                and result['peak_mb'] > old['peak_mb'] * (1 + threshold)):
+            regressions.append((result['scale'], result['stage'], 'memory', old['peak_mb'], result['peak_mb']))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scales', nargs='+', choices=list(SCALES), default=['10k', '1m', '10m'])
+    parser.add_argument('--stages', nargs='+', default=None, help="Only stages whose name starts with one of these")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--no-memory', action='store_true', help="Skip the traced run for peak memory")
+    parser.add_argument('--threshold', type=float, default=0.2, help="Allowed growth before a regression is flagged")
+    parser.add_argument('--history', default=HISTORY_FILE)
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--save-baseline', action='store_true', help="Store this run as the new baseline")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    run = {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'results': []
+    }
+
+    print(f"🚀 PIPELINE BENCHMARK (scales: {', '.join(args.scales)}, best of {args.repeat})")
+    print("=" * 86)
+    print(f"{'scale':<7}{'stage':<30}{'rows':>12}{'seconds':>11}{'rows/s':>14}{'peak MB':>12}")
+
+    for scale in args.scales:
+        rows = SCALES[scale]
+        admissions, journey = make_inputs(rows, seed=args.seed)
+
+        with tempfile.TemporaryDirectory() as workdir:
+            stages, conn = pipeline_stages(admissions, journey, workdir)
+            try:
+                for name, stage_rows, fn in stages:
+                    if args.stages and not any(name.startswith(prefix) for prefix in args.stages):
+                        continue
+                    try:
+                        result = measure(fn, stage_rows, repeat=args.repeat, trace_memory=not args.no_memory)
+                    except Exception as e:
+                        result = {'rows': stage_rows, 'error': f"{type(e).__name__}: {e}"}
+                        print(f"{scale:<7}{name:<30}{stage_rows:>12,}   ❌ {result['error']}")
+                    else:
+                        peak = f"{result['peak_mb']:,.1f}" if result['peak_mb'] is not None else '-'
+                        print(f"{scale:<7}{name:<30}{stage_rows:>12,}{result['seconds']:>11.3f}"
+                              f"{result['rows_per_second'] or 0:>14,.0f}{peak:>12}")
+                    run['results'].append({'scale': scale, 'stage': name, **result})
+            finally:
+                conn.close()
+
+        del admissions, journey
+        gc.collect()
+
+    history = load_json(args.history, [])
+    history.append(run)
+    save_json(args.history, history)
+    print(f"\n📁 Run appended to {args.history} ({len(history)} runs)")
+
+    baseline = load_json(args.baseline, None)
+    regressions = find_regressions(run, baseline, args.threshold) if baseline else []
+    if baseline is None:
+        print("ℹ️ No baseline yet; store one with --save-baseline")
+    elif regressions:
+        print(f"\n⚠️ {len(regressions)} regression(s) against baseline {baseline.get('commit')} "
+              f"({baseline.get('timestamp')}), threshold {args.threshold:.0%}:")
+        for scale, stage, kind, old, new in regressions:
+            unit = 's' if kind == 'time' else ' MB'
+            print(f"   {scale:<7}{stage:<30}{kind:<8}{old:,.3f}{unit} → {new:,.3f}{unit} ({new / old - 1:+.0%})")
+    else:
+        print(f"✅ No regressions against baseline {baseline.get('commit')} ({baseline.get('timestamp')})")
+
+    if args.save_baseline:
+        save_json(args.baseline, run)
+        print(f"💾 Baseline saved to {args.baseline}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
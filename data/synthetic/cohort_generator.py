@@ -0,0 +1,259 @@
+# cohort_generator.py
+"""Synthetic patient cohorts at realistic scale
+
+Patients get several admissions with real gaps between them: whether the
+next stay starts within 30 days of discharge follows the app's readmission
+risk logic, so readmission_30d agrees with what HealthcareDataCleaner
+derives from the dates. Each chunk of patients draws from its own
+numpy Generator stream (spawned from one SeedSequence), so output is
+reproducible for a given seed and chunk size whatever the number of workers.
+
+Usage: python data/synthetic/cohort_generator.py --patients 4000000 --out data/synthetic/cohort
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_START = '2023-01-01'
+DEFAULT_END = '2023-12-31'
+DEFAULT_CHUNK_PATIENTS = 100_000
+MAX_ADMISSIONS = 50           # admission_id = patient_id * 100 + admission number
+
+GENDERS = np.array(['Male', 'Female', 'Other'])
+GENDER_P = [0.48, 0.48, 0.04]
+
+RETURN_PROBABILITY = 0.35     # chance a patient who is not readmitted comes back within the window
+RETURN_GAP_DAYS = 240         # mean extra days before such a later admission
+
+# item_id -> (label, unit, mean, sd)
+LAB_ITEMS = {
+    50912: ('Creatinine', 'mg/dL', 1.1, 0.4),
+    50931: ('Glucose', 'mg/dL', 110.0, 35.0),
+    50971: ('Potassium', 'mEq/L', 4.2, 0.5),
+    50983: ('Sodium', 'mEq/L', 139.0, 4.0),
+    51222: ('Hemoglobin', 'g/dL', 12.5, 2.0),
+    51301: ('White Blood Cells', 'K/uL', 8.5, 3.5)
+}
+DIAGNOSES = np.array(['Heart Failure', 'Pneumonia', 'COPD', 'Sepsis', 'Diabetes Complication', 'Stroke', 'Hip Fracture'])
+ADMISSION_TYPES = np.array(['EMERGENCY', 'URGENT', 'ELECTIVE'])
+
+ADMISSION_COLUMNS = [
+    'patient_id', 'admission_id', 'admission_date', 'age', 'gender', 'length_of_stay',
+    'blood_pressure_sys', 'blood_pressure_dia', 'cholesterol', 'bmi', 'diabetes',
+    'hypertension', 'previous_admissions', 'lab_result', 'readmission_30d',
+    'admission_month', 'admission_day', 'discharge_date'
+]
+
+DAY = np.timedelta64(1, 'D')
+MINUTE = np.timedelta64(1, 'm')
+
+
+def readmission_risk(age, length_of_stay, diabetes, hypertension, cholesterol, previous_admissions, noise):
+    """The app's readmission risk score; above 0.5 means readmitted within 30 days"""
+    return (
+        (age - 30) / 60 * 0.3 +
+        (length_of_stay > 10) * 0.2 +
+        (diabetes == 1) * 0.15 +
+        (hypertension == 1) * 0.1 +
+        (cholesterol > 240) * 0.1 +
+        (previous_admissions > 2) * 0.15 +
+        noise
+    )
+
+
+def generate_chunk(seed, first_patient_id, n_patients, start=DEFAULT_START, end=DEFAULT_END,
+                   max_admissions=MAX_ADMISSIONS, with_labs=True):
+    """Admissions (and lab events) for patients first_patient_id .. first_patient_id + n_patients - 1"""
+    rng = np.random.default_rng(seed)
+    start = np.datetime64(start, 'm')
+    end = np.datetime64(end, 'm')
+    window_minutes = int((end - start) / MINUTE) + 1
+
+    # Per-patient traits, drawn once
+    patient_ids = np.arange(first_patient_id, first_patient_id + n_patients, dtype=np.int64)
+    gender = GENDERS[rng.choice(len(GENDERS), n_patients, p=GENDER_P)]
+    first_age = rng.integers(18, 90, n_patients)
+    diabetes = (rng.random(n_patients) < 0.3).astype(np.int64)
+    hypertension = (rng.random(n_patients) < 0.4).astype(np.int64)
+    base_bmi = rng.normal(25, 5, n_patients)
+    base_cholesterol = rng.normal(200, 40, n_patients)
+    base_bp_sys = rng.normal(120, 20, n_patients)
+    base_bp_dia = rng.normal(80, 10, n_patients)
+    prior_admissions = rng.poisson(1.5, n_patients)
+
+    first_admission = start + rng.integers(0, window_minutes, n_patients) * MINUTE
+
+    # One vectorized step per admission number over the patients still active
+    active = np.arange(n_patients)
+    admit = first_admission
+    steps = []
+    for k in range(max_admissions):
+        m = len(active)
+        if m == 0:
+            break
+
+        length_of_stay = rng.exponential(7, m).astype(np.int64) + 1
+        age = first_age[active] + (admit - first_admission[active]) // (365 * DAY)
+        cholesterol = (base_cholesterol[active] + rng.normal(0, 10, m)).astype(np.int64)
+        previous_admissions = prior_admissions[active] + k
+
+        risk = readmission_risk(age, length_of_stay, diabetes[active], hypertension[active],
+                                cholesterol, previous_admissions, rng.normal(0, 0.1, m))
+        # Stays starting after the window, or at the last allowed admission, get no successor
+        readmitted = (risk > 0.5) & (admit <= end) & (k < max_admissions - 1)
+
+        discharge = admit + length_of_stay * DAY
+        gap_days = np.where(readmitted, rng.integers(1, 31, m), 31 + rng.exponential(RETURN_GAP_DAYS, m).astype(np.int64))
+        next_admit = discharge + gap_days * DAY + rng.integers(0, 24 * 60, m) * MINUTE
+
+        steps.append({
+            'patient_id': patient_ids[active],
+            'admission_id': patient_ids[active] * 100 + k,
+            'admission_date': admit,
+            'age': age,
+            'gender': gender[active],
+            'length_of_stay': length_of_stay,
+            'blood_pressure_sys': (base_bp_sys[active] + rng.normal(0, 8, m)).astype(np.int64),
+            'blood_pressure_dia': (base_bp_dia[active] + rng.normal(0, 5, m)).astype(np.int64),
+            'cholesterol': cholesterol,
+            'bmi': base_bmi[active] + rng.normal(0, 0.5, m),
+            'diabetes': diabetes[active],
+            'hypertension': hypertension[active],
+            'previous_admissions': previous_admissions,
+            'lab_result': rng.normal(100, 20, m),
+            'readmission_30d': readmitted.astype(np.int64),
+            'discharge_date': discharge
+        })
+
+        # Readmissions always happen (even just past the window); other patients may come back later
+        returns = readmitted | ((rng.random(m) < RETURN_PROBABILITY) & (next_admit <= end))
+        active = active[returns]
+        admit = next_admit[returns]
+
+    columns = {name: np.concatenate([step[name] for step in steps]) for name in steps[0]}
+    order = np.lexsort((columns['admission_date'], columns['patient_id']))
+    admissions = pd.DataFrame({name: values[order] for name, values in columns.items()})
+    admissions['admission_date'] = admissions['admission_date'].astype('datetime64[us]')
+    admissions['discharge_date'] = admissions['discharge_date'].astype('datetime64[us]')
+    admissions['admission_month'] = admissions['admission_date'].dt.month
+    admissions['admission_day'] = admissions['admission_date'].dt.day
+    admissions = admissions[ADMISSION_COLUMNS]
+
+    if not with_labs:
+        return admissions, None
+    return admissions, generate_lab_events(rng, admissions)
+
+
+def generate_lab_events(rng, admissions):
+    """A handful of lab results per admission, charted during the stay"""
+    n_labs = rng.poisson(2, len(admissions)) + 1
+    rows = np.repeat(np.arange(len(admissions)), n_labs)
+    item_ids = np.array(list(LAB_ITEMS))
+    items = rng.integers(0, len(item_ids), len(rows))
+    means = np.array([spec[2] for spec in LAB_ITEMS.values()])
+    sds = np.array([spec[3] for spec in LAB_ITEMS.values()])
+    units = np.array([spec[1] for spec in LAB_ITEMS.values()])
+
+    stay_minutes = admissions['length_of_stay'].to_numpy()[rows] * 24 * 60
+    lab_time = (admissions['admission_date'].to_numpy()[rows]
+                + (rng.random(len(rows)) * stay_minutes).astype(np.int64) * MINUTE)
+
+    return pd.DataFrame({
+        'patient_id': admissions['patient_id'].to_numpy()[rows],
+        'admission_id': admissions['admission_id'].to_numpy()[rows],
+        'item_id': item_ids[items],
+        'lab_value': rng.normal(means[items], sds[items]),
+        'lab_unit': units[items],
+        'lab_time': lab_time.astype('datetime64[us]')
+    })
+
+
+def generate_cohort(n_patients=1000, seed=42, first_patient_id=1000, **kwargs):
+    """A small in-memory cohort from a single stream: (admissions, lab_events)"""
+    return generate_chunk(np.random.SeedSequence(seed), first_patient_id, n_patients, **kwargs)
+
+
+def patient_journey(admissions, lab_events):
+    """One row per lab event, shaped like extract_patient_journey() output"""
+    admission_ids = admissions['admission_id'].to_numpy()
+    journey = admissions[['patient_id', 'gender', 'age', 'admission_id', 'admission_date',
+                          'discharge_date', 'length_of_stay']].rename(columns={'age': 'admission_age'})
+    journey['diagnosis'] = DIAGNOSES[admission_ids % len(DIAGNOSES)]
+    journey['admission_type'] = ADMISSION_TYPES[(admission_ids // 7) % len(ADMISSION_TYPES)]
+    labs = lab_events.drop(columns='patient_id')
+    return journey.merge(labs, on='admission_id', how='inner').sort_values(
+        ['patient_id', 'admission_date', 'lab_time'], kind='stable').reset_index(drop=True)
+
+
+# ========== PARALLEL PARQUET OUTPUT ==========
+def _write_chunk(task):
+    seed, chunk_index, first_patient_id, n_patients, out_dir, kwargs = task
+    admissions, lab_events = generate_chunk(seed, first_patient_id, n_patients, **kwargs)
+    name = f"part-{chunk_index:05d}.parquet"
+    admissions.to_parquet(os.path.join(out_dir, 'admissions', name), index=False)
+    if lab_events is not None:
+        lab_events.to_parquet(os.path.join(out_dir, 'lab_events', name), index=False)
+    return len(admissions), 0 if lab_events is None else len(lab_events)
+
+
+def write_cohort(out_dir, n_patients, seed=42, chunk_patients=DEFAULT_CHUNK_PATIENTS, n_jobs=None,
+                 first_patient_id=1000, **kwargs):
+    """Generate a cohort in parallel chunks, one Parquet part per chunk and table
+
+    Writes <out_dir>/admissions/part-NNNNN.parquet and, unless with_labs=False,
+    <out_dir>/lab_events/part-NNNNN.parquet. Both directories read back as
+    datasets with pd.read_parquet(path).
+    """
+    n_jobs = n_jobs or os.cpu_count() or 1
+    n_chunks = -(-n_patients // chunk_patients)
+    seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+
+    os.makedirs(os.path.join(out_dir, 'admissions'), exist_ok=True)
+    if kwargs.get('with_labs', True):
+        os.makedirs(os.path.join(out_dir, 'lab_events'), exist_ok=True)
+
+    tasks = [
+        (seeds[i], i, first_patient_id + i * chunk_patients,
+         min(chunk_patients, n_patients - i * chunk_patients), out_dir, kwargs)
+        for i in range(n_chunks)
+    ]
+
+    started = time.perf_counter()
+    if n_jobs == 1:
+        counts = [_write_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            counts = list(pool.map(_write_chunk, tasks))
+
+    n_admissions = sum(c[0] for c in counts)
+    n_labs = sum(c[1] for c in counts)
+    elapsed = time.perf_counter() - started
+    print(f"✅ Generated {n_patients:,} patients, {n_admissions:,} admissions, {n_labs:,} lab events "
+          f"in {n_chunks} chunks ({elapsed:.1f}s, {n_admissions / elapsed:,.0f} admissions/s)")
+    return {'patients': n_patients, 'admissions': n_admissions, 'lab_events': n_labs,
+            'chunks': n_chunks, 'seconds': elapsed, 'out_dir': out_dir}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--patients', type=int, default=100_000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--out', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cohort'))
+    parser.add_argument('--chunk-patients', type=int, default=DEFAULT_CHUNK_PATIENTS)
+    parser.add_argument('--jobs', type=int, default=None)
+    parser.add_argument('--start', default=DEFAULT_START)
+    parser.add_argument('--end', default=DEFAULT_END)
+    parser.add_argument('--no-labs', action='store_true', help="Skip lab events")
+    args = parser.parse_args()
+
+    write_cohort(args.out, args.patients, seed=args.seed, chunk_patients=args.chunk_patients, n_jobs=args.jobs,
+                 start=args.start, end=args.end, with_labs=not args.no_labs)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
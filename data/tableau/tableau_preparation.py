@@ -1,4 +1,11 @@
 # tableau_preparation.py
+from src.monitoring.metrics import pipeline_stage
+
+# Rows an Excel sheet holds below its header row
+EXCEL_MAX_ROWS = 1_048_575
+
+
+@pipeline_stage('tableau_export')
 def prepare_for_tableau(df):
     """Prepare and export data for Tableau dashboard"""
     
@@ -23,9 +30,16 @@ def prepare_for_tableau(df):
     
     # Export to CSV for Tableau
     tableau_data.to_csv('tableau_healthcare_data.csv', index=False)
-    tableau_data.to_excel('tableau_healthcare_data.xlsx', index=False)
+    files = ['tableau_healthcare_data.csv']
+    
+    # Excel cannot hold more rows; Tableau reads the CSV either way
+    if len(tableau_data) <= EXCEL_MAX_ROWS:
+        tableau_data.to_excel('tableau_healthcare_data.xlsx', index=False)
+        files.append('tableau_healthcare_data.xlsx')
+    else:
+        print(f"⚠️ {len(tableau_data):,} records exceed Excel's {EXCEL_MAX_ROWS:,} row limit; skipped the .xlsx export")
     
     print(f"✅ Tableau data exported: {len(tableau_data)} records")
-    print(f"📁 Files created: tableau_healthcare_data.csv, tableau_healthcare_data.xlsx")
+    print(f"📁 Files created: {', '.join(files)}")
     
     return tableau_data
\ No newline at end of file
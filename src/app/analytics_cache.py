@@ -0,0 +1,174 @@
+# analytics_cache.py
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+def normalise_filter_key(page, categories=None, ranges=None, **extra):
+    """Hashable filter state that ignores selection order and float noise"""
+    categories = categories or {}
+    ranges = ranges or {}
+    return (
+        page,
+        tuple((col, tuple(sorted(values, key=repr))) for col, values in sorted(categories.items())),
+        tuple((col, (round(float(low), 6), round(float(high), 6))) for col, (low, high) in sorted(ranges.items())),
+        tuple(sorted(extra.items()))
+    )
+
+
+class LRUCache:
+    """Thread-safe mapping that keeps the most recently used max_entries items"""
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._items:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def put(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+        return value
+
+    def items(self):
+        with self._lock:
+            return list(self._items.items())
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._items)}
+
+
+class MomentSums:
+    """Additive sums for a pairwise-complete correlation matrix
+
+    For every column pair (i, j) over rows where both are present it keeps the
+    count, sum of x_i, sum of x_i squared and sum of x_i * x_j. Rows can be
+    added or removed in O(rows x columns^2) without touching the rest, and
+    values are shifted by a fixed reference to keep the sums well conditioned.
+    """
+
+    def __init__(self, columns, shift):
+        p = len(columns)
+        self.columns = list(columns)
+        self.shift = shift
+        self.count = np.zeros((p, p))
+        self.sum = np.zeros((p, p))
+        self.sum_sq = np.zeros((p, p))
+        self.cross = np.zeros((p, p))
+
+    @classmethod
+    def from_rows(cls, X, columns):
+        with np.errstate(all='ignore'):
+            shift = np.nan_to_num(np.nanmean(X, axis=0)) if len(X) else np.zeros(X.shape[1])
+        return cls(columns, shift).add(X)
+
+    def _update(self, X, sign):
+        present = (~np.isnan(X)).astype(np.float64)
+        values = np.where(present > 0, X - self.shift, 0.0)
+        self.count += sign * (present.T @ present)
+        self.sum += sign * (values.T @ present)
+        self.sum_sq += sign * ((values ** 2).T @ present)
+        self.cross += sign * (values.T @ values)
+        return self
+
+    def add(self, X):
+        return self._update(X, 1)
+
+    def subtract(self, X):
+        return self._update(X, -1)
+
+    def corr(self):
+        n = self.count
+        with np.errstate(all='ignore'):
+            covariance = n * self.cross - self.sum * self.sum.T
+            variance = n * self.sum_sq - self.sum ** 2
+            corr = covariance / np.sqrt(variance * variance.T)
+        corr[(n < 2) | ~(variance > 0) | ~(variance.T > 0)] = np.nan
+        corr = np.clip(corr, -1.0, 1.0)
+        diagonal = np.diag(corr)
+        np.fill_diagonal(corr, np.where(np.isnan(diagonal), np.nan, 1.0))
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+
+class AnalyticsCache:
+    """Memoized explorer analytics keyed by (dataset version, filter state)
+
+    Correlations keep their MomentSums and row positions, so a nearby filter
+    state (say, a slider moved one step) is answered by adding and removing
+    only the rows that changed.
+    """
+
+    def __init__(self, max_entries=64, max_moments=8):
+        self.results = LRUCache(max_entries)
+        self.moments = LRUCache(max_moments)   # (data_key, columns, filter_key) -> (positions, MomentSums)
+        self.incremental_updates = 0
+
+    def describe(self, data_key, filter_key, frame):
+        key = ('describe', data_key, filter_key)
+        result = self.results.get(key)
+        if result is None:
+            result = self.results.put(key, frame.describe())
+        return result
+
+    def correlation(self, data_key, filter_key, data, positions, columns):
+        columns = tuple(columns)
+        key = ('corr', data_key, columns, filter_key)
+        result = self.results.get(key)
+        if result is not None:
+            return result
+
+        moments = None
+        # Most recently used neighbour on the same dataset and columns
+        for (moment_data_key, moment_columns, _), (old_positions, old_moments) in reversed(self.moments.items()):
+            if moment_data_key != data_key or moment_columns != columns:
+                continue
+            added = np.setdiff1d(positions, old_positions, assume_unique=True)
+            removed = np.setdiff1d(old_positions, positions, assume_unique=True)
+            if len(added) + len(removed) < len(positions):
+                moments = MomentSums(columns, old_moments.shift)
+                for name in ('count', 'sum', 'sum_sq', 'cross'):
+                    setattr(moments, name, getattr(old_moments, name).copy())
+                moments.add(self._rows(data, added, columns)).subtract(self._rows(data, removed, columns))
+                self.incremental_updates += 1
+            break
+
+        if moments is None:
+            moments = MomentSums.from_rows(self._rows(data, positions, columns), columns)
+
+        self.moments.put((data_key, columns, filter_key), (positions, moments))
+        return self.results.put(key, moments.corr())
+
+    def stats(self):
+        return {**self.results.stats(), 'incremental_updates': self.incremental_updates}
+
+    @staticmethod
+    def _rows(data, positions, columns):
+        if not len(columns):
+            return np.empty((len(positions), 0))
+        return np.column_stack([
+            data[col].take(positions).to_numpy(dtype=np.float64, na_value=np.nan) for col in columns
+        ])
+
+
+_analytics_cache = AnalyticsCache()
+
+
+def get_analytics_cache():
+    """The process-wide analytics cache"""
+    return _analytics_cache
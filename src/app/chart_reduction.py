@@ -0,0 +1,144 @@
+# chart_reduction.py
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+MAX_POINTS = 2000            # most raw points any explorer chart sends to the browser
+DENSITY_THRESHOLD = 20000    # above this many rows a scatter becomes a binned density map
+DENSITY_BINS = 60
+HISTOGRAM_BINS = 30
+
+COLORS = px.colors.qualitative.Plotly
+
+
+def stratified_sample(df, max_rows=MAX_POINTS, stratify='readmission_30d', seed=0):
+    """At most max_rows rows, keeping each stratum's share of the data"""
+    if len(df) <= max_rows:
+        return df
+
+    rng = np.random.default_rng(seed)
+    if stratify in df.columns:
+        codes = pd.factorize(df[stratify], use_na_sentinel=False)[0]
+    else:
+        codes = np.zeros(len(df), dtype=np.int64)
+    counts = np.bincount(codes)
+
+    # Largest-remainder quotas so the strata add up to exactly max_rows
+    shares = counts * max_rows / len(df)
+    quotas = np.floor(shares).astype(np.int64)
+    remainder = max_rows - quotas.sum()
+    quotas[np.argsort(quotas - shares, kind='stable')[:remainder]] += 1
+
+    positions = np.concatenate([
+        rng.choice(np.flatnonzero(codes == code), quota, replace=False)
+        for code, quota in enumerate(quotas) if quota
+    ])
+    return df.take(np.sort(positions))
+
+
+def group_quartiles(df, column, group_by):
+    """Box statistics per group, with Tukey fences like Plotly computes them"""
+    rows = []
+    for group, values in df.groupby(group_by, sort=True)[column]:
+        values = values.dropna().to_numpy(dtype=np.float64)
+        if not len(values):
+            continue
+        q1, median, q3 = np.percentile(values, [25, 50, 75])
+        iqr = q3 - q1
+        rows.append({
+            'group': group,
+            'q1': q1,
+            'median': median,
+            'q3': q3,
+            'lowerfence': values[values >= q1 - 1.5 * iqr].min(),
+            'upperfence': values[values <= q3 + 1.5 * iqr].max(),
+            'mean': values.mean(),
+            'n': len(values)
+        })
+    return pd.DataFrame(rows)
+
+
+def _quartile_box(row, color, **kwargs):
+    return go.Box(
+        x=[str(row.group)],
+        q1=[row.q1], median=[row.median], q3=[row.q3],
+        lowerfence=[row.lowerfence], upperfence=[row.upperfence], mean=[row.mean],
+        marker_color=color,
+        hovertext=f"n={row.n:,}",
+        **kwargs
+    )
+
+
+def scatter_chart(df, x, y, title, max_points=MAX_POINTS, density_threshold=DENSITY_THRESHOLD, seed=0):
+    """Scatter of at most max_points rows, or a server-side density map for large numeric data"""
+    numeric = pd.api.types.is_numeric_dtype(df[x]) and pd.api.types.is_numeric_dtype(df[y])
+
+    if numeric and len(df) > density_threshold:
+        values = df[[x, y]].to_numpy(dtype=np.float64)
+        values = values[np.isfinite(values).all(axis=1)]
+        counts, x_edges, y_edges = np.histogram2d(values[:, 0], values[:, 1], bins=DENSITY_BINS)
+        fig = go.Figure(go.Heatmap(
+            x=(x_edges[:-1] + x_edges[1:]) / 2,
+            y=(y_edges[:-1] + y_edges[1:]) / 2,
+            z=np.where(counts > 0, counts, np.nan).T,
+            colorscale='Viridis',
+            colorbar=dict(title='Patients')
+        ))
+        fig.update_layout(title=f"{title} (density of {len(values):,} patients)", xaxis_title=x, yaxis_title=y)
+        return fig
+
+    sample = stratified_sample(df, max_points, seed=seed)
+    hover_data = [col for col in ['patient_id', 'gender', 'age'] if col in sample.columns]
+    if len(sample) < len(df):
+        title = f"{title} ({len(sample):,} of {len(df):,} patients)"
+    return px.scatter(sample, x=x, y=y, color='readmission_30d', hover_data=hover_data, title=title)
+
+
+def histogram_chart(df, column, color_by, title, bins=HISTOGRAM_BINS):
+    """Overlaid histogram binned on the server, one bar trace per group"""
+    values = df[column].to_numpy(dtype=np.float64)
+    finite = values[np.isfinite(values)]
+    edges = np.histogram_bin_edges(finite, bins=bins) if len(finite) else np.linspace(0, 1, bins + 1)
+
+    fig = go.Figure()
+    for i, (group, group_values) in enumerate(df.groupby(color_by, sort=False)[column]):
+        counts, _ = np.histogram(group_values.to_numpy(dtype=np.float64), bins=edges)
+        fig.add_trace(go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges),
+            name=str(group), marker_color=COLORS[i % len(COLORS)], opacity=0.5
+        ))
+    fig.update_layout(title=title, barmode='overlay', xaxis_title=column, yaxis_title='count',
+                      legend_title_text=color_by)
+    return fig
+
+
+def box_chart(df, column, group_by, title):
+    """Box plot drawn from precomputed quartiles"""
+    fig = go.Figure()
+    for i, row in enumerate(group_quartiles(df, column, group_by).itertuples()):
+        fig.add_trace(_quartile_box(row, COLORS[i % len(COLORS)], name=str(row.group)))
+    fig.update_layout(title=title, xaxis_title=group_by, yaxis_title=column, legend_title_text=group_by)
+    return fig
+
+
+def violin_chart(df, column, group_by, title, max_points=MAX_POINTS, seed=0):
+    """Violins over a stratified sample, with boxes from the full data's quartiles"""
+    sample = stratified_sample(df, max_points, stratify=group_by, seed=seed)
+    sample_groups = dict(list(sample.groupby(group_by, sort=True)[column]))
+
+    fig = go.Figure()
+    for i, row in enumerate(group_quartiles(df, column, group_by).itertuples()):
+        color = COLORS[i % len(COLORS)]
+        values = sample_groups.get(row.group, pd.Series(dtype=np.float64)).dropna()
+        fig.add_trace(go.Violin(
+            x=[str(row.group)] * len(values), y=values, name=str(row.group), legendgroup=str(row.group),
+            line_color=color, points='all', box_visible=False
+        ))
+        fig.add_trace(_quartile_box(row, color, width=0.1, legendgroup=str(row.group), showlegend=False))
+
+    if len(sample) < len(df):
+        title = f"{title} ({len(sample):,} of {len(df):,} patients shown)"
+    fig.update_layout(title=title, violinmode='overlay', boxmode='overlay',
+                      xaxis_title=group_by, yaxis_title=column, legend_title_text=group_by)
+    return fig
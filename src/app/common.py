@@ -0,0 +1,284 @@
+# common.py
+"""Shared data, caches, metrics and widgets used by the app shell and every page
+
+Imported once per server process, on the first run after the page shell has
+been sent, so the definitions here are not re-executed on every rerun.
+"""
+import functools
+import os
+import time
+from collections import deque
+from datetime import datetime
+
+import streamlit as st
+
+from src.app.data_store import get_store
+from src.app.filter_index import FilterIndex
+from src.app.olap_cube import OlapCube
+from src.app.analytics_cache import get_analytics_cache
+from src.app.exports import EXPORT_FORMATS, get_export_cache, write_export
+from src.app.figure_cache import get_figure_cache
+from src.app.instrumentation import get_timings, timed, process_memory_mb
+from src.monitoring.metrics import (
+    get_registry as get_metrics_registry, SIZE_BUCKETS, METRICS_FILE_ENV, start_http_server, start_textfile_writer
+)
+from data.synthetic.cohort_generator import generate_cohort
+
+# ========== SHARED DATA ==========
+# Datasets live once per process in the shared store; sessions keep only a (source, version) key
+SAMPLE_DATA_KEY = ('sample', 'seed42-n1000')
+
+def make_sample_data(n_patients=1000, seed=42):
+    """Create sample healthcare data: one row per admission from the synthetic cohort generator"""
+    admissions, _ = generate_cohort(n_patients, seed=seed, with_labs=False)
+    return admissions
+
+def get_data():
+    """The session's dataset: a shared, read-only frame from the process-wide store"""
+    store = get_store()
+    data = store.get(st.session_state.data_key)
+    
+    if data is None:
+        if st.session_state.data_key != SAMPLE_DATA_KEY:
+            st.warning("⚠️ The uploaded dataset is no longer in memory; showing sample data")
+        st.session_state.data_key = SAMPLE_DATA_KEY
+        data = store.get_or_load(SAMPLE_DATA_KEY, make_sample_data)
+    
+    return data
+
+def get_dataset(data_key):
+    """Shared frame for data_key; evicted sample data is regenerated, an evicted upload is an error"""
+    if data_key == SAMPLE_DATA_KEY:
+        return get_store().get_or_load(SAMPLE_DATA_KEY, make_sample_data)
+    data = get_store().get(data_key)
+    if data is None:
+        raise LookupError(f"Dataset {get_store().label(data_key)} is no longer in memory; upload it again")
+    return data
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def get_filter_index(data_key):
+    """Filter index for one dataset version, built once and shared by every session"""
+    return FilterIndex(get_dataset(data_key))
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def get_dashboard_cube(data_key):
+    """Pre-aggregated dashboard cube for one dataset version"""
+    return OlapCube(get_dataset(data_key))
+
+def warm_dataset_indexes(data_key):
+    """Build a new dataset's filter index and dashboard cube off the script thread"""
+    get_filter_index(data_key)
+    get_dashboard_cube(data_key)
+
+# ========== HELPER FUNCTIONS ==========
+def initialize_session_state():
+    """Initialize session state variables"""
+    if 'data_key' not in st.session_state:
+        # Point the session at the shared sample data (generated once per process)
+        st.session_state.data_key = SAMPLE_DATA_KEY
+        get_store().get_or_load(SAMPLE_DATA_KEY, make_sample_data)
+    
+    # Initialize filters
+    if 'filters' not in st.session_state:
+        st.session_state.filters = {
+            'gender': ['Male', 'Female', 'Other'],
+            'age_range': (18, 90),
+            'readmission_status': [0, 1]
+        }
+    
+    # Initialize analytics
+    if 'analytics' not in st.session_state:
+        st.session_state.analytics = {
+            'page_views': 0,
+            'predictions_made': 0,
+            'data_exports': 0,
+            'session_start': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+    
+    # Track page view
+    st.session_state.analytics['page_views'] += 1
+
+# ========== METRICS ==========
+# Process-wide, so counts survive sessions; see start_metrics_exporter for how ops scrape them
+RERUNS = get_metrics_registry().counter('app_reruns', "Full script reruns by page", ['page'])
+EXPORT_DOWNLOADS = get_metrics_registry().counter('export_downloads', "Export downloads by format", ['format'])
+EXPORT_BYTES = get_metrics_registry().histogram('export_bytes', "Size of built export payloads", ['format'],
+                                                buckets=SIZE_BUCKETS)
+
+def collect_app_metrics():
+    """Cache and memory figures, read only when metrics are scraped"""
+    caches = {
+        'analytics': get_analytics_cache().stats(),
+        'exports': get_export_cache().stats(),
+        'figures': get_figure_cache().stats()
+    }
+    datasets = get_store().memory_usage()
+    families = [
+        ('cache_hits', 'counter', "Cache lookups answered from cache",
+         [({'cache': name}, stats['hits']) for name, stats in caches.items()]),
+        ('cache_misses', 'counter', "Cache lookups that had to compute",
+         [({'cache': name}, stats['misses']) for name, stats in caches.items()]),
+        ('cache_entries', 'gauge', "Entries held per cache",
+         [({'cache': name}, stats['entries']) for name, stats in caches.items()]),
+        ('datasets_loaded', 'gauge', "Datasets in the shared store", [({}, len(datasets))]),
+        ('dataset_memory_bytes', 'gauge', "Memory held per shared dataset",
+         [({'dataset': get_store().label(key)}, size) for key, size in datasets.items()])
+    ]
+    process_mb = process_memory_mb()
+    if process_mb is not None:
+        families.append(('process_resident_memory_bytes', 'gauge', "Resident memory of the app process",
+                         [({}, int(process_mb * 1024 ** 2))]))
+    return families
+
+@st.cache_resource
+def start_metrics_exporter():
+    """Expose metrics once per server process
+
+    HEALTHCARE_METRICS_PORT serves them at http://127.0.0.1:<port>/metrics;
+    HEALTHCARE_METRICS_FILE rewrites that file every 15 seconds (e.g. for
+    node_exporter's textfile collector). With neither set nothing is exposed.
+    """
+    get_metrics_registry().add_collector(collect_app_metrics)
+    exposed = {}
+    
+    port = os.environ.get('HEALTHCARE_METRICS_PORT')
+    if port:
+        try:
+            start_http_server(int(port))
+            exposed['endpoint'] = f"http://127.0.0.1:{port}/metrics"
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Metrics endpoint not started on port {port}: {e}")
+    
+    path = os.environ.get(METRICS_FILE_ENV)
+    if path:
+        start_textfile_writer(path)
+        exposed['file'] = path
+    
+    return exposed
+
+# ========== RENDER TIMINGS ==========
+def record_render_time(name, elapsed_ms, partial=False):
+    """Keep the recent render times of one app section in session state and the process-wide buffer"""
+    get_timings().record(name, elapsed_ms)
+    timings = st.session_state.setdefault('render_timings', {})
+    entry = timings.setdefault(name, {'times': deque(maxlen=50), 'runs': 0, 'partial_runs': 0})
+    entry['times'].append(elapsed_ms)
+    entry['runs'] += 1
+    entry['partial_runs'] += int(partial)
+
+def timed_fragment(name):
+    """st.fragment that records how long each render takes, noting fragment-only reruns"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            # A fragment-only rerun skips main(), so it sees the same script run id again
+            run_id = st.session_state.get('script_run_id', 0)
+            last_runs = st.session_state.setdefault('fragment_run_ids', {})
+            partial = last_runs.get(name) == run_id
+            last_runs[name] = run_id
+            
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record_render_time(name, (time.perf_counter() - started) * 1000, partial)
+        return st.fragment(timed)
+    return decorator
+
+def timed_page(name):
+    """Record how long each render of a page function takes"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def timed_render(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record_render_time(name, (time.perf_counter() - started) * 1000)
+        return timed_render
+    return decorator
+
+def timed_export(frame, fmt, file):
+    """Write an export payload to file, recording its build time and size"""
+    with timed(f"Export: build {fmt}"):
+        size = write_export(frame, fmt, file)
+    EXPORT_BYTES.observe(size, format=fmt)
+    return size
+
+def serve_export(cache_key, frame, fmt):
+    """Open export file for one download click, built once per dataset, filters and format"""
+    EXPORT_DOWNLOADS.inc(format=fmt)
+    return get_export_cache().open_or_build(cache_key, lambda file: timed_export(frame, fmt, file))
+
+def export_button(label, frame, fmt, file_stem, filter_key):
+    """Download button whose payload is generated on click and cached per dataset, filters and format"""
+    mime, extension = EXPORT_FORMATS[fmt]
+    cache_key = (st.session_state.data_key, filter_key, fmt)
+    
+    st.download_button(
+        label=label,
+        data=lambda: serve_export(cache_key, frame, fmt),
+        file_name=f"{file_stem}.{extension}",
+        mime=mime,
+        on_click="ignore",
+        use_container_width=True
+    )
+
+def show_paginated_table(data, index, positions, key, reset_on=None, columns=None, page_size=50, height='auto'):
+    """Table that sends only the visible page; sorting uses the filter index's precomputed ranks"""
+    columns = list(columns or data.columns)
+    page_key = f"{key}_page"
+    
+    control_cols = st.columns([3, 1])
+    with control_cols[0]:
+        sort_by = st.selectbox("Sort by", ["(row order)"] + columns, key=f"{key}_sort_by")
+    with control_cols[1]:
+        descending = st.toggle("Descending", key=f"{key}_descending")
+    
+    # Back to the first page whenever the rows or their order change
+    state = (reset_on, sort_by, descending)
+    if st.session_state.get(f"{key}_state") != state:
+        st.session_state[f"{key}_state"] = state
+        st.session_state[page_key] = 0
+    
+    n_pages = max(1, -(-len(positions) // page_size))
+    page = min(st.session_state[page_key], n_pages - 1)
+    
+    page_positions = index.page(
+        positions,
+        sort_by=None if sort_by == "(row order)" else sort_by,
+        ascending=not descending,
+        page=page,
+        page_size=page_size
+    )
+    
+    st.dataframe(
+        data.take(page_positions)[columns],
+        use_container_width=True,
+        hide_index=True,
+        height=height
+    )
+    
+    def move(step):
+        st.session_state[page_key] = min(max(page + step, 0), n_pages - 1)
+    
+    nav_cols = st.columns([1, 3, 1])
+    with nav_cols[0]:
+        st.button("◀ Prev", key=f"{key}_prev", on_click=move, args=(-1,), disabled=page == 0, use_container_width=True)
+    with nav_cols[1]:
+        first_row = page * page_size + 1 if len(positions) else 0
+        st.caption(f"Rows {first_row:,}–{page * page_size + len(page_positions):,} of {len(positions):,} · page {page + 1:,} of {n_pages:,}")
+    with nav_cols[2]:
+        st.button("Next ▶", key=f"{key}_next", on_click=move, args=(1,), disabled=page >= n_pages - 1, use_container_width=True)
+
+def create_metric_card(title, value, subtitle, icon="📊"):
+    """Create a responsive metric card"""
+    card_html = f"""
+    <div class="metric-card">
+        <div style="font-size: 2rem; margin-bottom: 10px;">{icon}</div>
+        <h3>{title}</h3>
+        <h1>{value}</h1>
+        <p>{subtitle}</p>
+    </div>
+    """
+    return card_html
@@ -0,0 +1,197 @@
+# data_ingest.py
+import hashlib
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+# Every column a page reads; uploads without them are rejected before any rows are kept
+REQUIRED_COLUMNS = [
+    # Filters, dashboard KPIs, charts and tables
+    'patient_id', 'age', 'gender', 'length_of_stay', 'readmission_30d',
+    'blood_pressure_sys', 'blood_pressure_dia', 'bmi',
+    # Explorer box plots
+    'cholesterol', 'diabetes',
+    # Prediction risk table (the heuristic's FEATURE_COLUMNS)
+    'hypertension', 'previous_admissions'
+]
+# One column of each group is enough: admission_month is derived from admission_date
+REQUIRED_ONE_OF = [('admission_date', 'admission_month')]
+
+NUMERIC_COLUMNS = [
+    'patient_id', 'age', 'length_of_stay', 'blood_pressure_sys', 'blood_pressure_dia',
+    'cholesterol', 'bmi', 'diabetes', 'hypertension', 'previous_admissions',
+    'lab_result', 'readmission_30d', 'admission_month', 'admission_day'
+]
+DATETIME_COLUMNS = ['admission_date', 'discharge_date']
+CATEGORY_COLUMNS = ['gender']
+BINARY_COLUMNS = ['readmission_30d', 'diabetes', 'hypertension']
+
+UPLOAD_FORMATS = ['csv', 'parquet', 'arrow', 'feather']
+INGEST_CHUNK_ROWS = 100_000
+
+
+class UploadValidationError(ValueError):
+    """The upload does not have the columns the app needs"""
+
+
+def _file_size(file):
+    position = file.tell()
+    file.seek(0, os.SEEK_END)
+    size = file.tell()
+    file.seek(position)
+    return size
+
+
+def content_digest(file, block_size=1024 ** 2):
+    """MD5 of a file's bytes, read in blocks and rewound, so identical uploads share one key"""
+    digest = hashlib.md5()
+    file.seek(0)
+    for block in iter(lambda: file.read(block_size), b''):
+        digest.update(block)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+def required_columns_text():
+    """Human-readable list of the columns an upload needs"""
+    alternatives = [' or '.join(group) for group in REQUIRED_ONE_OF]
+    return ', '.join(REQUIRED_COLUMNS + alternatives)
+
+
+def validate_columns(columns):
+    missing = [col for col in REQUIRED_COLUMNS if col not in columns]
+    missing += [' or '.join(group) for group in REQUIRED_ONE_OF if not any(col in columns for col in group)]
+    if missing:
+        raise UploadValidationError(f"Missing required columns: {missing}")
+
+
+def coerce_chunk(chunk, invalid_counts):
+    """Coerce known columns to their dtypes; unparseable values become NaN and are counted"""
+    for col in chunk.columns:
+        if col in NUMERIC_COLUMNS:
+            values = pd.to_numeric(chunk[col], errors='coerce')
+        elif col in DATETIME_COLUMNS:
+            values = pd.to_datetime(chunk[col], errors='coerce')
+        elif col in CATEGORY_COLUMNS:
+            # Categories are set once over the whole upload; chunks keep plain strings
+            values = chunk[col].where(chunk[col].isna(), chunk[col].astype(str))
+        else:
+            continue
+
+        if col in BINARY_COLUMNS:
+            values = values.where(values.isin([0, 1]))
+
+        invalid = int((values.isna() & chunk[col].notna()).sum())
+        if invalid:
+            invalid_counts[col] = invalid_counts.get(col, 0) + invalid
+        chunk[col] = values
+    return chunk
+
+
+def _csv_chunks(file, chunk_rows):
+    for chunk in pd.read_csv(file, chunksize=chunk_rows):
+        yield chunk, file.tell()
+
+
+def _parquet_chunks(file, chunk_rows):
+    import pyarrow.parquet as pq
+
+    total_bytes = _file_size(file)
+    parquet_file = pq.ParquetFile(file)
+    total_rows = max(parquet_file.metadata.num_rows, 1)
+    rows_read = 0
+    for batch in parquet_file.iter_batches(batch_size=chunk_rows):
+        rows_read += batch.num_rows
+        # Column chunks are not read front to back, so bytes are estimated from the rows read
+        yield batch.to_pandas(), int(total_bytes * rows_read / total_rows)
+
+
+def _arrow_chunks(file, chunk_rows):
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    try:
+        reader = ipc.open_file(file)
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+    except pa.ArrowInvalid:
+        file.seek(0)
+        batches = iter(ipc.open_stream(file))
+    for batch in batches:
+        for start in range(0, batch.num_rows, chunk_rows):
+            yield batch.slice(start, chunk_rows).to_pandas(), file.tell()
+
+
+def upload_format(file_name):
+    extension = os.path.splitext(file_name)[1].lower().lstrip('.')
+    if extension == 'pq':
+        return 'parquet'
+    if extension == 'ipc':
+        return 'arrow'
+    return extension
+
+
+def ingest_upload(file, file_name, progress=None, chunk_rows=INGEST_CHUNK_ROWS):
+    """Read an uploaded CSV, Parquet or Arrow file chunk by chunk into one typed DataFrame
+
+    Every chunk is validated and coerced as it arrives, and progress(fraction,
+    rows) is called with the share of the file's bytes read so far. Returns
+    the frame and a report with row count, invalid values per column and time.
+    """
+    fmt = upload_format(file_name)
+    readers = {'csv': _csv_chunks, 'parquet': _parquet_chunks, 'arrow': _arrow_chunks, 'feather': _arrow_chunks}
+    if fmt not in readers:
+        raise UploadValidationError(f"Unsupported file type '.{fmt}'; expected one of {UPLOAD_FORMATS}")
+
+    started = time.perf_counter()
+    total_bytes = max(_file_size(file), 1)
+    file.seek(0)
+
+    chunks = []
+    invalid_counts = {}
+    rows = 0
+    for chunk, bytes_read in readers[fmt](file, chunk_rows):
+        if not chunks:
+            validate_columns(chunk.columns)
+        chunks.append(coerce_chunk(chunk, invalid_counts))
+        rows += len(chunk)
+        if progress is not None:
+            progress(min(bytes_read / total_bytes, 1.0), rows)
+
+    if not chunks:
+        raise UploadValidationError("The uploaded file has no rows")
+
+    df = pd.concat(chunks, ignore_index=True)
+
+    # Ages are completed years, so the dashboard cube's single-year cells and the
+    # explorer's filter index select the same admissions at the age slider's edges
+    df['age'] = np.floor(df['age'])
+
+    # Whole-column dtypes are settled once: integral numbers back to int64, strings to categories
+    for col in NUMERIC_COLUMNS:
+        if col in df.columns and df[col].dtype.kind == 'f' and df[col].notna().all():
+            values = df[col].to_numpy()
+            if np.array_equal(values, np.floor(values)):
+                df[col] = values.astype(np.int64)
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+
+    # Columns the app derives from admission_date when an export leaves them out
+    if 'admission_date' in df.columns:
+        if 'admission_month' not in df.columns:
+            df['admission_month'] = df['admission_date'].dt.month
+        if 'admission_day' not in df.columns:
+            df['admission_day'] = df['admission_date'].dt.day
+
+    if progress is not None:
+        progress(1.0, len(df))
+
+    return df, {
+        'rows': len(df),
+        'columns': len(df.columns),
+        'invalid_values': invalid_counts,
+        'seconds': time.perf_counter() - started,
+        'memory_mb': df.memory_usage(deep=True).sum() / 1024 ** 2
+    }
@@ -0,0 +1,89 @@
+# data_store.py
+import threading
+from collections import OrderedDict
+
+
+class DatasetStore:
+    """Process-wide datasets shared read-only by every Streamlit session
+
+    Datasets are keyed by (source, version). Sessions keep only that key plus
+    their filters, so server memory grows with distinct datasets, not users.
+    Callers must treat returned frames as read-only and derive new frames
+    (filtering, assign, copy) instead of mutating them.
+    """
+
+    def __init__(self, max_datasets=4):
+        self.max_datasets = max_datasets
+        self._datasets = OrderedDict()   # (source, version) -> DataFrame
+        self._lock = threading.RLock()
+        self._loading = {}               # key -> Event, so concurrent sessions load once
+        self._labels = {}                # key -> display name
+        self._memory = {}                # key -> bytes, measured once on put
+
+    def get(self, key):
+        """Dataset for key, or None if it is not loaded"""
+        with self._lock:
+            df = self._datasets.get(key)
+            if df is not None:
+                self._datasets.move_to_end(key)
+            return df
+
+    def get_or_load(self, key, loader):
+        """Dataset for key, calling loader() once per process on a miss"""
+        while True:
+            with self._lock:
+                if key in self._datasets:
+                    self._datasets.move_to_end(key)
+                    return self._datasets[key]
+                event = self._loading.get(key)
+                if event is None:
+                    event = self._loading[key] = threading.Event()
+                    break
+            # Another session is loading the same dataset; wait for it
+            event.wait()
+
+        try:
+            df = loader()
+            self.put(key, df)
+            return df
+        finally:
+            with self._lock:
+                self._loading.pop(key).set()
+
+    def put(self, key, df, label=None):
+        """Register a dataset under key, evicting the least recently used beyond max_datasets"""
+        # Deep memory walks every string, so it is measured here rather than on each metrics scrape
+        memory = int(df.memory_usage(deep=True).sum())
+        with self._lock:
+            self._datasets[key] = df
+            self._memory[key] = memory
+            self._datasets.move_to_end(key)
+            if label is not None:
+                self._labels[key] = label
+            while len(self._datasets) > self.max_datasets:
+                evicted, _ = self._datasets.popitem(last=False)
+                self._labels.pop(evicted, None)
+                self._memory.pop(evicted, None)
+        return key
+
+    def label(self, key):
+        """Display name for a dataset key"""
+        with self._lock:
+            return self._labels.get(key, ' '.join(str(part) for part in key))
+
+    def keys(self):
+        with self._lock:
+            return list(self._datasets)
+
+    def memory_usage(self):
+        """Bytes held per dataset key, as measured when each was put"""
+        with self._lock:
+            return {key: self._memory[key] for key in self._datasets}
+
+
+_store = DatasetStore()
+
+
+def get_store():
+    """The process-wide dataset store"""
+    return _store
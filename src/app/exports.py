@@ -0,0 +1,146 @@
+# exports.py
+import atexit
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+# format -> (mime type, file extension)
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'json': ('application/json', 'json'),
+    'xlsx': ('application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'xlsx'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet')
+}
+
+EXPORT_CHUNK_ROWS = 100_000
+
+
+def _chunks(df, chunk_rows):
+    for start in range(0, max(len(df), 1), chunk_rows):
+        yield start, df.iloc[start:start + chunk_rows]
+
+
+def write_export(df, fmt, file, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Serialise df into a binary file chunk by chunk; returns the bytes written
+
+    Each slice is encoded and written as it is produced, so only one chunk's
+    text is in memory at a time, never the whole payload.
+    """
+    start_position = file.tell()
+
+    if fmt == 'csv':
+        for start, chunk in _chunks(df, chunk_rows):
+            chunk.to_csv(file, index=False, header=start == 0)
+
+    elif fmt == 'json':
+        file.write(b'[')
+        first = True
+        for start, chunk in _chunks(df, chunk_rows):
+            records = chunk.to_json(orient='records')[1:-1]
+            if records:
+                if not first:
+                    file.write(b',')
+                file.write(records.encode('utf-8'))
+                first = False
+        file.write(b']')
+
+    elif fmt == 'xlsx':
+        with pd.ExcelWriter(file, engine='xlsxwriter') as writer:
+            for start, chunk in _chunks(df, chunk_rows):
+                chunk.to_excel(writer, index=False, sheet_name='Data',
+                               header=start == 0, startrow=start + 1 if start else 0)
+
+    elif fmt == 'parquet':
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        writer = None
+        for start, chunk in _chunks(df, chunk_rows):
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(file, table.schema)
+            writer.write_table(table.cast(writer.schema))
+        writer.close()
+
+    else:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+    return file.tell() - start_position
+
+
+class ExportCache:
+    """Generated export files keyed by (dataset version, filter state, format)
+
+    Payloads are written to files in a private temporary directory and shared
+    across sessions, bounded by total bytes on disk, least recently used
+    first. A hit hands out an open file; Streamlit's download button still
+    reads it into its in-memory media store for the one download it serves.
+    """
+
+    def __init__(self, max_bytes=1024 * 1024 * 1024, directory=None):
+        self.max_bytes = max_bytes
+        self._directory = directory
+        self._files = OrderedDict()   # key -> (path, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _temp_path(self):
+        with self._lock:
+            if self._directory is None:
+                self._directory = tempfile.mkdtemp(prefix='healthcare_exports_')
+                atexit.register(shutil.rmtree, self._directory, True)
+            directory = self._directory
+        os.makedirs(directory, exist_ok=True)
+        fd, path = tempfile.mkstemp(dir=directory)
+        os.close(fd)
+        return path
+
+    def open_or_build(self, key, build):
+        """An open binary file with the payload for key; build(file) writes it on a miss"""
+        with self._lock:
+            if key in self._files:
+                self.hits += 1
+                self._files.move_to_end(key)
+                # Opened under the lock so eviction cannot delete it first
+                return open(self._files[key][0], 'rb')
+            self.misses += 1
+
+        path = self._temp_path()
+        try:
+            with open(path, 'wb') as file:
+                size = build(file)
+        except Exception:
+            os.unlink(path)
+            raise
+
+        with self._lock:
+            served = open(path, 'rb')
+            if key in self._files or size > self.max_bytes:
+                # Another session cached it first, or it is too large to keep; the open handle still serves it
+                os.unlink(path)
+            else:
+                self._files[key] = (path, size)
+                self._bytes += size
+                while self._bytes > self.max_bytes:
+                    _, (evicted, evicted_size) = self._files.popitem(last=False)
+                    os.unlink(evicted)
+                    self._bytes -= evicted_size
+        return served
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._files), 'bytes': self._bytes}
+
+
+_export_cache = ExportCache()
+
+
+def get_export_cache():
+    """The process-wide export cache"""
+    return _export_cache
@@ -0,0 +1,78 @@
+# figure_cache.py
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+
+def frame_digest(frame):
+    """Stable hash of a (small, aggregated) frame's columns, dtypes, index and values"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr([(str(column), str(dtype)) for column, dtype in frame.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(frame, index=True).values.tobytes())
+    return digest.hexdigest()
+
+
+class FigureCache:
+    """Serialised Plotly figures keyed by (chart, layout, input), shared across sessions
+
+    Building a figure (plotly express validates every property) costs tens of
+    milliseconds; the JSON it serialises to is a few KB and immutable, so one
+    copy serves every session whose filters give the same aggregate. The
+    saving is figure construction only: a hit rehydrates the JSON without
+    re-validating it, and st.plotly_chart, which takes figures rather than
+    specs, still serialises it again (about a millisecond each for the
+    dashboard's charts). Bounded by total bytes, least recently used first.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._specs = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, key, build):
+        """A figure for key, from the cached JSON or from build() on a miss"""
+        # Imported here so the metrics collector can read stats() without loading plotly
+        import plotly.graph_objects as go
+        import plotly.io as pio
+        
+        with self._lock:
+            spec = self._specs.get(key)
+            if spec is not None:
+                self.hits += 1
+                self._specs.move_to_end(key)
+            else:
+                self.misses += 1
+
+        if spec is not None:
+            # The JSON came from a validated figure, so validating it again is wasted work
+            return go.Figure(json.loads(spec), _validate=False)
+
+        fig = build()
+        spec = pio.to_json(fig, validate=False)
+
+        with self._lock:
+            if key not in self._specs and len(spec) <= self.max_bytes:
+                self._specs[key] = spec
+                self._bytes += len(spec)
+                while self._bytes > self.max_bytes:
+                    _, evicted = self._specs.popitem(last=False)
+                    self._bytes -= len(evicted)
+        return fig
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._specs), 'bytes': self._bytes}
+
+
+_figure_cache = FigureCache()
+
+
+def get_figure_cache():
+    """The process-wide figure cache"""
+    return _figure_cache
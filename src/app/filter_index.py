@@ -0,0 +1,151 @@
+# filter_index.py
+import threading
+
+import numpy as np
+import pandas as pd
+
+CATEGORY_COLUMNS = ('gender', 'readmission_30d')
+RANGE_COLUMNS = ('age', 'length_of_stay', 'bmi')
+
+
+class FilterIndex:
+    """Precomputed filter structures for one dataset version
+
+    Category columns get one packed bitmap per value; range columns get their
+    values in sorted order plus the matching row positions. A filter resolves
+    by binary-searching the most selective range to a slice of candidate rows,
+    then checking those candidates against the category bitmaps and the other
+    ranges, so the cost follows the size of the result rather than the frame.
+
+    Sort ranks for table paging are computed per column on first use and kept
+    for the life of the index.
+    """
+
+    def __init__(self, df, category_columns=CATEGORY_COLUMNS, range_columns=RANGE_COLUMNS):
+        self.n_rows = len(df)
+        self._df = df
+        self._ranks = {}      # col -> (rank of each row in a stable sort, non-null count)
+        self._ranks_lock = threading.Lock()
+
+        # value -> packed bitmap (1 bit per row), in order of first appearance
+        self.bitmaps = {}
+        for col in category_columns:
+            if col not in df.columns:
+                continue
+            codes, uniques = pd.factorize(df[col])
+            self.bitmaps[col] = {value: np.packbits(codes == i) for i, value in enumerate(uniques)}
+
+        # col -> (sorted values, row positions in that order); NaN sorts last and never matches
+        self.columns = {}
+        self.sorted = {}
+        self.bounds = {}
+        for col in range_columns:
+            if col not in df.columns:
+                continue
+            values = df[col].to_numpy(dtype=np.float64)
+            order = np.argsort(values, kind='stable')
+            self.columns[col] = values
+            self.sorted[col] = (values[order], order)
+            self.bounds[col] = (np.nanmin(values), np.nanmax(values)) if self.n_rows else (0.0, 0.0)
+
+    def categories(self, col):
+        """Distinct values of a category column"""
+        return list(self.bitmaps[col])
+
+    def _category_bits(self, col, allowed):
+        bits = np.zeros((self.n_rows + 7) // 8, dtype=np.uint8)
+        for value in allowed:
+            if value in self.bitmaps[col]:
+                bits |= self.bitmaps[col][value]
+        return bits
+
+    def positions(self, categories=None, ranges=None):
+        """Ascending row positions matching every filter
+
+        categories maps column -> allowed values; ranges maps column -> (low, high),
+        inclusive on both ends like Series.between.
+        """
+        categories = categories or {}
+        ranges = ranges or {}
+
+        slices = {}
+        for col, (low, high) in ranges.items():
+            sorted_values = self.sorted[col][0]
+            slices[col] = (np.searchsorted(sorted_values, low, side='left'),
+                           np.searchsorted(sorted_values, high, side='right'))
+
+        # Start from the narrowest range slice
+        if slices:
+            narrowest = min(slices, key=lambda col: slices[col][1] - slices[col][0])
+            start, stop = slices.pop(narrowest)
+            rows = self.sorted[narrowest][1][start:stop]
+            if len(rows) * 16 < self.n_rows:
+                candidates = np.sort(rows)
+            else:
+                # Wide slice: scattering into a mask beats sorting it
+                mask = np.zeros(self.n_rows, dtype=bool)
+                mask[rows] = True
+                candidates = np.flatnonzero(mask)
+        else:
+            candidates = None
+
+        bits = None
+        for col, allowed in categories.items():
+            col_bits = self._category_bits(col, allowed)
+            bits = col_bits if bits is None else bits & col_bits
+
+        if bits is not None:
+            if candidates is None:
+                candidates = np.flatnonzero(np.unpackbits(bits, count=self.n_rows))
+            else:
+                candidates = candidates[(bits[candidates >> 3] >> (7 - (candidates & 7))) & 1 == 1]
+
+        if candidates is None:
+            candidates = np.arange(self.n_rows)
+
+        for col in slices:
+            low, high = ranges[col]
+            values = self.columns[col][candidates]
+            candidates = candidates[(values >= low) & (values <= high)]
+
+        return candidates
+
+    # ---------- Table paging ----------
+    def sort_ranks(self, col):
+        """Each row's position in a stable ascending sort of col (nulls last)"""
+        with self._ranks_lock:
+            if col not in self._ranks:
+                codes, uniques = pd.factorize(self._df[col], sort=True)
+                codes = np.where(codes < 0, len(uniques), codes)
+                order = np.argsort(codes, kind='stable')
+                ranks = np.empty(self.n_rows, dtype=np.int64)
+                ranks[order] = np.arange(self.n_rows)
+                self._ranks[col] = (ranks, int((codes < len(uniques)).sum()))
+            return self._ranks[col]
+
+    def page(self, positions, sort_by=None, ascending=True, page=0, page_size=50):
+        """Row positions for one table page of the matching rows
+
+        Only the rows up to the end of the requested page are ordered
+        (argpartition on precomputed ranks), so the cost does not depend on
+        how many rows sort after the page.
+        """
+        start = page * page_size
+        stop = min(start + page_size, len(positions))
+        if start >= stop:
+            return positions[:0]
+        if sort_by is None:
+            return positions[start:stop]
+
+        ranks, n_valid = self.sort_ranks(sort_by)
+        keys = ranks[positions]
+        if not ascending:
+            # Reverse the non-null ranks; nulls stay last either way
+            keys = np.where(keys < n_valid, n_valid - 1 - keys, keys)
+
+        if stop < len(keys):
+            head = np.argpartition(keys, stop - 1)[:stop]
+        else:
+            head = np.arange(len(keys))
+        head = head[np.argsort(keys[head], kind='stable')]
+        return positions[head[start:stop]]
@@ -0,0 +1,130 @@
+# instrumentation.py
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+from src.monitoring.metrics import get_registry
+
+TIMING_CAPACITY = 10_000
+
+_render_seconds = get_registry().histogram(
+    'app_render_seconds', "Render time of app pages, fragments and timed steps", ['section'])
+
+
+class TimingBuffer:
+    """Process-wide ring buffer of (timestamp, name, milliseconds) timings
+
+    Every session writes into the same buffer, so its percentiles describe
+    the server as a whole; the oldest timings drop out once it is full.
+    """
+
+    def __init__(self, capacity=TIMING_CAPACITY):
+        self._timings = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def record(self, name, elapsed_ms):
+        with self._lock:
+            self._timings.append((time.time(), name, elapsed_ms))
+        _render_seconds.observe(elapsed_ms / 1000, section=name)
+
+    @contextmanager
+    def timed(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - started) * 1000)
+
+    def __len__(self):
+        return len(self._timings)
+
+    def summary(self, window_seconds=None):
+        """Count, p50/p95/p99 and max per name, over the last window_seconds if given"""
+        with self._lock:
+            timings = list(self._timings)
+        if window_seconds is not None:
+            cutoff = time.time() - window_seconds
+            timings = [t for t in timings if t[0] >= cutoff]
+
+        columns = ['Step', 'Count', 'p50 (ms)', 'p95 (ms)', 'p99 (ms)', 'Max (ms)']
+        if not timings:
+            return pd.DataFrame(columns=columns)
+
+        by_name = {}
+        for _, name, elapsed_ms in timings:
+            by_name.setdefault(name, []).append(elapsed_ms)
+
+        rows = []
+        for name in sorted(by_name):
+            values = np.array(by_name[name])
+            p50, p95, p99 = np.percentile(values, [50, 95, 99])
+            rows.append([name, len(values), round(p50, 1), round(p95, 1), round(p99, 1), round(values.max(), 1)])
+        return pd.DataFrame(rows, columns=columns)
+
+
+_timings = TimingBuffer()
+
+
+def get_timings():
+    """The process-wide timing buffer"""
+    return _timings
+
+
+def timed(name):
+    """Context manager recording how long its block takes into the process-wide buffer"""
+    return _timings.timed(name)
+
+
+def cache_hit_rates(stats):
+    """Table of hits, misses and hit rate from {cache name: {'hits': .., 'misses': ..}}"""
+    rows = []
+    for name, counts in stats.items():
+        lookups = counts['hits'] + counts['misses']
+        rows.append({
+            'Cache': name,
+            'Hits': counts['hits'],
+            'Misses': counts['misses'],
+            'Hit rate': f"{counts['hits'] / lookups:.0%}" if lookups else '-'
+        })
+    return pd.DataFrame(rows)
+
+
+def object_size(value, _seen=None):
+    """Approximate bytes held by a session state value"""
+    _seen = set() if _seen is None else _seen
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(object_size(k, _seen) + object_size(v, _seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset, deque)):
+        size += sum(object_size(item, _seen) for item in value)
+    return size
+
+
+def session_memory_mb(state):
+    """MB held by one session's state (shared datasets live in the store, not here)"""
+    return sum(object_size(value) for value in state.values()) / 1024 ** 2
+
+
+def process_memory_mb():
+    """Resident memory of the server process in MB, or None where /proc is unavailable"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2
+    except (OSError, ValueError, AttributeError):
+        return None
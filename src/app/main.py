@@ -0,0 +1,376 @@
+# main.py
+"""Page shell of the Streamlit app: page config, styling, sidebar and a lazy page router
+
+The entry scripts only call main(). Everything defined here and in the
+modules it imports is executed once per server process rather than on every
+rerun, and the shell is sent to the browser before the data layer (pandas)
+or any page module (plotly, the model) is imported. Page modules load on the
+first visit to their page.
+"""
+import importlib
+import time
+
+import streamlit as st
+
+# ========== PAGE CONFIG ==========
+PAGE_CONFIG = dict(
+    page_title="Healthcare Analytics Platform",
+    page_icon="🏥",
+    layout="wide",
+    initial_sidebar_state="expanded",
+    menu_items={
+        'Get Help': 'https://docs.example.com',
+        'Report a bug': 'https://github.com/yourusername/healthcare-analytics/issues',
+        'About': '## 🏥 Healthcare Readmission Prediction Platform'
+    }
+)
+
+# Sidebar page name -> (module, render function); "Predict" and "Explore" also match the desktop names
+PAGES = {
+    'Dashboard': ('src.app.views.dashboard', 'show_dashboard'),
+    'Predict': ('src.app.views.predictions', 'show_predictions'),
+    'Explore': ('src.app.views.explorer', 'show_data_explorer'),
+    'Settings': ('src.app.views.settings', 'show_settings')
+}
+
+# ========== MOBILE DETECTION & OPTIMIZATION ==========
+def get_user_agent():
+    """Try to get user agent from Streamlit context"""
+    try:
+        # Updated for Streamlit 1.29+
+        return st.query_params.get('user_agent', [''])[0]
+    except:
+        return ""
+
+def is_mobile_device():
+    """Check if user is on mobile device (basic detection)"""
+    user_agent = get_user_agent().lower()
+    mobile_keywords = ['mobile', 'android', 'iphone', 'ipad', 'windows phone']
+    
+    # Also check via JavaScript injection
+    return st.session_state.get('is_mobile', False)
+
+# ========== MOBILE-OPTIMIZED CSS ==========
+MOBILE_CSS = """
+<style>
+    /* Base responsive styles */
+    @media (max-width: 768px) {
+        /* Adjust container padding */
+        .main .block-container {
+            padding-top: 2rem;
+            padding-right: 1rem;
+            padding-left: 1rem;
+            padding-bottom: 2rem;
+        }
+        
+        /* Adjust titles */
+        h1 {
+            font-size: 1.8rem !important;
+        }
+        
+        h2 {
+            font-size: 1.5rem !important;
+        }
+        
+        h3 {
+            font-size: 1.2rem !important;
+        }
+        
+        /* Adjust columns for mobile */
+        [data-testid="column"] {
+            padding: 5px !important;
+        }
+        
+        /* Make buttons full width on mobile */
+        .stButton > button {
+            width: 100% !important;
+            margin: 5px 0 !important;
+        }
+        
+        /* Adjust form inputs */
+        .stTextInput > div > div > input,
+        .stNumberInput > div > div > input,
+        .stSelectbox > div > div > select {
+            font-size: 16px !important; /* Prevents iOS zoom */
+        }
+        
+        /* Adjust dataframes */
+        .stDataFrame {
+            font-size: 12px !important;
+        }
+        
+        /* Adjust charts */
+        .js-plotly-plot {
+            max-width: 100% !important;
+        }
+        
+        /* Adjust sidebar */
+        [data-testid="stSidebar"] {
+            min-width: 200px !important;
+            max-width: 250px !important;
+        }
+        
+        /* Adjust metric cards */
+        .metric-card {
+            margin: 10px 0 !important;
+            padding: 15px !important;
+        }
+        
+        /* Adjust tabs */
+        .stTabs [data-baseweb="tab-list"] {
+            flex-wrap: wrap !important;
+        }
+        
+        .stTabs [data-baseweb="tab"] {
+            padding: 10px 15px !important;
+            font-size: 14px !important;
+        }
+        
+        /* Adjust form spacing */
+        .stForm {
+            margin-bottom: 20px !important;
+        }
+    }
+    
+    /* Tablet styles */
+    @media (max-width: 1024px) and (min-width: 769px) {
+        .main .block-container {
+            padding: 2rem;
+        }
+        
+        [data-testid="column"] {
+            padding: 10px !important;
+        }
+    }
+    
+    /* Metric card styling */
+    .metric-card {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        padding: 20px;
+        border-radius: 15px;
+        text-align: center;
+        margin: 10px 0;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+        transition: transform 0.3s ease;
+    }
+    
+    .metric-card:hover {
+        transform: translateY(-5px);
+    }
+    
+    .metric-card h3 {
+        font-size: 1rem;
+        margin-bottom: 10px;
+        font-weight: 500;
+    }
+    
+    .metric-card h1 {
+        font-size: 2.5rem;
+        margin: 10px 0;
+        font-weight: 700;
+    }
+    
+    .metric-card p {
+        font-size: 0.9rem;
+        opacity: 0.9;
+    }
+    
+    /* Mobile-specific classes */
+    .mobile-hidden {
+        display: none;
+    }
+    
+    @media (min-width: 769px) {
+        .mobile-hidden {
+            display: block;
+        }
+    }
+    
+    /* Touch-friendly buttons */
+    .touch-button {
+        min-height: 44px !important;
+        min-width: 44px !important;
+    }
+    
+    /* Better form spacing for mobile */
+    .stForm {
+        margin-bottom: 20px;
+    }
+    
+    /* Scrollable containers for mobile */
+    .scrollable-container {
+        max-height: 400px;
+        overflow-y: auto;
+        -webkit-overflow-scrolling: touch;
+        padding: 10px;
+        border: 1px solid #e0e0e0;
+        border-radius: 5px;
+        margin: 10px 0;
+    }
+    
+    /* Streamlit specific fixes */
+    .st-emotion-cache-1y4p8pa {
+        padding: 1rem !important;
+    }
+    
+    /* Fix for Streamlit buttons */
+    button[kind="primary"] {
+        background-color: #1E3A8A !important;
+    }
+    
+    /* Fix for Streamlit selectboxes on mobile */
+    .stSelectbox > div > div {
+        min-height: 44px !important;
+    }
+</style>
+"""
+
+# ========== SIDEBAR NAVIGATION ==========
+def render_navigation():
+    """Sidebar title and page picker; needs no data, so it is on screen before anything heavy loads"""
+    with st.sidebar:
+        # App logo/title
+        st.markdown("""
+        <div style="text-align: center; margin-bottom: 20px;">
+            <h1 style="font-size: 1.5rem; color: #1E3A8A;">🏥 Healthcare Analytics</h1>
+            <p style="color: #666; font-size: 0.9rem;">Predict • Analyze • Optimize</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Navigation
+        st.markdown("### 📋 Navigation")
+        
+        # Mobile-friendly navigation
+        if st.session_state.is_mobile:
+            page_options = ["📊 Dashboard", "🤖 Predict", "🔍 Explore", "⚙️ Settings"]
+            selected_page = st.radio(
+                "Select Page",
+                page_options,
+                label_visibility="collapsed"
+            )
+        else:
+            # Desktop navigation
+            selected_page = st.radio(
+                "Select Page",
+                ["📊 Dashboard", "🤖 Predictions", "🔍 Data Explorer", "⚙️ Settings"],
+                label_visibility="collapsed"
+            )
+    
+    return selected_page
+
+def render_sidebar_tools(data):
+    """Quick filters, actions and footer below the navigation"""
+    with st.sidebar:
+        st.markdown("---")
+        
+        # Quick filters (collapsed on mobile)
+        if not st.session_state.is_mobile or st.checkbox("Show Filters", value=False):
+            st.markdown("### 🔍 Quick Filters")
+            
+            gender_options = st.multiselect(
+                "Gender",
+                options=data['gender'].unique(),
+                default=st.session_state.filters['gender']
+            )
+            
+            age_range = st.slider(
+                "Age Range",
+                min_value=18,
+                max_value=90,
+                value=st.session_state.filters['age_range']
+            )
+            
+            readmission_status = st.multiselect(
+                "Readmission Status",
+                options=[0, 1],
+                default=st.session_state.filters['readmission_status'],
+                format_func=lambda x: "Readmitted" if x == 1 else "Not Readmitted"
+            )
+            
+            # Update filters
+            st.session_state.filters.update({
+                'gender': gender_options,
+                'age_range': age_range,
+                'readmission_status': readmission_status
+            })
+        
+        st.markdown("---")
+        
+        # Quick actions
+        st.markdown("### ⚡ Quick Actions")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            if st.button("🔄 Refresh", use_container_width=True):
+                st.rerun()
+        
+        with col2:
+            if st.button("📊 Stats", use_container_width=True):
+                st.session_state.show_stats = True
+        
+        # Mobile info
+        if st.session_state.is_mobile:
+            st.markdown("---")
+            st.info("📱 Mobile mode active")
+        
+        # Footer
+        st.markdown("---")
+        st.markdown("""
+        <div style="text-align: center; color: #666; font-size: 0.8rem; padding: 10px;">
+            <p>Healthcare Analytics v1.3</p>
+            <p>© 2024 All rights reserved</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+# ========== PAGE ROUTING ==========
+def load_page(selected_page):
+    """Render function of the selected page, importing its module on the first visit"""
+    for name, (module, function) in PAGES.items():
+        if name in selected_page:
+            return getattr(importlib.import_module(module), function)
+    return None
+
+# ========== MAIN APP FUNCTION ==========
+def main():
+    """Main application function"""
+    run_started = time.perf_counter()
+    st.set_page_config(**PAGE_CONFIG)
+    
+    # Store mobile detection in session state
+    if 'is_mobile' not in st.session_state:
+        st.session_state.is_mobile = is_mobile_device()
+    
+    # Detect mobile from query params - UPDATED FOR STREAMLIT 1.29+
+    query_params = st.query_params
+    if 'mobile' in query_params:
+        st.session_state.is_mobile = query_params['mobile'][0].lower() == 'true'
+    
+    st.markdown(MOBILE_CSS, unsafe_allow_html=True)
+    st.session_state.script_run_id = st.session_state.get('script_run_id', 0) + 1
+    
+    # Get selected page from sidebar
+    selected_page = render_navigation()
+    
+    # Shared data layer; imported here so the shell above reaches the browser first
+    from src.app.common import get_data, initialize_session_state, start_metrics_exporter, record_render_time, RERUNS
+    
+    # Initialize session state
+    initialize_session_state()
+    start_metrics_exporter()
+    
+    render_sidebar_tools(get_data())
+    RERUNS.inc(page=selected_page.split(' ', 1)[-1])
+    
+    # Route to selected page
+    show_page = load_page(selected_page)
+    if show_page is not None:
+        show_page()
+    
+    # Add mobile optimization note at bottom
+    if st.session_state.is_mobile:
+        st.markdown("---")
+        st.caption("📱 Optimized for mobile viewing • Rotate device for better experience")
+    
+    record_render_time("Full script run", (time.perf_counter() - run_started) * 1000)
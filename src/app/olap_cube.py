@@ -0,0 +1,140 @@
+# olap_cube.py
+import numpy as np
+import pandas as pd
+
+DIMENSIONS = ['gender', 'age', 'readmission_30d', 'admission_month']
+
+AGE_BANDS = [0, 30, 50, 65, 80, 100]
+AGE_BAND_LABELS = ['0-30', '31-50', '51-65', '66-80', '81+']
+
+# Distinct patients: one HyperLogLog sketch of 2**HLL_PRECISION one-byte registers per
+# (gender, age, readmission) group, the dimensions the dashboard slices on (~1.6% error)
+SKETCH_DIMENSIONS = ['gender', 'age', 'readmission_30d']
+HLL_PRECISION = 12
+_POWERS_OF_TWO = np.left_shift(np.uint64(1), np.arange(64, dtype=np.uint64))
+
+
+def _ratio(total, count):
+    return total / count if count else float('nan')
+
+
+def _hll_registers(values, groups, n_groups, precision=HLL_PRECISION):
+    """(n_groups, 2**precision) HyperLogLog registers of values, one sketch per group"""
+    n_registers = 1 << precision
+    hashes = pd.util.hash_array(np.asarray(values))
+    bucket = (hashes >> np.uint64(64 - precision)).astype(np.int64)
+    rest = hashes & np.uint64((1 << (64 - precision)) - 1)
+    # Rank = position of the first set bit of the remaining 64 - precision bits
+    rank = (64 - precision + 1 - np.searchsorted(_POWERS_OF_TWO, rest, side='right')).astype(np.uint8)
+
+    registers = np.zeros(n_groups * n_registers, dtype=np.uint8)
+    np.maximum.at(registers, np.asarray(groups, dtype=np.int64) * n_registers + bucket, rank)
+    return registers.reshape(n_groups, n_registers)
+
+
+def _hll_estimate(registers):
+    """Cardinality estimate of one (merged) sketch, with linear counting for small counts"""
+    n_registers = len(registers)
+    alpha = 0.7213 / (1 + 1.079 / n_registers)
+    estimate = alpha * n_registers ** 2 / np.exp2(-registers.astype(np.float64)).sum()
+    zeros = int(np.count_nonzero(registers == 0))
+    if estimate <= 2.5 * n_registers and zeros:
+        estimate = n_registers * np.log(n_registers / zeros)
+    return int(round(estimate))
+
+
+class OlapCube:
+    """Counts and sums pre-aggregated over gender × age × readmission × admission_month
+
+    Rows are admissions. Age is kept at single-year resolution; ages are
+    whole years in every dataset (uploads are floored at ingest), so a cell
+    range selects the same admissions as the FilterIndex age range and the
+    dashboard and explorer agree at the slider edges. The age bands are
+    rolled up from it. The cube has at most a few thousand cells
+    whatever the admission count, so every dashboard number is a sum over a
+    handful of rows. Distinct patients are not additive, so each slice merges
+    small HyperLogLog sketches instead (an element-wise max) and the patient
+    count is approximate.
+    """
+
+    def __init__(self, df):
+        if 'admission_month' in df.columns:
+            month = df['admission_month']
+        elif 'admission_date' in df.columns:
+            month = pd.to_datetime(df['admission_date']).dt.month
+        else:
+            month = pd.Series(np.nan, index=df.index)
+
+        frame = pd.DataFrame({
+            'gender': df['gender'],
+            'age': np.floor(df['age']),
+            'readmission_30d': df['readmission_30d'],
+            'admission_month': month,
+            'age_value': df['age'],
+            'length_of_stay': df['length_of_stay']
+        })
+
+        # Every cell lies in exactly one sketch group, since the sketch dimensions are a subset
+        frame['sketch'] = frame.groupby(SKETCH_DIMENSIONS, dropna=False, observed=True, sort=False).ngroup()
+        patient_ids = df['patient_id'] if 'patient_id' in df.columns else np.arange(len(df))
+        self.sketches = _hll_registers(patient_ids, frame['sketch'], int(frame['sketch'].max()) + 1 if len(frame) else 0)
+
+        cells = frame.groupby(DIMENSIONS, dropna=False, observed=True, sort=False).agg(
+            admissions=('age_value', 'size'),
+            readmission_sum=('readmission_30d', 'sum'),
+            stay_sum=('length_of_stay', 'sum'),
+            stay_count=('length_of_stay', 'count'),
+            age_sum=('age_value', 'sum'),
+            sketch=('sketch', 'first')
+        ).reset_index()
+        cells['age_band'] = pd.cut(cells['age'], bins=AGE_BANDS, labels=AGE_BAND_LABELS)
+        self.cells = cells
+
+    def __len__(self):
+        return len(self.cells)
+
+    def slice(self, genders, readmission_status, age_range):
+        """Cells matching the dashboard filters"""
+        cells = self.cells
+        return cells[
+            cells['gender'].isin(genders) &
+            cells['readmission_30d'].isin(readmission_status) &
+            cells['age'].between(age_range[0], age_range[1])
+        ]
+
+    def distinct_patients(self, cells):
+        """Approximate number of patients with at least one admission in the given cells"""
+        groups = np.unique(cells['sketch'].to_numpy())
+        if not len(groups):
+            return 0
+        return _hll_estimate(self.sketches[groups].max(axis=0))
+
+    def kpis(self, cells):
+        """Approximate distinct patients, admissions and per-admission readmission rate, length of stay and age"""
+        admissions = int(cells['admissions'].sum())
+        return {
+            'patients': self.distinct_patients(cells),
+            'admissions': admissions,
+            'readmission_rate': _ratio(cells['readmission_sum'].sum(), admissions),
+            'avg_length_of_stay': _ratio(cells['stay_sum'].sum(), cells['stay_count'].sum()),
+            'avg_age': _ratio(cells['age_sum'].sum(), admissions)
+        }
+
+    @staticmethod
+    def by_age_band(cells):
+        """Readmission rate (mean) and admission count per age band"""
+        stats = cells.groupby('age_band', observed=True)[['readmission_sum', 'admissions']].sum()
+        return pd.DataFrame({
+            'age_group': stats.index,
+            'mean': stats['readmission_sum'] / stats['admissions'],
+            'count': stats['admissions']
+        }).reset_index(drop=True)
+
+    @staticmethod
+    def by_month(cells):
+        """Readmission rate per admission month"""
+        stats = cells.groupby('admission_month')[['readmission_sum', 'admissions']].sum()
+        return pd.DataFrame({
+            'admission_month': stats.index,
+            'readmission_30d': stats['readmission_sum'] / stats['admissions']
+        }).reset_index(drop=True)
@@ -0,0 +1,241 @@
+# dashboard.py
+import zlib
+
+import plotly.express as px
+import streamlit as st
+
+from src.app.analytics_cache import normalise_filter_key
+from src.app.chart_reduction import box_chart
+from src.app.common import (
+    get_data, get_filter_index, get_dashboard_cube, timed, timed_page, timed_fragment,
+    create_metric_card, show_paginated_table, export_button
+)
+from src.app.figure_cache import get_figure_cache, frame_digest
+
+# ========== FIGURES ==========
+def dashboard_filter_key():
+    """Normalised key of the sidebar filters, shared by the dashboard's figures and exports"""
+    return normalise_filter_key(
+        'dashboard',
+        categories={
+            'gender': st.session_state.filters['gender'],
+            'readmission_30d': st.session_state.filters['readmission_status']
+        },
+        ranges={'age': st.session_state.filters['age_range']}
+    )
+
+def cached_figure(chart, build, *inputs):
+    """Figure from the process-wide cache, keyed by chart, layout (mobile/desktop) and what it is drawn from"""
+    layout = 'mobile' if st.session_state.is_mobile else 'desktop'
+    with timed("Dashboard: chart build"):
+        return get_figure_cache().get_or_build((chart, layout) + inputs, build)
+
+def age_group_figure(age_group_stats):
+    """Readmission rate per age band, annotated with admission counts"""
+    fig = px.bar(
+        age_group_stats,
+        x='age_group',
+        y='mean',
+        color='mean',
+        color_continuous_scale='RdYlGn_r',
+        labels={'mean': 'Readmission Rate', 'age_group': 'Age Group'},
+        title="Readmission Rate by Age Group"
+    )
+    
+    # Add count annotations
+    for i, row in age_group_stats.iterrows():
+        fig.add_annotation(
+            x=row['age_group'],
+            y=row['mean'] + 0.02,
+            text=f"n={int(row['count'])}",
+            showarrow=False,
+            font=dict(size=10)
+        )
+    
+    fig.update_layout(height=400)
+    return fig
+
+def length_of_stay_figure(filtered_data):
+    """Length of stay quartiles per gender"""
+    fig = box_chart(filtered_data, 'length_of_stay', 'gender', "Length of Stay by Gender")
+    fig.update_layout(xaxis_title='Gender', yaxis_title='Days', height=400)
+    return fig
+
+def blood_pressure_figure(filtered_data, filter_key):
+    """Blood pressure of up to 200 patients, the same sample for the same filters"""
+    sample_data = filtered_data.sample(min(200, len(filtered_data)), random_state=zlib.crc32(repr(filter_key).encode()))
+    return px.scatter(
+        sample_data,
+        x='blood_pressure_sys',
+        y='blood_pressure_dia',
+        color='readmission_30d',
+        size='bmi',
+        hover_data=['age', 'gender'],
+        title="Blood Pressure vs Readmission",
+        labels={'readmission_30d': 'Readmitted'}
+    )
+
+def monthly_trend_figure(monthly_trend):
+    """Readmission rate per admission month"""
+    fig = px.line(
+        monthly_trend,
+        x='admission_month',
+        y='readmission_30d',
+        markers=True,
+        title="Monthly Readmission Trend",
+        labels={'readmission_30d': 'Readmission Rate', 'admission_month': 'Month'}
+    )
+    fig.update_traces(line=dict(width=3))
+    return fig
+
+# ========== PAGE ==========
+@timed_page("Dashboard page")
+def show_dashboard():
+    """Dashboard page"""
+    data = get_data()
+    index = get_filter_index(st.session_state.data_key)
+    cube = get_dashboard_cube(st.session_state.data_key)
+    
+    st.markdown('<h1 style="font-size: 2.5rem; color: #1E3A8A; text-align: center; margin-bottom: 2rem;">📊 Healthcare Analytics Dashboard</h1>', unsafe_allow_html=True)
+    
+    # Mobile notification
+    if st.session_state.is_mobile:
+        st.info("📱 You're viewing the mobile-optimized version. For best experience, rotate your device horizontally.")
+    
+    # Apply filters
+    with timed("Dashboard: filter"):
+        positions = index.positions(
+            categories={
+                'gender': st.session_state.filters['gender'],
+                'readmission_30d': st.session_state.filters['readmission_status']
+            },
+            ranges={'age': st.session_state.filters['age_range']}
+        )
+        filtered_data = data.take(positions)
+    
+    # Every dashboard number comes from the cube, not the raw rows
+    with timed("Dashboard: aggregate"):
+        cells = cube.slice(
+            st.session_state.filters['gender'],
+            st.session_state.filters['readmission_status'],
+            st.session_state.filters['age_range']
+        )
+        kpis = cube.kpis(cells)
+    
+    # KPI Metrics - Responsive layout
+    if st.session_state.is_mobile:
+        # Stack metrics vertically on mobile
+        for title, value, subtitle in [
+            ("Total Patients", f"≈{kpis['patients']:,}", f"Approximate • {kpis['admissions']:,} admissions"),
+            ("Readmission Rate", f"{kpis['readmission_rate']*100:.1f}%", "Admissions readmitted within 30 days"),
+            ("Avg Stay", f"{kpis['avg_length_of_stay']:.1f} days", "Per admission"),
+            ("Avg Age", f"{kpis['avg_age']:.1f} years", "At admission")
+        ]:
+            st.markdown(create_metric_card(title, value, subtitle), unsafe_allow_html=True)
+    else:
+        # Desktop layout
+        cols = st.columns(4)
+        metrics = [
+            ("Total Patients", f"≈{kpis['patients']:,}", f"Approximate • {kpis['admissions']:,} admissions"),
+            ("Readmission Rate", f"{kpis['readmission_rate']*100:.1f}%", "Admissions readmitted within 30 days"),
+            ("Avg Stay", f"{kpis['avg_length_of_stay']:.1f} days", "Per admission"),
+            ("Avg Age", f"{kpis['avg_age']:.1f} years", "At admission")
+        ]
+        
+        for i, (title, value, subtitle) in enumerate(metrics):
+            with cols[i]:
+                st.markdown(create_metric_card(title, value, subtitle), unsafe_allow_html=True)
+    
+    # Charts section with responsive layout
+    st.markdown("---")
+    st.header("📈 Visual Analytics")
+    
+    # Aggregate charts are keyed by their aggregate, so different filters with the same numbers share a figure;
+    # charts drawn from patient rows are keyed by the filter state that selected them
+    filter_key = dashboard_filter_key()
+    rows_key = (st.session_state.data_key, filter_key)
+    
+    with timed("Dashboard: aggregate"):
+        age_group_stats = cube.by_age_band(cells)
+    fig1 = cached_figure('age_groups', lambda: age_group_figure(age_group_stats), frame_digest(age_group_stats))
+    fig2 = cached_figure('length_of_stay', lambda: length_of_stay_figure(filtered_data), *rows_key)
+    
+    if st.session_state.is_mobile:
+        # Stack charts vertically on mobile
+        # Chart 1: Readmission by Age Group
+        st.subheader("Readmission by Age Group")
+        st.plotly_chart(fig1, use_container_width=True)
+        
+        # Chart 2: Length of Stay Distribution
+        st.subheader("Length of Stay Distribution")
+        st.plotly_chart(fig2, use_container_width=True)
+    else:
+        # Desktop layout
+        chart_cols = st.columns(2)
+        
+        with chart_cols[0]:
+            st.subheader("Readmission by Age Group")
+            st.plotly_chart(fig1, use_container_width=True)
+        
+        with chart_cols[1]:
+            st.subheader("Length of Stay Distribution")
+            st.plotly_chart(fig2, use_container_width=True)
+        
+        # Additional desktop charts
+        st.subheader("📊 Detailed Analysis")
+        
+        detailed_cols = st.columns(2)
+        
+        with detailed_cols[0]:
+            # Blood pressure vs readmission
+            fig3 = cached_figure('blood_pressure', lambda: blood_pressure_figure(filtered_data, filter_key), *rows_key)
+            st.plotly_chart(fig3, use_container_width=True)
+        
+        with detailed_cols[1]:
+            # Monthly trends
+            with timed("Dashboard: aggregate"):
+                monthly_trend = cube.by_month(cells)
+            
+            fig4 = cached_figure('monthly_trend', lambda: monthly_trend_figure(monthly_trend), frame_digest(monthly_trend))
+            st.plotly_chart(fig4, use_container_width=True)
+    
+    # Data preview with mobile optimization
+    st.markdown("---")
+    st.header("📋 Patient Data Preview")
+    
+    with st.expander("View Filtered Data", expanded=False):
+        show_dashboard_preview(data, index, positions, filtered_data)
+
+@timed_fragment("Dashboard: data preview")
+def show_dashboard_preview(data, index, positions, filtered_data):
+    """Paginated preview and exports of the filtered patients"""
+    # Show limited data on mobile
+    display_count = 5 if st.session_state.is_mobile else 10
+    filter_key = dashboard_filter_key()
+    
+    if st.session_state.is_mobile:
+        st.markdown('<div class="scrollable-container">', unsafe_allow_html=True)
+    
+    show_paginated_table(
+        data, index, positions, key='dashboard_table', reset_on=filter_key,
+        columns=['patient_id', 'age', 'gender', 'length_of_stay', 'readmission_30d', 'bmi'],
+        page_size=display_count
+    )
+    
+    if st.session_state.is_mobile:
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Download options (generated only when clicked)
+    if st.session_state.is_mobile:
+        export_button("📥 Download as CSV", filtered_data, 'csv', "patient_data", filter_key)
+    else:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            export_button("📥 Download as CSV", filtered_data, 'csv', "patient_data", filter_key)
+        
+        with col2:
+            # Show additional options on desktop
+            export_button("📥 Download as JSON", filtered_data, 'json', "patient_data", filter_key)
+        
+        with col3:
+            export_button("📥 Download as Parquet", filtered_data, 'parquet', "patient_data", filter_key)
@@ -0,0 +1,318 @@
+# explorer.py
+import zlib
+
+import numpy as np
+import plotly.express as px
+import streamlit as st
+
+from src.app.analytics_cache import get_analytics_cache, normalise_filter_key
+from src.app.chart_reduction import scatter_chart, histogram_chart, box_chart, violin_chart
+from src.app.common import (
+    get_data, get_filter_index, timed, timed_page, timed_fragment, show_paginated_table, export_button
+)
+
+@timed_page("Data Explorer page")
+def show_data_explorer():
+    """Data Explorer page"""
+    data = get_data()
+    index = get_filter_index(st.session_state.data_key)
+    
+    st.header("🔍 Interactive Data Explorer")
+    
+    # Mobile info
+    if st.session_state.is_mobile:
+        st.info("📱 Use filters below to explore patient data. Charts will adapt to your screen size.")
+    
+    # Filters in expander for mobile
+    with st.expander("🔧 Data Filters", expanded=not st.session_state.is_mobile):
+        if st.session_state.is_mobile:
+            # Stack filters vertically on mobile
+            gender_filter = st.multiselect(
+                "Gender",
+                options=index.categories('gender'),
+                default=index.categories('gender')
+            )
+            
+            readmission_filter = st.multiselect(
+                "Readmission Status",
+                options=[0, 1],
+                default=[0, 1],
+                format_func=lambda x: "Readmitted" if x == 1 else "Not Readmitted"
+            )
+            
+            age_filter = st.slider(
+                "Age Range",
+                int(index.bounds['age'][0]),
+                int(index.bounds['age'][1]),
+                (30, 70)
+            )
+            
+            los_filter = st.slider(
+                "Length of Stay",
+                int(index.bounds['length_of_stay'][0]),
+                int(index.bounds['length_of_stay'][1]),
+                (1, 14)
+            )
+            
+            bmi_filter = st.slider(
+                "BMI Range",
+                float(index.bounds['bmi'][0]),
+                float(index.bounds['bmi'][1]),
+                (18.5, 30.0)
+            )
+            
+            sample_size = st.slider(
+                "Sample Size",
+                10, 1000, 200
+            )
+        else:
+            # Desktop filters
+            filter_cols = st.columns(3)
+            
+            with filter_cols[0]:
+                gender_filter = st.multiselect(
+                    "Gender",
+                    options=index.categories('gender'),
+                    default=index.categories('gender')
+                )
+                
+                readmission_filter = st.multiselect(
+                    "Readmission Status",
+                    options=[0, 1],
+                    default=[0, 1],
+                    format_func=lambda x: "Readmitted" if x == 1 else "Not Readmitted"
+                )
+            
+            with filter_cols[1]:
+                age_filter = st.slider(
+                    "Age Range",
+                    int(index.bounds['age'][0]),
+                    int(index.bounds['age'][1]),
+                    (30, 70)
+                )
+                
+                los_filter = st.slider(
+                    "Length of Stay",
+                    int(index.bounds['length_of_stay'][0]),
+                    int(index.bounds['length_of_stay'][1]),
+                    (1, 14)
+                )
+            
+            with filter_cols[2]:
+                bmi_filter = st.slider(
+                    "BMI Range",
+                    float(index.bounds['bmi'][0]),
+                    float(index.bounds['bmi'][1]),
+                    (18.5, 30.0)
+                )
+                
+                sample_size = st.slider(
+                    "Sample Size",
+                    10, 1000, 200
+                )
+    
+    # Apply filters
+    categories = {'gender': gender_filter, 'readmission_30d': readmission_filter}
+    ranges = {'age': age_filter, 'length_of_stay': los_filter, 'bmi': bmi_filter}
+    with timed("Explorer: filter"):
+        matching = index.positions(categories=categories, ranges=ranges)
+    # Charts read every matching row, so their caches ignore the sample size; the sample's do not
+    rows_key = normalise_filter_key('explorer', categories, ranges)
+    filter_key = normalise_filter_key('explorer', categories, ranges, sample_size=sample_size)
+    sample_seed = zlib.crc32(repr(filter_key).encode())
+    positions = matching
+    if len(matching) > sample_size:
+        # Same filters, same sample: keeps the view and its cached exports stable across reruns
+        rng = np.random.default_rng(sample_seed)
+        positions = np.sort(rng.choice(matching, sample_size, replace=False))
+    filtered_data = data.take(positions)
+    
+    st.success(f"✅ {len(matching):,} matching records • summary statistics and exports use a sample of {len(filtered_data):,}")
+    
+    # Visualization tools
+    st.subheader("📊 Visualization Tools")
+    
+    show_explorer_charts(data, filtered_data, matching, rows_key, sample_seed)
+    
+    # Data table
+    st.subheader("📋 Data Table")
+    
+    with st.expander("View Data", expanded=False):
+        show_explorer_table(data, index, matching, filtered_data, filter_key)
+
+def column_position(columns, name):
+    """Selectbox index of a default column, by name so it survives column reordering"""
+    columns = list(columns)
+    return columns.index(name) if name in columns else 0
+
+def matching_rows(data, matching, *columns):
+    """Only the columns a chart reads, for every matching patient"""
+    return data[[col for col in dict.fromkeys(columns) if col in data.columns]].take(matching)
+
+@timed_fragment("Explorer: charts")
+def show_explorer_charts(data, filtered_data, matching, rows_key, sample_seed):
+    """Chart picker; changing chart options reruns only this fragment
+
+    Charts are drawn from every matching patient and reduced on the server
+    (density maps, full-data quartiles); the sample is for the table and exports.
+    """
+    # Chart type selection
+    chart_options = ["Scatter Plot", "Histogram", "Box Plot", "Violin Plot", "Correlation Matrix"]
+    
+    if st.session_state.is_mobile:
+        chart_type = st.selectbox("Chart Type", chart_options)
+        
+        if chart_type == "Scatter Plot":
+            x_axis = st.selectbox("X-axis", filtered_data.columns, index=column_position(filtered_data.columns, 'age'))
+            y_axis = st.selectbox("Y-axis", filtered_data.columns, index=column_position(filtered_data.columns, 'blood_pressure_sys'))
+            
+            # Charts are reduced on the server so payloads stay bounded
+            with timed("Explorer: chart build"):
+                fig = scatter_chart(matching_rows(data, matching, x_axis, y_axis, 'readmission_30d', 'patient_id', 'gender', 'age'), x_axis, y_axis, f"{y_axis} vs {x_axis}", seed=sample_seed)
+            st.plotly_chart(fig, use_container_width=True)
+        
+        elif chart_type == "Histogram":
+            column = st.selectbox("Select Column", filtered_data.select_dtypes(include=[np.number]).columns)
+            
+            with timed("Explorer: chart build"):
+                fig = histogram_chart(matching_rows(data, matching, column, 'gender'), column, 'gender', f"Distribution of {column}")
+            st.plotly_chart(fig, use_container_width=True)
+        
+        elif chart_type == "Box Plot":
+            column = st.selectbox("Value Column", ['age', 'length_of_stay', 'bmi', 'cholesterol'])
+            group_by = st.selectbox("Group By", ['gender', 'readmission_30d', 'diabetes'])
+            
+            with timed("Explorer: chart build"):
+                fig = box_chart(matching_rows(data, matching, column, group_by), column, group_by, f"{column} by {group_by}")
+            st.plotly_chart(fig, use_container_width=True)
+        
+        elif chart_type == "Violin Plot":
+            column = st.selectbox("Value Column", ['age', 'length_of_stay', 'bmi'])
+            group_by = st.selectbox("Group By", ['gender', 'readmission_30d'])
+            
+            with timed("Explorer: chart build"):
+                fig = violin_chart(matching_rows(data, matching, column, group_by), column, group_by, f"{column} Distribution by {group_by}", seed=sample_seed)
+            st.plotly_chart(fig, use_container_width=True)
+        
+        elif chart_type == "Correlation Matrix":
+            numeric_columns = list(data.select_dtypes(include=[np.number]).columns)
+            
+            if len(numeric_columns) > 1:
+                # Over every matching patient, memoized per filter state: a nearby filter state
+                # only adds and removes the rows at the edges of the previous one
+                with timed("Explorer: correlation"):
+                    corr_matrix = get_analytics_cache().correlation(
+                        st.session_state.data_key, rows_key, data, matching, numeric_columns
+                    )
+                
+                fig = px.imshow(
+                    corr_matrix,
+                    text_auto='.2f',
+                    color_continuous_scale='RdBu',
+                    title="Correlation Matrix"
+                )
+                st.plotly_chart(fig, use_container_width=True)
+            else:
+                st.warning("Need more numeric columns for correlation matrix")
+    else:
+        # Desktop layout
+        viz_cols = st.columns([1, 3])
+        
+        with viz_cols[0]:
+            chart_type = st.selectbox("Chart Type", chart_options)
+        
+        with viz_cols[1]:
+            if chart_type == "Scatter Plot":
+                col1, col2 = st.columns(2)
+                with col1:
+                    x_axis = st.selectbox("X-axis", filtered_data.columns, index=column_position(filtered_data.columns, 'age'))
+                with col2:
+                    y_axis = st.selectbox("Y-axis", filtered_data.columns, index=column_position(filtered_data.columns, 'blood_pressure_sys'))
+                
+                # Charts are reduced on the server so payloads stay bounded
+                with timed("Explorer: chart build"):
+                    fig = scatter_chart(matching_rows(data, matching, x_axis, y_axis, 'readmission_30d', 'patient_id', 'gender', 'age'), x_axis, y_axis, f"{y_axis} vs {x_axis}", seed=sample_seed)
+                st.plotly_chart(fig, use_container_width=True)
+            
+            elif chart_type == "Histogram":
+                column = st.selectbox("Select Column", filtered_data.select_dtypes(include=[np.number]).columns)
+                
+                with timed("Explorer: chart build"):
+                    fig = histogram_chart(matching_rows(data, matching, column, 'gender'), column, 'gender', f"Distribution of {column}")
+                st.plotly_chart(fig, use_container_width=True)
+            
+            elif chart_type == "Box Plot":
+                column = st.selectbox("Value Column", ['age', 'length_of_stay', 'bmi', 'cholesterol'])
+                group_by = st.selectbox("Group By", ['gender', 'readmission_30d', 'diabetes'])
+                
+                with timed("Explorer: chart build"):
+                    fig = box_chart(matching_rows(data, matching, column, group_by), column, group_by, f"{column} by {group_by}")
+                st.plotly_chart(fig, use_container_width=True)
+            
+            elif chart_type == "Violin Plot":
+                column = st.selectbox("Value Column", ['age', 'length_of_stay', 'bmi'])
+                group_by = st.selectbox("Group By", ['gender', 'readmission_30d'])
+                
+                with timed("Explorer: chart build"):
+                    fig = violin_chart(matching_rows(data, matching, column, group_by), column, group_by, f"{column} Distribution by {group_by}", seed=sample_seed)
+                st.plotly_chart(fig, use_container_width=True)
+            
+            elif chart_type == "Correlation Matrix":
+                numeric_columns = list(data.select_dtypes(include=[np.number]).columns)
+                
+                if len(numeric_columns) > 1:
+                    # Over every matching patient, memoized per filter state: a nearby filter state
+                    # only adds and removes the rows at the edges of the previous one
+                    with timed("Explorer: correlation"):
+                        corr_matrix = get_analytics_cache().correlation(
+                            st.session_state.data_key, rows_key, data, matching, numeric_columns
+                        )
+                    
+                    fig = px.imshow(
+                        corr_matrix,
+                        text_auto='.2f',
+                        color_continuous_scale='RdBu',
+                        title="Correlation Matrix"
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                else:
+                    st.warning("Need more numeric columns for correlation matrix")
+
+@timed_fragment("Explorer: data table")
+def show_explorer_table(data, index, matching, filtered_data, filter_key):
+    """Paginated table, summary statistics and exports"""
+    # Show scrollable table on mobile
+    if st.session_state.is_mobile:
+        st.markdown('<div class="scrollable-container">', unsafe_allow_html=True)
+    
+    # Pages through every matching patient, not just the chart sample
+    show_paginated_table(
+        data, index, matching, key='explorer_table', reset_on=filter_key,
+        page_size=25 if st.session_state.is_mobile else 50,
+        height=300 if st.session_state.is_mobile else 400
+    )
+    
+    if st.session_state.is_mobile:
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Statistics
+    st.subheader("📈 Summary Statistics")
+    with timed("Explorer: summary statistics"):
+        summary = get_analytics_cache().describe(st.session_state.data_key, filter_key, filtered_data)
+    st.write(summary)
+    
+    # Export buttons (generated only when clicked)
+    if st.session_state.is_mobile:
+        export_button("📥 Export as CSV", filtered_data, 'csv', "healthcare_data", filter_key)
+    else:
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            export_button("📥 Export as CSV", filtered_data, 'csv', "healthcare_data", filter_key)
+        
+        with col2:
+            # Excel export (desktop only)
+            export_button("📥 Export as Excel", filtered_data, 'xlsx', "healthcare_data", filter_key)
+        
+        with col3:
+            export_button("📥 Export as Parquet", filtered_data, 'parquet', "healthcare_data", filter_key)
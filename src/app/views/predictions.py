@@ -0,0 +1,528 @@
+# predictions.py
+import time
+from collections import deque
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from src.modeling.model_inference import patient_row, servable_model, BatchScoringService
+from src.modeling.model_registry import get_registry, READMISSION_MODEL
+from src.modeling.risk_table import RiskTable, dataset_digest, risk_table_dir, risk_table_version, score_single_patient
+from src.app.data_store import get_store
+from src.app.common import get_data, get_timings, get_metrics_registry, timed_page, timed_fragment
+
+PREDICTIONS = get_metrics_registry().counter('predictions', "Predictions made from the risk form")
+PREDICTION_SECONDS = get_metrics_registry().histogram('prediction_seconds', "Scoring latency of form predictions")
+
+@st.cache_resource
+def get_model_registry():
+    """Process-wide model registry, shared by every session and watched for new versions"""
+    registry = get_registry()
+    registry.start_watcher()
+    return registry
+
+@st.cache_resource
+def get_scoring_service():
+    """Process-wide micro-batching scorer, so concurrent predictions share one vectorized call"""
+    registry = get_model_registry()
+    return BatchScoringService(model_provider=lambda: registry.get_model(READMISSION_MODEL))
+
+@st.cache_resource(max_entries=8)
+def load_risk_table(table_dir, version):
+    """Memory-mapped risk table, reopened only when a rebuild changes its version"""
+    return RiskTable(table_dir)
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def get_dataset_digest(data_key):
+    """Content hash of one dataset version, computed once; the batch stage derives the same one from the file"""
+    return dataset_digest(get_store().get(data_key))
+
+def get_risk_table(data_key, loaded_model):
+    """Risk table of a dataset and the served model, or None until the batch stage has built it"""
+    table_dir = risk_table_dir(get_dataset_digest(data_key), loaded_model)
+    version = risk_table_version(table_dir)
+    if version is None:
+        return None
+    return load_risk_table(table_dir, version)
+
+@st.cache_resource
+def get_prediction_latencies():
+    """Recent prediction latencies in ms, shared across sessions"""
+    return deque(maxlen=500)
+
+def format_contribution(value, units):
+    """Risk factor contribution as shown in tables and reports"""
+    return f"{value*100:.1f}%" if units == 'probability' else f"{value:+.2f} log-odds"
+
+@timed_page("Predictions page")
+def show_predictions():
+    """Predictions page"""
+    st.header("🤖 Readmission Risk Predictor")
+    
+    # Mobile-friendly info
+    if st.session_state.is_mobile:
+        st.info("📱 Fill in the form below to predict readmission risk. Scroll to see all fields.")
+    
+    # Current patients: precomputed nightly scores; no table is ever built at request time
+    with st.expander("🗂️ Current Patient Risk", expanded=False):
+        show_current_patient_risk()
+    
+    show_prediction_form()
+
+@timed_fragment("Predictions: current patient risk")
+def show_current_patient_risk():
+    """Lookups against the precomputed risk table"""
+    data = get_data()
+    loaded_model = servable_model(get_model_registry().get_model(READMISSION_MODEL), data)
+    try:
+        risk_table = get_risk_table(st.session_state.data_key, loaded_model)
+    except (KeyError, ValueError, OSError) as e:
+        st.info(f"Risk table not available for the loaded data: {e}")
+        return
+    
+    if risk_table is None:
+        # Never built at request time: score only the patient asked for until the batch stage has run
+        st.info(
+            "🕒 Risk table not built yet for this dataset and model. Build it with "
+            "`python -m src.modeling.risk_table <data file>` (`--sample` for the sample data); "
+            "until then patients are scored one at a time."
+        )
+        lookup_id = st.number_input(
+            "Patient ID",
+            min_value=0,
+            value=int(data['patient_id'].iloc[0]),
+            step=1,
+            key="risk_lookup_id"
+        )
+        lookup_score = score_single_patient(data, lookup_id, loaded_model)
+        if lookup_score is None:
+            st.warning(f"No admissions for patient {lookup_id}")
+        else:
+            st.metric("Readmission Risk", f"{lookup_score:.1%}")
+    else:
+        st.caption(f"{len(risk_table):,} patients scored {risk_table.metadata['built_at']} • {risk_table.metadata['model']}")
+        
+        lookup_cols = st.columns(1 if st.session_state.is_mobile else 2)
+        with lookup_cols[0]:
+            lookup_id = st.number_input(
+                "Patient ID",
+                min_value=0,
+                value=int(risk_table.patient_ids[0]),
+                step=1,
+                key="risk_lookup_id"
+            )
+            lookup_score = risk_table.lookup(lookup_id)
+            if lookup_score is None:
+                st.warning(f"No risk score for patient {lookup_id}")
+            else:
+                st.metric("Readmission Risk", f"{lookup_score:.1%}")
+        
+        with lookup_cols[-1]:
+            top_k = st.slider("Highest-risk patients", 5, 50, 10, key="risk_top_k")
+            st.dataframe(
+                risk_table.top_k(top_k),
+                use_container_width=True,
+                hide_index=True,
+                column_config={'risk_score': st.column_config.NumberColumn('Risk', format="%.3f")}
+            )
+
+@timed_fragment("Predictions: risk form")
+def show_prediction_form():
+    """Risk form and its results; submitting reruns only this fragment"""
+    # Create form
+    with st.form("prediction_form"):
+        # Responsive form layout
+        if st.session_state.is_mobile:
+            # Stack form fields vertically on mobile
+            st.subheader("👤 Patient Info")
+            age = st.number_input(
+                "Age",
+                min_value=18,
+                max_value=120,
+                value=45,
+                help="Patient's age in years"
+            )
+            gender = st.selectbox(
+                "Gender",
+                ["Male", "Female", "Other"]
+            )
+            bmi = st.slider(
+                "BMI",
+                min_value=15.0,
+                max_value=50.0,
+                value=25.0,
+                step=0.1,
+                help="Body Mass Index"
+            )
+            
+            st.subheader("🏥 Medical History")
+            diabetes = st.selectbox(
+                "Diabetes",
+                ["No", "Yes"]
+            )
+            hypertension = st.selectbox(
+                "Hypertension",
+                ["No", "Yes"]
+            )
+            previous_admissions = st.number_input(
+                "Previous Admissions",
+                min_value=0,
+                max_value=20,
+                value=1
+            )
+            
+            st.subheader("🔬 Current Status")
+            length_of_stay = st.number_input(
+                "Current Stay (days)",
+                min_value=1,
+                max_value=365,
+                value=7
+            )
+            blood_pressure = st.slider(
+                "Systolic BP",
+                min_value=80,
+                max_value=200,
+                value=120
+            )
+            cholesterol = st.number_input(
+                "Cholesterol (mg/dL)",
+                min_value=100,
+                max_value=400,
+                value=200
+            )
+        else:
+            # Desktop form layout
+            form_cols = st.columns(3)
+            
+            with form_cols[0]:
+                st.subheader("👤 Patient Info")
+                age = st.number_input(
+                    "Age",
+                    min_value=18,
+                    max_value=120,
+                    value=45,
+                    help="Patient's age in years",
+                    key="pred_age"
+                )
+                gender = st.selectbox(
+                    "Gender",
+                    ["Male", "Female", "Other"],
+                    key="pred_gender"
+                )
+                bmi = st.slider(
+                    "BMI",
+                    min_value=15.0,
+                    max_value=50.0,
+                    value=25.0,
+                    step=0.1,
+                    help="Body Mass Index",
+                    key="pred_bmi"
+                )
+            
+            with form_cols[1]:
+                st.subheader("🏥 Medical History")
+                diabetes = st.selectbox(
+                    "Diabetes",
+                    ["No", "Yes"],
+                    key="pred_diabetes"
+                )
+                hypertension = st.selectbox(
+                    "Hypertension",
+                    ["No", "Yes"],
+                    key="pred_hypertension"
+                )
+                previous_admissions = st.number_input(
+                    "Previous Admissions",
+                    min_value=0,
+                    max_value=20,
+                    value=1,
+                    key="pred_prev_adm"
+                )
+            
+            with form_cols[2]:
+                st.subheader("🔬 Current Status")
+                length_of_stay = st.number_input(
+                    "Current Stay (days)",
+                    min_value=1,
+                    max_value=365,
+                    value=7,
+                    key="pred_los"
+                )
+                blood_pressure = st.slider(
+                    "Systolic BP",
+                    min_value=80,
+                    max_value=200,
+                    value=120,
+                    key="pred_bp"
+                )
+                cholesterol = st.number_input(
+                    "Cholesterol (mg/dL)",
+                    min_value=100,
+                    max_value=400,
+                    value=200,
+                    key="pred_chol"
+                )
+        
+        # Submit button with mobile optimization
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            submitted = st.form_submit_button(
+                "🚀 Calculate Risk",
+                type="primary",
+                use_container_width=True
+            )
+    
+    if submitted:
+        # Track prediction
+        st.session_state.analytics['predictions_made'] += 1
+        
+        with st.spinner("🔍 Analyzing patient data..."):
+            scoring_started = time.perf_counter()
+            
+            # Score and factor breakdown come back together from one pass of the shared batching
+            # service, so the factors always explain the model that produced the displayed score
+            row = patient_row(age, bmi, diabetes, hypertension, previous_admissions, length_of_stay, blood_pressure)
+            loaded_model, explanation = get_scoring_service().explain(row, timeout=10)
+            risk_score = float(explanation.scores[0])
+            
+            # No breakdown for model types without an additive explanation
+            risk_factors = {} if explanation.contributions is None else \
+                dict(zip(explanation.factor_names, explanation.contributions[0].tolist()))
+            factor_units = explanation.units
+            
+            # Real scoring latency, kept in a process-wide window of recent predictions
+            scoring_ms = (time.perf_counter() - scoring_started) * 1000
+            prediction_latencies = get_prediction_latencies()
+            prediction_latencies.append(scoring_ms)
+            get_timings().record("Predictions: scoring", scoring_ms)
+            PREDICTIONS.inc()
+            PREDICTION_SECONDS.observe(scoring_ms / 1000)
+        
+        # Display results
+        st.markdown("---")
+        st.header("📊 Prediction Results")
+        
+        recent_latencies = np.array(prediction_latencies)
+        st.caption(
+            f"⏱️ Scored in {scoring_ms:.1f} ms • p50 {np.percentile(recent_latencies, 50):.1f} ms • "
+            f"p95 {np.percentile(recent_latencies, 95):.1f} ms over the last {len(recent_latencies)} predictions"
+        )
+        
+        if loaded_model is not None:
+            breakdown = f"factor contributions in {factor_units}" if risk_factors else "no factor breakdown for this model type"
+            st.caption(f"Scored by model {loaded_model.name} {loaded_model.version} • {breakdown}")
+        
+        # Responsive results layout
+        if st.session_state.is_mobile:
+            # Mobile layout
+            # Risk gauge
+            fig = go.Figure(go.Indicator(
+                mode="gauge+number",
+                value=risk_score * 100,
+                domain={'x': [0, 1], 'y': [0, 1]},
+                title={'text': "Readmission Risk Score"},
+                gauge={
+                    'axis': {'range': [0, 100]},
+                    'bar': {'color': "darkblue"},
+                    'steps': [
+                        {'range': [0, 30], 'color': "green"},
+                        {'range': [30, 70], 'color': "yellow"},
+                        {'range': [70, 100], 'color': "red"}
+                    ],
+                    'threshold': {
+                        'line': {'color': "black", 'width': 4},
+                        'thickness': 0.75,
+                        'value': risk_score * 100
+                    }
+                }
+            ))
+            
+            fig.update_layout(height=300)
+            st.plotly_chart(fig, use_container_width=True)
+            
+            # Risk level
+            if risk_score < 0.3:
+                risk_level = "🟢 LOW RISK"
+                recommendations = [
+                    "Standard discharge protocol",
+                    "Follow-up in 30 days",
+                    "General patient education"
+                ]
+            elif risk_score < 0.7:
+                risk_level = "🟡 MEDIUM RISK"
+                recommendations = [
+                    "Schedule follow-up within 14 days",
+                    "Assign care coordinator",
+                    "Monitor vital signs"
+                ]
+            else:
+                risk_level = "🔴 HIGH RISK"
+                recommendations = [
+                    "Immediate care coordination",
+                    "7-day follow-up required",
+                    "Home health assessment",
+                    "Medication management"
+                ]
+            
+            st.markdown(f"### {risk_level}")
+            st.markdown(f"**Probability:** {risk_score:.1%}")
+            
+            st.subheader("📋 Recommendations")
+            for rec in recommendations:
+                st.markdown(f"✓ {rec}")
+            
+            # Risk factors table
+            if risk_factors:
+                st.markdown("---")
+                st.subheader("🔍 Risk Factors")
+                
+                risk_df = pd.DataFrame({
+                    'Factor': [f.replace('_', ' ').title() for f in risk_factors.keys()],
+                    'Contribution': [format_contribution(v, factor_units) for v in risk_factors.values()]
+                })
+                
+                st.table(risk_df)
+        else:
+            # Desktop layout
+            results_cols = st.columns([2, 1])
+            
+            with results_cols[0]:
+                # Risk gauge
+                fig = go.Figure(go.Indicator(
+                    mode="gauge+number",
+                    value=risk_score * 100,
+                    domain={'x': [0, 1], 'y': [0, 1]},
+                    title={'text': "Readmission Risk Score"},
+                    gauge={
+                        'axis': {'range': [0, 100]},
+                        'bar': {'color': "darkblue"},
+                        'steps': [
+                            {'range': [0, 30], 'color': "green"},
+                            {'range': [30, 70], 'color': "yellow"},
+                            {'range': [70, 100], 'color': "red"}
+                        ],
+                        'threshold': {
+                            'line': {'color': "black", 'width': 4},
+                            'thickness': 0.75,
+                            'value': risk_score * 100
+                        }
+                    }
+                ))
+                
+                fig.update_layout(height=300)
+                st.plotly_chart(fig, use_container_width=True)
+            
+            with results_cols[1]:
+                # Risk level and recommendations
+                if risk_score < 0.3:
+                    risk_level = "🟢 LOW RISK"
+                    recommendations = [
+                        "Standard discharge protocol",
+                        "Follow-up in 30 days",
+                        "General patient education"
+                    ]
+                elif risk_score < 0.7:
+                    risk_level = "🟡 MEDIUM RISK"
+                    recommendations = [
+                        "Schedule follow-up within 14 days",
+                        "Assign care coordinator",
+                        "Monitor vital signs"
+                    ]
+                else:
+                    risk_level = "🔴 HIGH RISK"
+                    recommendations = [
+                        "Immediate care coordination",
+                        "7-day follow-up required",
+                        "Home health assessment",
+                        "Medication management"
+                    ]
+                
+                st.markdown(f"### {risk_level}")
+                st.markdown(f"**Probability:** {risk_score:.1%}")
+                
+                st.subheader("📋 Recommendations")
+                for rec in recommendations:
+                    st.markdown(f"✓ {rec}")
+            
+            # Risk factors breakdown
+            if risk_factors:
+                st.markdown("---")
+                st.subheader("🔍 Risk Factors Breakdown")
+                
+                risk_df = pd.DataFrame({
+                    'Factor': [f.replace('_', ' ').title() for f in risk_factors.keys()],
+                    'Contribution': [v * 100 if factor_units == 'probability' else v for v in risk_factors.values()]
+                })
+                
+                fig_risk = px.bar(
+                    risk_df,
+                    x='Contribution',
+                    y='Factor',
+                    orientation='h',
+                    color='Contribution',
+                    color_continuous_scale='RdYlGn_r',
+                    text='Contribution'
+                )
+                fig_risk.update_layout(height=300, yaxis={'categoryorder': 'total ascending'})
+                st.plotly_chart(fig_risk, use_container_width=True)
+        
+        # Generate report
+        st.markdown("---")
+        st.subheader("📄 Generate Report")
+        
+        report_content = f"""
+        HEALTHCARE READMISSION RISK ASSESSMENT
+        =======================================
+        
+        Patient Assessment
+        ------------------
+        Date: {datetime.now().strftime('%Y-%m-%d %H:%M')}
+        Age: {age} years
+        Gender: {gender}
+        BMI: {bmi}
+        
+        Medical History
+        ---------------
+        Diabetes: {diabetes}
+        Hypertension: {hypertension}
+        Previous Admissions: {previous_admissions}
+        
+        Current Status
+        --------------
+        Length of Stay: {length_of_stay} days
+        Blood Pressure: {blood_pressure} mmHg
+        Cholesterol: {cholesterol} mg/dL
+        
+        Assessment Results
+        ------------------
+        Readmission Risk: {risk_score:.1%}
+        Risk Level: {risk_level}
+        
+        Key Risk Factors
+        ----------------
+        """
+        
+        for factor, value in risk_factors.items():
+            report_content += f"- {factor.replace('_', ' ').title()}: {format_contribution(value, factor_units)}\n"
+        
+        report_content += """
+        
+        Recommendations
+        ---------------
+        """
+        
+        for i, rec in enumerate(recommendations, 1):
+            report_content += f"{i}. {rec}\n"
+        
+        # Download button
+        st.download_button(
+            label="📥 Download Full Report",
+            data=report_content,
+            file_name=f"readmission_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+            mime="text/plain",
+            use_container_width=True
+        )
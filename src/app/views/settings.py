@@ -0,0 +1,242 @@
+# settings.py
+import os
+import sys
+import threading
+
+import numpy as np
+import pandas as pd
+import plotly
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx
+
+from src.app.data_store import get_store
+from src.app.data_ingest import content_digest, ingest_upload, required_columns_text, UploadValidationError
+from src.app.analytics_cache import get_analytics_cache
+from src.app.exports import get_export_cache
+from src.app.figure_cache import get_figure_cache
+from src.app.instrumentation import get_timings, cache_hit_rates, session_memory_mb, process_memory_mb
+from src.app.common import SAMPLE_DATA_KEY, warm_dataset_indexes, start_metrics_exporter
+
+def show_settings():
+    """Settings page"""
+    st.header("⚙️ Settings & Configuration")
+    
+    # App info
+    with st.expander("ℹ️ About This App", expanded=True):
+        st.markdown("""
+        ## 🏥 Healthcare Readmission Analytics
+        
+        **Version:** 1.3.0
+        **Last Updated:** 2024
+        
+        ### Overview
+        This platform uses predictive analytics to identify patients at risk of hospital readmission within 30 days.
+        
+        ### Features
+        - Real-time risk prediction
+        - Interactive data visualization
+        - Mobile-responsive design
+        - Data export capabilities
+        
+        ### Privacy
+        All data is anonymized and complies with healthcare privacy regulations.
+        """)
+    
+    # Mobile settings
+    with st.expander("📱 Mobile Settings", expanded=True):
+        st.markdown(f"**Mobile Mode Detected:** {'Yes' if st.session_state.is_mobile else 'No'}")
+        
+        # Force mobile view for testing
+        if st.button("Test Mobile View", help="Simulate mobile view for testing", use_container_width=st.session_state.is_mobile):
+            st.session_state.is_mobile = True
+            st.rerun()
+        
+        if st.button("Test Desktop View", help="Simulate desktop view for testing", use_container_width=st.session_state.is_mobile):
+            st.session_state.is_mobile = False
+            st.rerun()
+    
+    # Data management
+    with st.expander("🗃️ Data Management", expanded=False):
+        st.subheader("Upload New Data")
+        
+        uploaded_file = st.file_uploader(
+            "Upload CSV, Parquet or Arrow file",
+            type=['csv', 'parquet', 'pq', 'arrow', 'feather'],
+            help=f"Needs the columns {required_columns_text()}"
+        )
+        
+        if uploaded_file:
+            # Identical uploads share one copy in the store and are only ingested once.
+            # The content is hashed once per upload; reruns look the key up by file_id.
+            upload_keys = st.session_state.setdefault('upload_keys', {})
+            if uploaded_file.file_id not in upload_keys:
+                upload_keys[uploaded_file.file_id] = ('upload', content_digest(uploaded_file))
+            upload_key = upload_keys[uploaded_file.file_id]
+            store = get_store()
+            
+            if store.get(upload_key) is None:
+                progress_bar = st.progress(0.0, text="Reading upload...")
+                try:
+                    new_data, report = ingest_upload(
+                        uploaded_file,
+                        uploaded_file.name,
+                        progress=lambda fraction, rows: progress_bar.progress(fraction, text=f"Read {rows:,} rows")
+                    )
+                except UploadValidationError as e:
+                    progress_bar.empty()
+                    st.error(f"❌ {e}")
+                except Exception as e:
+                    progress_bar.empty()
+                    st.error(f"❌ Error: {str(e)}")
+                else:
+                    store.put(upload_key, new_data, label=f"{uploaded_file.name} ({len(new_data):,} rows)")
+                    # Indexes for the new dataset build in the background while the page renders
+                    # (the script run context lets its cached builders log like the script thread's)
+                    warm_thread = threading.Thread(target=warm_dataset_indexes, args=(upload_key,), daemon=True)
+                    add_script_run_ctx(warm_thread)
+                    warm_thread.start()
+                    
+                    st.success(f"✅ Loaded {report['rows']:,} records in {report['seconds']:.1f}s ({report['memory_mb']:.1f} MB)")
+                    if report['invalid_values']:
+                        st.warning("⚠️ Values that could not be parsed were left empty: " + ", ".join(
+                            f"{col} ({count:,})" for col, count in report['invalid_values'].items()
+                        ))
+            
+            # Switch to a file once when it is uploaded; later picks and resets stick
+            if store.get(upload_key) is not None and st.session_state.get('last_upload_key') != upload_key:
+                st.session_state.last_upload_key = upload_key
+                st.session_state.data_key = upload_key
+                st.rerun()
+        
+        # Datasets already loaded by any session
+        shared_keys = get_store().keys()
+        if len(shared_keys) > 1:
+            st.subheader("Shared Datasets")
+            if st.session_state.data_key in shared_keys:
+                st.session_state.shared_dataset = st.session_state.data_key
+            
+            def use_shared_dataset():
+                st.session_state.data_key = st.session_state.shared_dataset
+            
+            st.selectbox(
+                "Loaded datasets",
+                shared_keys,
+                key="shared_dataset",
+                on_change=use_shared_dataset,
+                format_func=lambda key: "Sample data" if key == SAMPLE_DATA_KEY else get_store().label(key)
+            )
+        
+        st.subheader("Reset to Sample Data")
+        if st.button("🔄 Reset Data", use_container_width=True):
+            st.session_state.data_key = SAMPLE_DATA_KEY
+            st.success("✅ Data reset complete!")
+            st.rerun()
+    
+    # System info
+    with st.expander("💻 System Information", expanded=False):
+        st.subheader("Environment Details")
+        
+        info_data = {
+            "Component": ["Python", "Streamlit", "Pandas", "NumPy", "Plotly", "OS"],
+            "Version": [
+                sys.version.split()[0],
+                st.__version__,
+                pd.__version__,
+                np.__version__,
+                plotly.__version__,
+                f"{sys.platform} {os.name}"
+            ]
+        }
+        
+        info_df = pd.DataFrame(info_data)
+        st.table(info_df)
+        
+        # Analytics
+        st.subheader("📊 Usage Analytics")
+        st.write(f"**Page Views:** {st.session_state.analytics.get('page_views', 0)}")
+        st.write(f"**Predictions Made:** {st.session_state.analytics.get('predictions_made', 0)}")
+        st.write(f"**Data Exports:** {st.session_state.analytics.get('data_exports', 0)}")
+        st.write(f"**Session Started:** {st.session_state.analytics.get('session_start', 'N/A')}")
+        
+        # Render timings
+        st.subheader("⏱️ Render Timings")
+        timings = st.session_state.get('render_timings', {})
+        if timings:
+            st.dataframe(
+                pd.DataFrame([
+                    {
+                        'Section': name,
+                        'Runs': entry['runs'],
+                        'Fragment-only reruns': entry['partial_runs'],
+                        'Last (ms)': round(entry['times'][-1], 1),
+                        'Median (ms)': round(float(np.median(entry['times'])), 1)
+                    }
+                    for name, entry in timings.items()
+                ]),
+                use_container_width=True,
+                hide_index=True
+            )
+        else:
+            st.caption("No renders timed yet in this session")
+    
+    # Performance
+    with st.expander("⚡ Performance", expanded=False):
+        st.subheader("⏱️ Timings Across All Sessions")
+        windows = {"Last 5 minutes": 300, "Last hour": 3600, "Everything recorded": None}
+        window = st.selectbox("Window", list(windows), key="performance_window")
+        timing_summary = get_timings().summary(windows[window])
+        if len(timing_summary):
+            st.dataframe(timing_summary, use_container_width=True, hide_index=True)
+        else:
+            st.caption("No timings recorded in this window")
+        st.caption(f"Rolling buffer holds the latest {len(get_timings()):,} timings from every session")
+        
+        st.subheader("🗄️ Cache Hit Rates")
+        analytics_stats = get_analytics_cache().stats()
+        st.dataframe(
+            cache_hit_rates({
+                'Explorer analytics': analytics_stats,
+                'Exports': get_export_cache().stats(),
+                'Dashboard figures': get_figure_cache().stats()
+            }),
+            use_container_width=True,
+            hide_index=True
+        )
+        st.caption(f"{analytics_stats['incremental_updates']:,} correlation misses answered incrementally from a nearby filter")
+        
+        st.subheader("💾 Memory")
+        process_mb = process_memory_mb()
+        shared_mb = sum(get_store().memory_usage().values()) / 1024 ** 2
+        mem_cols = st.columns(3)
+        mem_cols[0].metric("This session", f"{session_memory_mb(st.session_state.to_dict()):.2f} MB")
+        mem_cols[1].metric("Shared datasets", f"{shared_mb:,.1f} MB")
+        mem_cols[2].metric("Server process", f"{process_mb:,.0f} MB" if process_mb is not None else "n/a")
+        
+        st.subheader("📈 Prometheus Metrics")
+        exposed = start_metrics_exporter()
+        if exposed:
+            for kind, where in exposed.items():
+                st.caption(f"Exposed via {kind}: `{where}`")
+        else:
+            st.caption("Not exposed; set HEALTHCARE_METRICS_PORT or HEALTHCARE_METRICS_FILE before starting the server")
+    
+    # Help section
+    with st.expander("❓ Help & Support", expanded=False):
+        st.markdown("""
+        ### Getting Help
+        - **Documentation:** [docs.healthcare-analytics.com](https://docs.example.com)
+        - **Support Email:** support@healthcare-analytics.com
+        - **GitHub Issues:** [Report a bug](https://github.com/yourusername/healthcare-analytics/issues)
+        
+        ### Mobile Tips
+        1. Rotate your device horizontally for better charts
+        2. Use the hamburger menu (☰) to navigate
+        3. Tap and hold on charts for tooltips
+        """)
+        
+        # Feedback form
+        st.subheader("💬 Feedback")
+        feedback = st.text_area("Your feedback helps us improve:", height=100)
+        
+        if st.button("Submit Feedback", use_container_width=True):
+            st.success("✅ Thank you for your feedback!")
@@ -0,0 +1,490 @@
+# model_inference.py
+import queue
+import threading
+import time
+from collections import deque, namedtuple
+from concurrent.futures import Future
+
+import numpy as np
+import pandas as pd
+
+# ========== HEURISTIC READMISSION MODEL ==========
+# Patient matrix layout: one row per patient, columns in this order
+FEATURE_COLUMNS = [
+    'age',
+    'bmi',
+    'diabetes',
+    'hypertension',
+    'previous_admissions',
+    'length_of_stay',
+    'blood_pressure_sys'
+]
+
+# Factor names, aligned with FEATURE_COLUMNS
+RISK_FACTORS = [
+    'age',
+    'bmi_risk',
+    'diabetes',
+    'hypertension',
+    'previous_admissions',
+    'length_of_stay',
+    'blood_pressure'
+]
+
+BASE_RISK = 0.10
+MIN_RISK = 0.05
+MAX_RISK = 0.95
+
+# Rows scored per pass; keeps the working buffers cache-resident
+CHUNK_SIZE = 65_536
+
+
+def _age_factor(age, out):
+    np.subtract(age, 30.0, out=out)
+    out /= 90.0
+    np.minimum(out, 0.25, out=out)
+
+
+def _bmi_factor(bmi, out):
+    np.subtract(25.0, bmi, out=out)
+    np.abs(out, out=out)
+    out /= 25.0
+    np.minimum(out, 0.15, out=out)
+
+
+def _flag_factor(weight):
+    def factor(flag, out):
+        np.greater(flag, 0, out=out)
+        out *= weight
+    return factor
+
+
+def _capped_ratio_factor(scale, cap):
+    def factor(values, out):
+        np.divide(values, scale, out=out)
+        np.minimum(out, cap, out=out)
+    return factor
+
+
+def _blood_pressure_factor(bp, out):
+    np.subtract(bp, 120.0, out=out)
+    out /= 80.0
+    np.clip(out, 0.0, 0.10, out=out)
+
+
+# One in-place kernel per factor, aligned with RISK_FACTORS
+_FACTOR_KERNELS = [
+    _age_factor,
+    _bmi_factor,
+    _flag_factor(0.15),
+    _flag_factor(0.10),
+    _capped_ratio_factor(10.0, 0.20),
+    _capped_ratio_factor(30.0, 0.15),
+    _blood_pressure_factor
+]
+
+
+def _feature_columns(data):
+    """Return the model features of a DataFrame or (n, 7) matrix as 1-D float arrays"""
+    if isinstance(data, pd.DataFrame):
+        missing = [col for col in FEATURE_COLUMNS if col not in data.columns]
+        if missing:
+            raise ValueError(f"Missing feature columns: {missing}")
+        return [data[col].to_numpy(dtype=np.float64) for col in FEATURE_COLUMNS]
+
+    matrix = np.asarray(data, dtype=np.float64)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    if matrix.ndim != 2 or matrix.shape[1] != len(FEATURE_COLUMNS):
+        raise ValueError(f"Expected an (n, {len(FEATURE_COLUMNS)}) matrix ordered as {FEATURE_COLUMNS}")
+    return [matrix[:, j] for j in range(matrix.shape[1])]
+
+
+def _heuristic_pass(columns, scores, factors=None, chunk_size=CHUNK_SIZE):
+    """Fill scores (and optionally the (n, 7) factor matrix) chunk by chunk"""
+    n_rows = len(scores)
+    scratch = np.empty(min(n_rows, chunk_size))
+
+    for start in range(0, n_rows, chunk_size):
+        stop = min(start + chunk_size, n_rows)
+        total = scores[start:stop]
+        total.fill(BASE_RISK)
+
+        for j, (column, kernel) in enumerate(zip(columns, _FACTOR_KERNELS)):
+            buffer = factors[start:stop, j] if factors is not None else scratch[:stop - start]
+            kernel(column[start:stop], buffer)
+            total += buffer
+
+        np.clip(total, MIN_RISK, MAX_RISK, out=total)
+
+
+def score_batch(data, chunk_size=CHUNK_SIZE):
+    """Score a DataFrame or (n, 7) NumPy matrix of patients in one vectorized call"""
+    columns = _feature_columns(data)
+    scores = np.empty(len(columns[0]))
+    _heuristic_pass(columns, scores, chunk_size=chunk_size)
+    return scores
+
+
+def score_cohort(df, chunk_size=CHUNK_SIZE):
+    """Score every patient in a cohort DataFrame, returning a Series aligned to its index"""
+    return pd.Series(score_batch(df, chunk_size=chunk_size), index=df.index, name='risk_score')
+
+
+def patient_row(age, bmi, diabetes, hypertension, previous_admissions, length_of_stay, blood_pressure):
+    """Build a (1, 7) patient matrix from form input ("Yes"/"No" flags allowed)"""
+    return np.array([[
+        age,
+        bmi,
+        diabetes == "Yes" if isinstance(diabetes, str) else diabetes,
+        hypertension == "Yes" if isinstance(hypertension, str) else hypertension,
+        previous_admissions,
+        length_of_stay,
+        blood_pressure
+    ]], dtype=np.float64)
+
+
+def score_patient(age, bmi, diabetes, hypertension, previous_admissions, length_of_stay, blood_pressure):
+    """Score a single patient from form input, returning (risk_score, risk_factors)"""
+    row = patient_row(age, bmi, diabetes, hypertension, previous_admissions, length_of_stay, blood_pressure)
+
+    scores = np.empty(1)
+    factors = np.empty((1, len(RISK_FACTORS)))
+    _heuristic_pass(_feature_columns(row), scores, factors=factors)
+
+    risk_factors = dict(zip(RISK_FACTORS, factors[0].tolist()))
+    return float(scores[0]), risk_factors
+
+
+# ========== TRAINED MODELS ==========
+def model_feature_matrix(data, feature_columns):
+    """Select a trained model's feature columns from a DataFrame or FEATURE_COLUMNS-ordered matrix"""
+    if isinstance(data, pd.DataFrame):
+        return data[feature_columns].to_numpy(dtype=np.float64)
+
+    matrix = np.asarray(data, dtype=np.float64)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    if list(feature_columns) == FEATURE_COLUMNS:
+        return matrix
+    return matrix[:, [FEATURE_COLUMNS.index(col) for col in feature_columns]]
+
+
+def servable_model(loaded_model, data):
+    """loaded_model if its feature columns can be built from data, else None (use the heuristic)"""
+    if loaded_model is None:
+        return None
+    feature_columns = loaded_model.metadata.get('feature_columns', FEATURE_COLUMNS)
+    available = data.columns if isinstance(data, pd.DataFrame) else FEATURE_COLUMNS
+    if any(col not in available for col in feature_columns):
+        return None
+    return loaded_model
+
+
+def predict_risk(data, loaded_model=None):
+    """Readmission risk from a registry LoadedModel, or the heuristic when none is served
+
+    A model whose features are not in data (e.g. one trained on the extract)
+    also falls back to the heuristic instead of raising.
+    """
+    loaded_model = servable_model(loaded_model, data)
+    if loaded_model is None:
+        return score_batch(data)
+
+    feature_columns = loaded_model.metadata.get('feature_columns', FEATURE_COLUMNS)
+    X = model_feature_matrix(data, feature_columns)
+    return loaded_model.model.predict_proba(X)[:, 1]
+
+
+# ========== EXPLANATIONS ==========
+# contributions: (n, k) per-patient, per-factor attribution; units is 'probability'
+# (additive in risk) or 'log-odds' (additive before the logistic link)
+Explanation = namedtuple('Explanation', ['scores', 'contributions', 'factor_names', 'base_value', 'units'])
+
+
+def _explain_heuristic(data):
+    """Factor contributions from the same chunked pass that computes the score"""
+    columns = _feature_columns(data)
+    scores = np.empty(len(columns[0]))
+    # Fortran order keeps each factor column contiguous for the in-place kernels
+    factors = np.empty((len(scores), len(RISK_FACTORS)), order='F')
+    _heuristic_pass(columns, scores, factors=factors)
+    return Explanation(scores, factors, list(RISK_FACTORS), BASE_RISK, 'probability')
+
+
+def _linear_parts(model):
+    """(transform, coef, intercept) for linear models, pipelines ending in one, or online models"""
+    if hasattr(model, 'steps'):
+        *head, (_, final) = model.steps
+        if hasattr(final, 'coef_'):
+            def transform(X):
+                for _, step in head:
+                    X = step.transform(X)
+                return X
+            return transform, final.coef_[0], final.intercept_[0]
+    if hasattr(model, 'scaler') and hasattr(getattr(model, 'estimator', None), 'coef_'):
+        return model.scaler.transform, model.estimator.coef_[0], model.estimator.intercept_[0]
+    if hasattr(model, 'coef_'):
+        return (lambda X: X), model.coef_[0], model.intercept_[0]
+    return None
+
+
+def _explain_linear(X, parts, feature_means):
+    """coef * (x - mean) in log-odds; base value is the log-odds of the mean patient"""
+    transform, coef, intercept = parts
+    Z = transform(X)
+    reference = transform(np.asarray(feature_means, dtype=np.float64).reshape(1, -1))[0] \
+        if feature_means is not None else np.zeros(len(coef))
+
+    contributions = (Z - reference) * coef
+    base_value = float(intercept + reference @ coef)
+    scores = 1 / (1 + np.exp(-(base_value + contributions.sum(axis=1))))
+    return scores, contributions, base_value
+
+
+def _tree_path_matrix(tree, n_features):
+    """(n_nodes, n_features) matrix of the change in P(readmit) on entering each node"""
+    values = tree.value[:, 0, :]
+    proba = values[:, 1] / values.sum(axis=1)
+
+    parent = np.full(tree.node_count, -1)
+    internal = np.flatnonzero(tree.children_left >= 0)
+    parent[tree.children_left[internal]] = internal
+    parent[tree.children_right[internal]] = internal
+
+    steps = np.zeros((tree.node_count, n_features))
+    child = np.flatnonzero(parent >= 0)
+    steps[child, tree.feature[parent[child]]] = proba[child] - proba[parent[child]]
+    return steps, proba[0]
+
+
+def _is_tree_model(model):
+    """A single decision tree, or a forest whose estimators_ is a list of them"""
+    if hasattr(model, 'tree_'):
+        return True
+    estimators = getattr(model, 'estimators_', None)
+    return isinstance(estimators, list) and all(hasattr(tree, 'tree_') for tree in estimators)
+
+
+def _explain_trees(X, model):
+    """Additive path attributions for a decision tree or forest, one sparse product per batch"""
+    trees = getattr(model, 'estimators_', None) or [model]
+    n_features = X.shape[1]
+
+    parts = [_tree_path_matrix(tree.tree_, n_features) for tree in trees]
+    steps = np.vstack([p[0] for p in parts]) / len(trees)
+    base_value = float(np.mean([p[1] for p in parts]))
+
+    # decision_path returns the node indicator of every tree, stacked column-wise
+    indicator = model.decision_path(X)
+    indicator = indicator[0] if isinstance(indicator, tuple) else indicator
+    contributions = np.asarray(indicator @ steps)
+    return base_value + contributions.sum(axis=1), contributions, base_value
+
+
+def explain_batch(data, loaded_model=None):
+    """Scores and per-patient, per-factor contributions for a whole batch in one pass
+
+    The heuristic returns its factor matrix; linear models (plain, scaled
+    pipelines, online SGD) return log-odds attributions against the training
+    mean; decision trees and random forests return path attributions that sum
+    to predict_proba. Other model types raise TypeError. Models whose
+    features are not in data are explained by the heuristic.
+    """
+    loaded_model = servable_model(loaded_model, data)
+    if loaded_model is None:
+        return _explain_heuristic(data)
+
+    feature_columns = loaded_model.metadata.get('feature_columns', FEATURE_COLUMNS)
+    X = model_feature_matrix(data, feature_columns)
+    model = loaded_model.model
+
+    parts = _linear_parts(model)
+    if parts is not None:
+        scores, contributions, base_value = _explain_linear(X, parts, loaded_model.metadata.get('feature_means'))
+        return Explanation(scores, contributions, list(feature_columns), base_value, 'log-odds')
+
+    if _is_tree_model(model):
+        scores, contributions, base_value = _explain_trees(X, model)
+        return Explanation(scores, contributions, list(feature_columns), base_value, 'probability')
+
+    raise TypeError(f"No additive explanation for {type(model).__name__}")
+
+
+def explain_or_score(data, loaded_model=None):
+    """explain_batch, or the scores alone (contributions None) for models without an additive explanation"""
+    try:
+        return explain_batch(data, loaded_model)
+    except TypeError:
+        return Explanation(predict_risk(data, loaded_model), None, [], None, None)
+
+
+def _slice_explanation(explanation, start, stop):
+    contributions = explanation.contributions
+    return explanation._replace(
+        scores=explanation.scores[start:stop],
+        contributions=None if contributions is None else contributions[start:stop]
+    )
+
+
+def explain_cohort(df, loaded_model=None, top_n=3):
+    """Contribution table for a cohort DataFrame, with each patient's top risk drivers"""
+    explanation = explain_batch(df, loaded_model)
+    result = pd.DataFrame(explanation.contributions, index=df.index, columns=explanation.factor_names)
+
+    # Top drivers for every patient at once: argsort the rows, no per-patient loop
+    names = np.array(explanation.factor_names)
+    top = np.argsort(-explanation.contributions, axis=1)[:, :top_n]
+    for rank in range(top.shape[1]):
+        result[f'top_factor_{rank + 1}'] = names[top[:, rank]]
+
+    result['risk_score'] = explanation.scores
+    return result
+
+# ========== MICRO-BATCHING SCORING SERVICE ==========
+class _ScoringRequest:
+    __slots__ = ('rows', 'explain', 'future', 'enqueued_at')
+
+    def __init__(self, rows, explain=False):
+        self.rows = rows
+        self.explain = explain
+        self.future = Future()
+        self.enqueued_at = time.perf_counter()
+
+
+class BatchScoringService:
+    """In-process scorer that merges concurrent requests into vectorized micro-batches
+
+    Requests wait at most max_wait_ms for company; the batch is then scored in
+    one predict_risk call on a worker thread and each caller's Future resolved.
+    If any request asks for an explanation the batch goes through
+    explain_or_score instead, so scores and contributions come from one pass.
+    """
+
+    def __init__(self, model_provider=None, max_batch_size=512, max_wait_ms=2.0, metrics_window=1000):
+        self.model_provider = model_provider
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+
+        self._queue = queue.Queue()
+        self._stats_lock = threading.Lock()
+        self._batch_sizes = deque(maxlen=metrics_window)
+        self._batch_latencies = deque(maxlen=metrics_window)
+        self._request_latencies = deque(maxlen=metrics_window)
+        self._totals = {'requests': 0, 'rows': 0, 'batches': 0, 'errors': 0}
+
+        self._worker = threading.Thread(target=self._run, name='batch-scoring', daemon=True)
+        self._worker.start()
+
+    def submit(self, rows, explain=False):
+        """Queue (k, 7) patient rows for scoring
+
+        The Future resolves to k risk scores, or with explain=True to
+        (loaded_model, Explanation): the model that scored the batch (None for
+        the heuristic) and its scores and contributions for these rows.
+        """
+        rows = np.asarray(rows, dtype=np.float64)
+        if rows.ndim == 1:
+            rows = rows.reshape(1, -1)
+        if rows.shape[1] != len(FEATURE_COLUMNS):
+            raise ValueError(f"Expected rows ordered as {FEATURE_COLUMNS}")
+
+        request = _ScoringRequest(rows, explain=explain)
+        self._queue.put(request)
+        return request.future
+
+    def score(self, rows, timeout=None):
+        """Blocking convenience wrapper around submit()"""
+        return self.submit(rows).result(timeout=timeout)
+
+    def explain(self, rows, timeout=None):
+        """Blocking (loaded_model, Explanation) for rows, score and factors from the same model and pass"""
+        return self.submit(rows, explain=True).result(timeout=timeout)
+
+    def close(self):
+        self._queue.put(None)
+        self._worker.join()
+
+    def _collect_batch(self, first):
+        batch, n_rows = [first], len(first.rows)
+        deadline = time.perf_counter() + self.max_wait
+
+        while n_rows < self.max_batch_size:
+            timeout = deadline - time.perf_counter()
+            try:
+                request = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is None:
+                # Finish this batch, then let the worker loop see the shutdown marker
+                self._queue.put(None)
+                break
+            batch.append(request)
+            n_rows += len(request.rows)
+        return batch
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+
+            batch = [r for r in self._collect_batch(first) if r.future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+
+            started = time.perf_counter()
+            explanation = None
+            try:
+                rows = np.concatenate([r.rows for r in batch])
+                # Resolved once per batch: a registry swap mid-batch cannot split scores from factors
+                model = servable_model(self.model_provider() if self.model_provider is not None else None, rows)
+                if any(r.explain for r in batch):
+                    explanation = explain_or_score(rows, model)
+                    scores = explanation.scores
+                else:
+                    scores = predict_risk(rows, model)
+            except Exception as e:
+                for request in batch:
+                    request.future.set_exception(e)
+                with self._stats_lock:
+                    self._totals['errors'] += len(batch)
+                continue
+
+            offset = 0
+            for request in batch:
+                n = len(request.rows)
+                if request.explain:
+                    request.future.set_result((model, _slice_explanation(explanation, offset, offset + n)))
+                else:
+                    request.future.set_result(scores[offset:offset + n])
+                offset += n
+
+            finished = time.perf_counter()
+            with self._stats_lock:
+                self._batch_sizes.append(offset)
+                self._batch_latencies.append(finished - started)
+                self._request_latencies.extend(finished - r.enqueued_at for r in batch)
+                self._totals['requests'] += len(batch)
+                self._totals['rows'] += offset
+                self._totals['batches'] += 1
+
+    def metrics(self):
+        """Queue depth, batch-size and scoring-time statistics over the recent window"""
+        with self._stats_lock:
+            sizes = np.array(self._batch_sizes, dtype=np.float64)
+            latencies = np.array(self._batch_latencies, dtype=np.float64) * 1000
+            waits = np.array(self._request_latencies, dtype=np.float64) * 1000
+            totals = dict(self._totals)
+
+        metrics = {'queue_depth': self._queue.qsize(), **totals}
+        if len(sizes):
+            metrics.update({
+                'mean_batch_size': float(sizes.mean()),
+                'max_batch_size': int(sizes.max()),
+                'p50_batch_ms': float(np.percentile(latencies, 50)),
+                'p95_batch_ms': float(np.percentile(latencies, 95)),
+                'p50_request_ms': float(np.percentile(waits, 50)),
+                'p95_request_ms': float(np.percentile(waits, 95))
+            })
+        return metrics
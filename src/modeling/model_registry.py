@@ -0,0 +1,201 @@
+# model_registry.py
+import json
+import os
+import shutil
+import threading
+from collections import OrderedDict, namedtuple
+from datetime import datetime
+
+import joblib
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_REGISTRY_DIR = os.path.join(PROJECT_ROOT, 'models')
+
+ARTIFACT_FILE = 'model.joblib'
+METADATA_FILE = 'metadata.json'
+
+# Registry name of the model served by the prediction page (trained on FEATURE_COLUMNS)
+READMISSION_MODEL = 'readmission'
+# Registry name of models trained on the cleaned extract's features (admission_age, lab values, ...)
+EXTRACT_MODEL = 'readmission_extract'
+
+LoadedModel = namedtuple('LoadedModel', ['name', 'version', 'model', 'metadata'])
+
+
+class ModelRegistry:
+    """Versioned model artifacts on disk with a process-wide LRU of loaded models
+
+    Layout: <root>/<name>/v0001/{model.joblib, metadata.json}. Artifacts are
+    dumped uncompressed so joblib can memory-map their NumPy arrays on load.
+    """
+
+    def __init__(self, root=DEFAULT_REGISTRY_DIR, max_models=4, mmap_mode='r'):
+        self.root = root
+        self.max_models = max_models
+        self.mmap_mode = mmap_mode
+
+        self._cache = OrderedDict()      # (name, version) -> LoadedModel
+        self._served = {}                # name -> LoadedModel currently used for prediction
+        self._loading = set()            # names with a background load in flight
+        self._requested = set()          # names asked for by get_model; the watcher keeps them fresh
+        self._lock = threading.RLock()
+        self._watcher = None
+        self._stop_watcher = threading.Event()
+
+    # ---------- Artifacts on disk ----------
+    def _model_dir(self, name):
+        return os.path.join(self.root, name)
+
+    def list_versions(self, name):
+        """All saved versions of a model, oldest first"""
+        model_dir = self._model_dir(name)
+        if not os.path.isdir(model_dir):
+            return []
+        return sorted(v for v in os.listdir(model_dir) if v.startswith('v') and v[1:].isdigit())
+
+    def latest_version(self, name):
+        versions = self.list_versions(name)
+        return versions[-1] if versions else None
+
+    def save_model(self, name, model, metadata=None):
+        """Save a new version of a model and return its version string"""
+        with self._lock:
+            latest = self.latest_version(name)
+            version = f"v{(int(latest[1:]) if latest else 0) + 1:04d}"
+
+            # Write into a temporary directory and rename, so readers never see a partial artifact
+            final_dir = os.path.join(self._model_dir(name), version)
+            tmp_dir = os.path.join(self._model_dir(name), f".{version}.tmp")
+            os.makedirs(tmp_dir, exist_ok=True)
+            try:
+                joblib.dump(model, os.path.join(tmp_dir, ARTIFACT_FILE), compress=0)
+
+                metadata = dict(metadata or {})
+                metadata.update({
+                    'name': name,
+                    'version': version,
+                    'saved_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    'model_class': type(model).__name__
+                })
+                with open(os.path.join(tmp_dir, METADATA_FILE), 'w') as f:
+                    json.dump(metadata, f, indent=2, default=str)
+
+                os.rename(tmp_dir, final_dir)
+            except Exception:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                raise
+
+        print(f"✅ Saved model {name} {version} to {final_dir}")
+        return version
+
+    # ---------- Loading and LRU cache ----------
+    def load_model(self, name, version=None):
+        """Return a LoadedModel, reading from disk only on a cache miss"""
+        version = version or self.latest_version(name)
+        if version is None:
+            raise FileNotFoundError(f"No saved versions of model '{name}' in {self.root}")
+
+        key = (name, version)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        version_dir = os.path.join(self._model_dir(name), version)
+        model = joblib.load(os.path.join(version_dir, ARTIFACT_FILE), mmap_mode=self.mmap_mode)
+        with open(os.path.join(version_dir, METADATA_FILE)) as f:
+            metadata = json.load(f)
+        loaded = LoadedModel(name, version, model, metadata)
+
+        with self._lock:
+            self._cache[key] = loaded
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_models:
+                self._cache.popitem(last=False)
+        return loaded
+
+    def cached_models(self):
+        with self._lock:
+            return list(self._cache)
+
+    # ---------- Non-blocking serving ----------
+    def get_model(self, name):
+        """Return the served LoadedModel for name, or None while it is still loading
+
+        Never touches the disk on the calling thread: a cold model is loaded in
+        the background and callers fall back to the heuristic score meanwhile.
+        Only the first request starts a load; if no version exists yet, the
+        watcher serves the first one once it is saved.
+        """
+        with self._lock:
+            served = self._served.get(name)
+            if served is None and name not in self._requested:
+                self._requested.add(name)
+                self._load_in_background(name)
+            return served
+
+    def _load_in_background(self, name):
+        with self._lock:
+            if name in self._loading:
+                return
+            self._loading.add(name)
+        threading.Thread(target=self._refresh_safely, args=(name,), daemon=True).start()
+
+    def _refresh_safely(self, name):
+        try:
+            self.refresh(name)
+        except Exception as e:
+            print(f"⚠️ Could not load model {name}: {e}")
+        finally:
+            with self._lock:
+                self._loading.discard(name)
+
+    def refresh(self, name):
+        """Serve the newest saved version of name, loading it if needed"""
+        latest = self.latest_version(name)
+        if latest is None:
+            return None
+        with self._lock:
+            served = self._served.get(name)
+            if served is not None and served.version == latest:
+                return served
+
+        loaded = self.load_model(name, latest)
+        with self._lock:
+            self._served[name] = loaded
+        return loaded
+
+    # ---------- Background reload ----------
+    def start_watcher(self, interval=30):
+        """Poll for new versions of requested models and swap them in without blocking readers"""
+        with self._lock:
+            if self._watcher is not None and self._watcher.is_alive():
+                return
+            self._stop_watcher.clear()
+            self._watcher = threading.Thread(target=self._watch, args=(interval,), daemon=True)
+            self._watcher.start()
+
+    def stop_watcher(self):
+        self._stop_watcher.set()
+
+    def _watch(self, interval):
+        while not self._stop_watcher.wait(interval):
+            with self._lock:
+                names = sorted(set(self._served) | self._requested)
+            for name in names:
+                try:
+                    self.refresh(name)
+                except Exception as e:
+                    print(f"⚠️ Could not reload model {name}: {e}")
+
+
+_registries = {}
+_registries_lock = threading.Lock()
+
+
+def get_registry(root=DEFAULT_REGISTRY_DIR):
+    """Process-wide registry for a directory, shared by every caller (and Streamlit session)"""
+    with _registries_lock:
+        if root not in _registries:
+            _registries[root] = ModelRegistry(root)
+        return _registries[root]
@@ -0,0 +1,295 @@
+# model_training.py
+"""Time-ordered cross-validation and export of readmission models
+
+Usage: python -m src.modeling.model_training admissions.csv   (or --sample) publishes
+a model on the prediction form's features as READMISSION_MODEL.
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from src.modeling.model_inference import FEATURE_COLUMNS
+from src.modeling.model_registry import get_registry, EXTRACT_MODEL, READMISSION_MODEL
+
+TARGET = 'readmission_30d'
+
+# Identifiers, the label itself and columns derived from the *next* admission
+NON_FEATURE_COLUMNS = {
+    'patient_id', 'admission_id', 'item_id', TARGET,
+    'days_to_readmit', 'next_admission_date'
+}
+
+DEFAULT_PARAM_GRID = {
+    'logistic_regression': [{'C': c} for c in (0.01, 0.1, 1.0, 10.0)],
+    'random_forest': [
+        {'n_estimators': 200, 'max_depth': depth, 'min_samples_leaf': leaf}
+        for depth in (6, 12, None) for leaf in (1, 20)
+    ],
+    'hist_gradient_boosting': [
+        {'learning_rate': rate, 'max_leaf_nodes': leaves}
+        for rate in (0.05, 0.1) for leaves in (15, 31)
+    ]
+}
+
+
+# Models the prediction page can break down into factor contributions
+FORM_PARAM_GRID = {kind: DEFAULT_PARAM_GRID[kind] for kind in ('logistic_regression', 'random_forest')}
+
+
+def make_estimator(kind, params):
+    """Build an unfitted scikit-learn estimator for one grid entry"""
+    from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    if kind == 'logistic_regression':
+        return make_pipeline(StandardScaler(), LogisticRegression(max_iter=1000, **params))
+    if kind == 'random_forest':
+        # One core per fit: parallelism comes from running fits side by side
+        return RandomForestClassifier(n_jobs=1, random_state=42, **params)
+    if kind == 'hist_gradient_boosting':
+        return HistGradientBoostingClassifier(random_state=42, **params)
+    raise ValueError(f"Unknown model kind: {kind}")
+
+
+# ========== TRAINING DATA ==========
+def build_training_frame(df):
+    """One row per admission, sorted by admission_date
+
+    The cleaned extract has one row per lab event; lab values are summarised
+    per admission so each stay is weighted once. Any frame with lab_value is
+    summarised, even one lab per admission, so every batch yields the same
+    lab_value_mean/std/count features.
+    """
+    df = df.copy()
+    df['admission_date'] = pd.to_datetime(df['admission_date'])
+
+    has_labs = 'lab_value' in df.columns
+    if 'admission_id' in df.columns and (has_labs or df['admission_id'].duplicated().any()):
+        aggregations = {col: 'first' for col in df.columns if col != 'admission_id'}
+        if TARGET in aggregations:
+            aggregations[TARGET] = 'max'
+        admissions = df.groupby('admission_id', sort=False).agg(aggregations)
+        if has_labs:
+            lab_stats = df.groupby('admission_id', sort=False)['lab_value'].agg(['mean', 'std', 'count'])
+            lab_stats['std'] = lab_stats['std'].fillna(0.0)
+            admissions = admissions.drop(columns='lab_value').join(lab_stats.add_prefix('lab_value_'))
+        df = admissions.reset_index()
+
+    return df.sort_values('admission_date', kind='stable').reset_index(drop=True)
+
+
+def select_feature_columns(df):
+    """Numeric columns that are known at admission time"""
+    return [
+        col for col in df.select_dtypes(include=[np.number, 'bool']).columns
+        if col not in NON_FEATURE_COLUMNS
+    ]
+
+
+def time_ordered_folds(admission_dates, n_splits=5):
+    """Expanding-window folds over rows sorted by admission_date
+
+    Returns (train_stop, val_stop) pairs: fold k trains on rows [0, train_stop)
+    and validates on [train_stop, val_stop). Boundaries snap to whole days so
+    an admission date never appears on both sides.
+    """
+    dates = pd.to_datetime(pd.Series(admission_dates)).dt.normalize().to_numpy()
+    n_rows = len(dates)
+    if n_rows < n_splits + 1:
+        raise ValueError(f"Need at least {n_splits + 1} rows for {n_splits} time-ordered folds")
+
+    cuts = [int(np.searchsorted(dates, dates[(i * n_rows) // (n_splits + 1)], side='left'))
+            for i in range(1, n_splits + 1)]
+    cuts.append(n_rows)
+
+    folds = []
+    for train_stop, val_stop in zip(cuts[:-1], cuts[1:]):
+        if 0 < train_stop < val_stop:
+            folds.append((train_stop, val_stop))
+    return folds
+
+
+# ========== PARALLEL FOLD EVALUATION ==========
+_worker_arrays = {}
+
+
+def _shared_arrays(X_path, y_path):
+    """Memory-map the shared feature matrix once per worker process"""
+    key = (X_path, y_path)
+    if key not in _worker_arrays:
+        _worker_arrays.clear()
+        _worker_arrays[key] = (joblib.load(X_path, mmap_mode='r'), joblib.load(y_path, mmap_mode='r'))
+    return _worker_arrays[key]
+
+
+def _fit_and_score(task):
+    """Fit one (model, params, fold) combination on memory-mapped data"""
+    from sklearn.metrics import average_precision_score, roc_auc_score
+
+    X_path, y_path, kind, params, fold, train_stop, val_stop = task
+    X, y = _shared_arrays(X_path, y_path)
+
+    # Rows are time-sorted, so folds are contiguous zero-copy slices of the memmap
+    y_val = y[train_stop:val_stop]
+    started = time.perf_counter()
+    model = make_estimator(kind, params).fit(X[:train_stop], y[:train_stop])
+    proba = model.predict_proba(X[train_stop:val_stop])[:, 1]
+
+    has_both_classes = len(np.unique(y_val)) == 2
+    return {
+        'model': kind,
+        'params': params,
+        'fold': fold,
+        'n_train': train_stop,
+        'n_val': val_stop - train_stop,
+        'roc_auc': roc_auc_score(y_val, proba) if has_both_classes else np.nan,
+        'average_precision': average_precision_score(y_val, proba) if has_both_classes else np.nan,
+        'fit_seconds': time.perf_counter() - started
+    }
+
+
+def cross_validate_models(X, y, folds, param_grid=None, n_jobs=None, work_dir=None):
+    """Evaluate every fold x parameter combination on a process pool"""
+    param_grid = param_grid or DEFAULT_PARAM_GRID
+    n_jobs = n_jobs or os.cpu_count() or 1
+
+    # Dump the matrices once; workers memory-map them instead of unpickling copies
+    work_dir = tempfile.mkdtemp(prefix='readmission_cv_', dir=work_dir)
+    try:
+        X_path = os.path.join(work_dir, 'X.joblib')
+        y_path = os.path.join(work_dir, 'y.joblib')
+        joblib.dump(np.ascontiguousarray(X, dtype=np.float64), X_path)
+        joblib.dump(np.ascontiguousarray(y), y_path)
+
+        tasks = [
+            (X_path, y_path, kind, params, fold, train_stop, val_stop)
+            for kind, grid in param_grid.items()
+            for params in grid
+            for fold, (train_stop, val_stop) in enumerate(folds)
+        ]
+
+        if n_jobs == 1:
+            results = [_fit_and_score(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+                results = list(pool.map(_fit_and_score, tasks))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return pd.DataFrame(results)
+
+
+def summarise_cv_results(results):
+    """Mean and spread of fold scores per (model, params), best first"""
+    results = results.assign(params=results['params'].map(lambda p: tuple(sorted(p.items()))))
+    summary = results.groupby(['model', 'params'], sort=False).agg(
+        mean_roc_auc=('roc_auc', 'mean'),
+        std_roc_auc=('roc_auc', 'std'),
+        mean_average_precision=('average_precision', 'mean'),
+        fit_seconds=('fit_seconds', 'sum')
+    ).reset_index()
+    return summary.sort_values('mean_roc_auc', ascending=False, na_position='last').reset_index(drop=True)
+
+
+# ========== PIPELINE ==========
+def train_readmission_models(df, feature_columns=None, param_grid=None, n_splits=5, n_jobs=None,
+                             registry=None, model_name=EXTRACT_MODEL):
+    """Cross-validate models over time-ordered folds and export the best to the registry
+
+    Saved as EXTRACT_MODEL by default: extract features are not what the
+    prediction form collects, so it must not replace the served READMISSION_MODEL.
+    """
+    frame = build_training_frame(df)
+    feature_columns = list(feature_columns or select_feature_columns(frame))
+    frame = frame.dropna(subset=feature_columns + [TARGET])
+
+    X = frame[feature_columns].to_numpy(dtype=np.float64)
+    y = frame[TARGET].to_numpy(dtype=np.int64)
+    folds = time_ordered_folds(frame['admission_date'], n_splits=n_splits)
+
+    print(f"🧠 Training on {len(frame):,} admissions, {len(feature_columns)} features, {len(folds)} time-ordered folds")
+    started = time.perf_counter()
+    results = cross_validate_models(X, y, folds, param_grid=param_grid, n_jobs=n_jobs)
+    summary = summarise_cv_results(results)
+    print(f"✅ Evaluated {len(results)} fold/parameter fits in {time.perf_counter() - started:.1f}s")
+
+    best = summary.iloc[0]
+    best_params = dict(best['params'])
+    print(f"🏆 Best: {best['model']} {best_params} (ROC AUC {best['mean_roc_auc']:.3f} ± {best['std_roc_auc']:.3f})")
+
+    # Refit the winner on every admission before exporting
+    model = make_estimator(best['model'], best_params).fit(X, y)
+    registry = registry or get_registry()
+    version = registry.save_model(model_name, model, metadata={
+        'feature_columns': feature_columns,
+        'feature_means': X.mean(axis=0).tolist(),
+        'model_kind': best['model'],
+        'params': best_params,
+        'cv_mean_roc_auc': best['mean_roc_auc'],
+        'cv_std_roc_auc': best['std_roc_auc'],
+        'n_train': len(frame),
+        'trained_through': str(frame['admission_date'].max())
+    })
+
+    return {
+        'version': version,
+        'model': model,
+        'cv_results': results,
+        'summary': summary
+    }
+
+
+def run_training_pipeline(raw_df, **kwargs):
+    """Clean a raw extract with HealthcareDataCleaner, then train and export"""
+    from data.processed.data_cleaning import HealthcareDataCleaner
+
+    cleaner = HealthcareDataCleaner(raw_df).handle_missing_values().create_feature()
+    print(cleaner.get_cleaning_report())
+    return train_readmission_models(cleaner.df, **kwargs)
+
+
+def publish_readmission_model(df, param_grid=None, n_splits=5, n_jobs=None, registry=None):
+    """Train on the prediction form's FEATURE_COLUMNS and publish the winner as READMISSION_MODEL
+
+    df is an app-shaped admissions table (the sample data or an upload): one
+    row per admission with the form's columns, readmission_30d and
+    admission_date. The app's registry watcher serves the new version within
+    one polling interval; rebuild the risk tables afterwards.
+    """
+    return train_readmission_models(df, feature_columns=FEATURE_COLUMNS, param_grid=param_grid or FORM_PARAM_GRID,
+                                    n_splits=n_splits, n_jobs=n_jobs, registry=registry, model_name=READMISSION_MODEL)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('path', nargs='?', help="CSV, Parquet or Arrow admissions file, as uploaded to the app")
+    parser.add_argument('--sample', action='store_true', help="Train on the app's built-in sample dataset")
+    parser.add_argument('--splits', type=int, default=5)
+    parser.add_argument('--jobs', type=int, default=None)
+    args = parser.parse_args()
+    if args.sample == bool(args.path):
+        parser.error("pass a dataset file or --sample")
+
+    if args.sample:
+        from src.app.common import make_sample_data
+        df = make_sample_data()
+    else:
+        from src.modeling.risk_table import load_dataset
+        df = load_dataset(args.path)
+
+    result = publish_readmission_model(df, n_splits=args.splits, n_jobs=args.jobs)
+    print(f"📦 Published {READMISSION_MODEL} {result['version']}; rebuild risk tables with python -m src.modeling.risk_table")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
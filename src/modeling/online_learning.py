@@ -0,0 +1,124 @@
+# online_learning.py
+import copy
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.modeling.model_registry import get_registry
+from src.modeling.model_training import TARGET, build_training_frame, select_feature_columns
+
+ONLINE_MODEL = 'readmission_online'
+
+# A 30-day readmission label is only final once 30 days have passed since discharge
+LABEL_HORIZON = pd.Timedelta(days=30)
+
+
+class OnlineReadmissionModel:
+    """Readmission model updated from daily deltas with partial_fit
+
+    Features are standardised with running statistics (StandardScaler.partial_fit)
+    before an SGD logistic regression update, so each day of newly labelled
+    admissions costs one pass over that day only. predict_proba makes it
+    servable through the registry like any batch-trained model.
+    """
+
+    def __init__(self, feature_columns=None, estimator=None, checkpoint_every=7, checkpoint_interval=3600):
+        from sklearn.linear_model import SGDClassifier
+        from sklearn.preprocessing import StandardScaler
+
+        self.feature_columns = list(feature_columns) if feature_columns else None
+        self.scaler = StandardScaler()
+        self.estimator = estimator or SGDClassifier(loss='log_loss', alpha=1e-4, random_state=42)
+        self.classes = np.array([0, 1])
+
+        self.watermark = None            # newest discharge_date already learned from
+        self.n_seen = 0
+        self.n_updates = 0
+
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint_interval = checkpoint_interval
+        self._updates_since_checkpoint = 0
+        self._last_checkpoint = time.monotonic()
+
+    # ---------- Incremental learning ----------
+    def labeled_delta(self, cleaned_df, as_of=None):
+        """Admissions whose label became final after the watermark, up to as_of"""
+        discharge = pd.to_datetime(cleaned_df['discharge_date'])
+        as_of = pd.Timestamp(as_of) if as_of is not None else pd.to_datetime(cleaned_df['admission_date']).max()
+
+        mask = discharge <= as_of - LABEL_HORIZON
+        if self.watermark is not None:
+            mask &= discharge > self.watermark
+        return cleaned_df[mask]
+
+    def partial_fit(self, X, y):
+        """One incremental step on a feature matrix and labels"""
+        X = np.asarray(X, dtype=np.float64)
+        self.scaler.partial_fit(X)
+        self.estimator.partial_fit(self.scaler.transform(X), y, classes=self.classes)
+        self.n_seen += len(X)
+        self.n_updates += 1
+        return self
+
+    def update(self, cleaned_df, as_of=None, registry=None, model_name=ONLINE_MODEL):
+        """Learn from the newly labelled admissions in a create_feature() output"""
+        delta = self.labeled_delta(cleaned_df, as_of=as_of)
+        if delta.empty:
+            print("ℹ️ No newly labelled admissions since the last update")
+            return 0
+
+        frame = build_training_frame(delta)
+        if self.feature_columns is None:
+            self.feature_columns = select_feature_columns(frame)
+        frame = frame.dropna(subset=self.feature_columns + [TARGET])
+
+        started = time.perf_counter()
+        self.partial_fit(frame[self.feature_columns].to_numpy(dtype=np.float64),
+                         frame[TARGET].to_numpy(dtype=np.int64))
+        self.watermark = pd.to_datetime(delta['discharge_date']).max()
+        self._updates_since_checkpoint += 1
+
+        print(f"✅ Updated on {len(frame):,} admissions in {time.perf_counter() - started:.2f}s "
+              f"(total seen {self.n_seen:,}, watermark {self.watermark:%Y-%m-%d})")
+
+        if self._checkpoint_due():
+            self.checkpoint(registry=registry, model_name=model_name)
+        return len(frame)
+
+    # ---------- Serving ----------
+    def predict_proba(self, X):
+        return self.estimator.predict_proba(self.scaler.transform(np.asarray(X, dtype=np.float64)))
+
+    # ---------- Checkpointing ----------
+    def _checkpoint_due(self):
+        return (self._updates_since_checkpoint >= self.checkpoint_every
+                or time.monotonic() - self._last_checkpoint >= self.checkpoint_interval)
+
+    def checkpoint(self, registry=None, model_name=ONLINE_MODEL):
+        """Save the current state as a new registry version"""
+        registry = registry or get_registry()
+        version = registry.save_model(model_name, self, metadata={
+            'feature_columns': self.feature_columns,
+            'feature_means': self.scaler.mean_.tolist(),
+            'model_kind': 'online_sgd',
+            'watermark': str(self.watermark),
+            'n_seen': self.n_seen,
+            'n_updates': self.n_updates
+        })
+        self._updates_since_checkpoint = 0
+        self._last_checkpoint = time.monotonic()
+        return version
+
+    @classmethod
+    def resume(cls, registry=None, model_name=ONLINE_MODEL):
+        """Latest checkpoint as a writable model, or a fresh one if none exists"""
+        registry = registry or get_registry()
+        if registry.latest_version(model_name) is None:
+            return cls()
+
+        # Registry artifacts are memory-mapped read-only; partial_fit needs its own copy
+        model = copy.deepcopy(registry.load_model(model_name).model)
+        model._updates_since_checkpoint = 0
+        model._last_checkpoint = time.monotonic()
+        return model
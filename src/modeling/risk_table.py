@@ -0,0 +1,210 @@
+# risk_table.py
+"""Nightly batch scores for every current patient, looked up by the prediction page
+
+Usage: python -m src.modeling.risk_table admissions.csv   (or --sample for the app's sample data)
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from src.modeling.model_inference import FEATURE_COLUMNS, predict_risk, servable_model
+from src.modeling.model_registry import get_registry, READMISSION_MODEL
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_RISK_TABLE_DIR = os.path.join(PROJECT_ROOT, 'data', 'risk_scores')
+
+PATIENT_IDS_FILE = 'patient_ids.npy'
+RISK_SCORES_FILE = 'risk_scores.npy'
+BY_RISK_FILE = 'by_risk.npy'
+METADATA_FILE = 'metadata.json'
+
+# The columns a table is built from; only they go into the dataset digest
+RISK_INPUT_COLUMNS = ['patient_id', 'admission_date'] + FEATURE_COLUMNS
+
+
+def dataset_digest(df):
+    """Content hash of the columns a risk table is built from
+
+    Values are normalised (numbers to float64, dates to nanoseconds) so the app
+    and an offline job that read the same file the same way get the same hash
+    whatever dtypes each ended up with.
+    """
+    columns = [col for col in RISK_INPUT_COLUMNS if col in df.columns]
+    frame = pd.DataFrame({
+        col: pd.to_datetime(df[col]).to_numpy(dtype='datetime64[ns]').view(np.int64) if col == 'admission_date'
+        else df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        for col in columns
+    })
+    digest = hashlib.blake2b(repr(columns).encode(), digest_size=16)
+    digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def risk_table_dir(digest, loaded_model=None, root=DEFAULT_RISK_TABLE_DIR):
+    """Directory of the table for one dataset digest and model version, so datasets never share scores"""
+    model = f"{loaded_model.name}-{loaded_model.version}" if loaded_model is not None else 'heuristic'
+    return os.path.join(root, f"{digest[:16]}-{model}")
+
+
+def _save_temp(table_dir, suffix, write):
+    """Write a file under a unique temporary name in table_dir, so concurrent builds never share one"""
+    fd, path = tempfile.mkstemp(suffix=suffix, prefix='.', dir=table_dir)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+    except Exception:
+        os.unlink(path)
+        raise
+    return path
+
+
+def build_risk_table(df, table_dir=DEFAULT_RISK_TABLE_DIR, loaded_model=None):
+    """Nightly stage: batch-score every patient and write the lookup arrays
+
+    Writes patient_ids (sorted), risk_scores (aligned float32) and by_risk
+    (row order of descending risk) as plain .npy files so readers can
+    memory-map them. Patients with several admissions are scored on their
+    latest one.
+    """
+    started = time.perf_counter()
+    if 'admission_date' in df.columns and df['patient_id'].duplicated().any():
+        df = df.sort_values('admission_date', kind='stable').drop_duplicates('patient_id', keep='last')
+
+    loaded_model = servable_model(loaded_model, df)
+    scores = predict_risk(df, loaded_model).astype(np.float32)
+    patient_ids = df['patient_id'].to_numpy(dtype=np.int64)
+
+    order = np.argsort(patient_ids, kind='stable')
+    patient_ids = patient_ids[order]
+    scores = scores[order]
+    by_risk = np.argsort(-scores, kind='stable').astype(np.int64)
+
+    # Write every file next to the live ones, then swap them in
+    os.makedirs(table_dir, exist_ok=True)
+    arrays = {PATIENT_IDS_FILE: patient_ids, RISK_SCORES_FILE: scores, BY_RISK_FILE: by_risk}
+    temp_paths = {
+        name: _save_temp(table_dir, '.npy', lambda f, array=array: np.save(f, array))
+        for name, array in arrays.items()
+    }
+
+    metadata = {
+        'n_patients': len(patient_ids),
+        'built_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'model': f"{loaded_model.name} {loaded_model.version}" if loaded_model is not None else 'heuristic'
+    }
+    temp_paths[METADATA_FILE] = _save_temp(
+        table_dir, '.json', lambda f: f.write(json.dumps(metadata, indent=2).encode('utf-8')))
+
+    # Metadata goes last: its mtime is the table version readers watch
+    for name, path in temp_paths.items():
+        os.replace(path, os.path.join(table_dir, name))
+
+    print(f"✅ Risk table built: {len(patient_ids):,} patients in {time.perf_counter() - started:.2f}s")
+    return table_dir
+
+
+def score_single_patient(df, patient_id, loaded_model=None):
+    """One patient's risk from their latest admission, or None if unknown; for use before a table is built"""
+    rows = df[df['patient_id'].to_numpy() == patient_id]
+    if rows.empty:
+        return None
+    if 'admission_date' in rows.columns:
+        rows = rows.sort_values('admission_date', kind='stable')
+    rows = rows.tail(1)
+    return float(predict_risk(rows, servable_model(loaded_model, rows))[0])
+
+
+def risk_table_version(table_dir=DEFAULT_RISK_TABLE_DIR):
+    """Modification time of the table, or None if it has not been built"""
+    path = os.path.join(table_dir, METADATA_FILE)
+    return os.path.getmtime(path) if os.path.exists(path) else None
+
+
+class RiskTable:
+    """Memory-mapped per-patient risk scores with O(log n) lookup and O(k) top-K"""
+
+    def __init__(self, table_dir=DEFAULT_RISK_TABLE_DIR):
+        self.table_dir = table_dir
+        self.patient_ids = np.load(os.path.join(table_dir, PATIENT_IDS_FILE), mmap_mode='r')
+        self.risk_scores = np.load(os.path.join(table_dir, RISK_SCORES_FILE), mmap_mode='r')
+        self.by_risk = np.load(os.path.join(table_dir, BY_RISK_FILE), mmap_mode='r')
+        with open(os.path.join(table_dir, METADATA_FILE)) as f:
+            self.metadata = json.load(f)
+
+    def __len__(self):
+        return len(self.patient_ids)
+
+    def lookup(self, patient_id):
+        """Risk score for one patient, or None if unknown"""
+        i = int(np.searchsorted(self.patient_ids, patient_id))
+        if i < len(self.patient_ids) and self.patient_ids[i] == patient_id:
+            return float(self.risk_scores[i])
+        return None
+
+    def lookup_many(self, patient_ids):
+        """Vectorized lookup; unknown patients get NaN"""
+        patient_ids = np.asarray(patient_ids, dtype=np.int64)
+        if len(self.patient_ids) == 0:
+            return np.full(len(patient_ids), np.nan)
+        idx = np.searchsorted(self.patient_ids, patient_ids)
+        idx = np.minimum(idx, len(self.patient_ids) - 1)
+        found = self.patient_ids[idx] == patient_ids
+        return np.where(found, self.risk_scores[idx], np.nan)
+
+    def top_k(self, k=10):
+        """The k highest-risk patients as a DataFrame"""
+        rows = np.asarray(self.by_risk[:k])
+        return pd.DataFrame({
+            'patient_id': self.patient_ids[rows],
+            'risk_score': self.risk_scores[rows]
+        })
+
+
+# ========== BATCH ENTRY POINT ==========
+def load_dataset(path):
+    """Read a dataset file exactly as the app's uploader does, so its digest matches the app's"""
+    from src.app.data_ingest import ingest_upload
+
+    with open(path, 'rb') as f:
+        df, report = ingest_upload(f, os.path.basename(path))
+    print(f"📂 Read {report['rows']:,} rows from {path} in {report['seconds']:.1f}s")
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('path', nargs='?', help="CSV, Parquet or Arrow file, as uploaded to the app")
+    parser.add_argument('--sample', action='store_true', help="Score the app's built-in sample dataset")
+    parser.add_argument('--root', default=DEFAULT_RISK_TABLE_DIR)
+    parser.add_argument('--heuristic', action='store_true', help="Ignore the registry and use the heuristic score")
+    args = parser.parse_args()
+    if args.sample == bool(args.path):
+        parser.error("pass a dataset file or --sample")
+
+    if args.sample:
+        from src.app.common import make_sample_data
+        df = make_sample_data()
+    else:
+        df = load_dataset(args.path)
+
+    # The latest saved version is the one the app's registry watcher serves
+    registry = get_registry()
+    loaded_model = None
+    if not args.heuristic and registry.latest_version(READMISSION_MODEL) is not None:
+        loaded_model = servable_model(registry.load_model(READMISSION_MODEL), df)
+
+    table_dir = risk_table_dir(dataset_digest(df), loaded_model, root=args.root)
+    build_risk_table(df, table_dir=table_dir, loaded_model=loaded_model)
+    print(f"📁 {table_dir}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,373 @@
+# metrics.py
+"""Process-wide metrics in Prometheus text format
+
+Counters, gauges and histograms live in one registry per process and are
+rendered in the Prometheus text exposition format, either served over HTTP
+(start_http_server) or written to a file for node_exporter's textfile
+collector (write_textfile / start_textfile_writer, or export_at_exit for
+short-lived pipeline runs). Recording is a dict lookup and an add under a
+lock; anything that is expensive to measure (memory, cache sizes) is
+registered as a collector and only evaluated when metrics are scraped.
+"""
+import atexit
+import bisect
+import functools
+import math
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PREFIX = 'healthcare_'
+METRICS_FILE_ENV = 'HEALTHCARE_METRICS_FILE'
+
+# Seconds: sub-millisecond index lookups up to multi-second pipeline stages
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# Bytes: 1 KB to 1 GB
+SIZE_BUCKETS = tuple(1024 * 4 ** i for i in range(11))
+
+
+def _format_value(value):
+    if value == math.inf:
+        return '+Inf'
+    if value == -math.inf:
+        return '-Inf'
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels) + '}'
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children = {}   # label values tuple -> child
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def labels(self, **labels):
+        """The child for one set of label values; keep it around on hot paths"""
+        key = self._key(labels)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _label_pairs(self, key):
+        return list(zip(self.labelnames, key))
+
+    def samples(self):
+        with self._lock:
+            children = list(self._children.items())
+        for key, child in children:
+            yield from child.samples(self.name, self._label_pairs(key))
+
+
+class _Value:
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+    def set(self, value):
+        self.value = float(value)
+
+    def samples(self, name, labels):
+        yield name, labels, self.value
+
+
+class Counter(_Metric):
+    """Monotonically increasing count; exported as <name>_total"""
+    kind = 'counter'
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount=1, **labels):
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        self.labels(**labels).inc(amount)
+
+    def samples(self):
+        for name, labels, value in super().samples():
+            yield name + '_total', labels, value
+
+
+class Gauge(_Metric):
+    """A value that can go up and down"""
+    kind = 'gauge'
+
+    def _new_child(self):
+        return _Value()
+
+    def set(self, value, **labels):
+        self.labels(**labels).set(value)
+
+    def inc(self, amount=1, **labels):
+        self.labels(**labels).inc(amount)
+
+    def dec(self, amount=1, **labels):
+        self.labels(**labels).inc(-amount)
+
+
+class _HistogramValue:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)   # last slot is +Inf
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[i] += 1
+            self.sum += value
+
+    def samples(self, name, labels):
+        with self._lock:
+            counts = list(self.counts)
+            total = self.sum
+        cumulative = 0
+        for bound, count in zip(self.buckets + (math.inf,), counts):
+            cumulative += count
+            yield name + '_bucket', labels + [('le', _format_value(float(bound)))], cumulative
+        yield name + '_sum', labels, total
+        yield name + '_count', labels, cumulative
+
+
+class Histogram(_Metric):
+    """Bucketed observations with their sum and count"""
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value, **labels):
+        self.labels(**labels).observe(value)
+
+    def time(self, **labels):
+        """Context manager observing the seconds its block takes"""
+        return _Timer(self.labels(**labels))
+
+
+class _Timer:
+    def __init__(self, child):
+        self.child = child
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.child.observe(time.perf_counter() - self.started)
+
+
+class MetricsRegistry:
+    """Named metrics plus scrape-time collectors, rendered in Prometheus text format"""
+
+    def __init__(self, prefix=PREFIX):
+        self.prefix = prefix
+        self._metrics = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name, documentation, labelnames, **kwargs):
+        name = self.prefix + name
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} is already registered with a different type or labels")
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def add_collector(self, collect):
+        """Register collect() -> [(name, kind, help, [(labels dict, value), ...]), ...], run at scrape time"""
+        with self._lock:
+            if collect not in self._collectors:
+                self._collectors.append(collect)
+
+    def render(self):
+        """All metrics in Prometheus text exposition format (version 0.0.4)"""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+            collectors = list(self._collectors)
+
+        lines = []
+        for metric in metrics:
+            # Counter families are named after their _total sample, as Prometheus expects
+            family = metric.name + '_total' if metric.kind == 'counter' else metric.name
+            lines.append(f"# HELP {family} {metric.documentation}")
+            lines.append(f"# TYPE {family} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+        for collect in collectors:
+            try:
+                families = collect()
+            except Exception as e:
+                lines.append(f"# collector {getattr(collect, '__name__', collect)} failed: {_escape(e)}")
+                continue
+            for name, kind, documentation, samples in families:
+                name = self.prefix + name + ('_total' if kind == 'counter' else '')
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    lines.append(f"{name}{_format_labels(sorted(labels.items()))} {_format_value(value)}")
+
+        return '\n'.join(lines) + '\n'
+
+
+_registry = MetricsRegistry()
+
+
+def get_registry():
+    """The process-wide metrics registry"""
+    return _registry
+
+
+# ========== PIPELINE STAGES ==========
+def _stage_metrics():
+    return (
+        _registry.histogram('pipeline_stage_seconds', "Duration of pipeline stages", ['stage']),
+        _registry.counter('pipeline_stage_rows', "Rows produced by pipeline stages", ['stage']),
+        _registry.counter('pipeline_stage_failures', "Pipeline stage runs that raised", ['stage'])
+    )
+
+
+def pipeline_stage(stage):
+    """Decorator recording a pipeline function's duration, output rows and failures"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def timed_stage(*args, **kwargs):
+            # Pipeline runs are short-lived scripts, so their metrics are written when they exit
+            export_at_exit()
+            seconds, rows, failures = _stage_metrics()
+            started = time.perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception:
+                failures.inc(stage=stage)
+                raise
+            seconds.observe(time.perf_counter() - started, stage=stage)
+            frame = getattr(result, 'df', result)
+            if hasattr(frame, '__len__') and hasattr(frame, 'columns'):
+                rows.inc(len(frame), stage=stage)
+            return result
+        return timed_stage
+    return decorator
+
+
+# ========== EXPOSITION ==========
+def write_textfile(path, registry=None):
+    """Write the metrics atomically, e.g. for node_exporter's textfile collector"""
+    registry = registry or _registry
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(registry.render())
+    os.replace(tmp_path, path)
+    return path
+
+
+_exit_paths = set()
+_exit_lock = threading.Lock()
+
+
+def _write_at_exit(path, registry):
+    try:
+        write_textfile(path, registry)
+        print(f"📈 Metrics written to {path}")
+    except OSError as e:
+        print(f"⚠️ Could not write metrics to {path}: {e}")
+
+
+def export_at_exit(path=None, registry=None):
+    """Write the metrics to path (default: $HEALTHCARE_METRICS_FILE) once, when the process exits
+
+    Returns the path, or None when neither is set. Registering the same path
+    again is a no-op, so it is safe to call from every pipeline stage.
+    """
+    path = path or os.environ.get(METRICS_FILE_ENV)
+    if not path:
+        return None
+    with _exit_lock:
+        if path not in _exit_paths:
+            _exit_paths.add(path)
+            atexit.register(_write_at_exit, path, registry)
+    return path
+
+
+def start_textfile_writer(path, interval=15.0, registry=None):
+    """Rewrite the metrics file every interval seconds from a daemon thread"""
+    def loop():
+        while True:
+            try:
+                write_textfile(path, registry)
+            except OSError as e:
+                print(f"⚠️ Could not write metrics to {path}: {e}")
+            time.sleep(interval)
+
+    thread = threading.Thread(target=loop, name='metrics-textfile', daemon=True)
+    thread.start()
+    return thread
+
+
+def start_http_server(port, addr='127.0.0.1', registry=None):
+    """Serve GET /metrics on addr:port from a daemon thread; returns the server"""
+    registry = registry or _registry
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] not in ('/', '/metrics'):
+                self.send_error(404)
+                return
+            body = registry.render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((addr, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='metrics-http', daemon=True).start()
+    return server
@@ -1,13 +1,19 @@
-from scipy.stats import ttest_ind, chi2_contingency  
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+import math
+import os
+
+from scipy.stats import ttest_ind, chi2_contingency
 import pandas as pd
+import numpy as np
 
-def perform_statistical_tests(df):
+def perform_statistical_tests(df, resampling=False, **resampling_options):
     """run statistical tests for insights"""
 
     # T-test: Length stay for readmission VS non-readmission
 
-    los_readmitted = df[df['readmisson_30d'] ==1]['lenght_of_stay']
-    los_non_readmitted = df[df['readmission_30d'] == 0]['lenght_of_stay']
+    los_readmitted = df[df['readmission_30d'] ==1]['length_of_stay']
+    los_non_readmitted = df[df['readmission_30d'] == 0]['length_of_stay']
     t_stat, p_value = ttest_ind(los_readmitted, los_non_readmitted, nan_policy='omit')
 
     #Chi-square test: Gender amd readmisson
@@ -21,10 +27,177 @@ def perform_statistical_tests(df):
 
     if p_value < 0.05:
         print("✅ Significant difference in LOS between readmission and non-readmitted patients")
-        if p_chi < 0.05:
-            print("✅ Significanr association between gender and readmission")
+    if p_chi < 0.05:
+        print("✅ Significanr association between gender and readmission")
+
+    results = {
+        't_test': (t_stat, p_value),
+        'chi_square': (chi2, p_chi)
+    }
+
+    # Resampling mode: permutation p-values and bootstrap CIs for small subgroups
+    if resampling:
+        results.update(perform_resampling_tests(df, **resampling_options))
+
+    return results
+
+
+# ========== RESAMPLING ENGINE ==========
+def _permutation_block(task):
+    """Draw one block of permuted readmission counts for the first group"""
+    seed, n_draws, n_readmitted, n_total, n_first = task
+    rng = np.random.default_rng(seed)
+    # Under the null every relabelling is equally likely, so the number of
+    # readmissions that land in the first group is hypergeometric
+    return rng.hypergeometric(n_readmitted, n_total - n_readmitted, n_first, size=n_draws)
+
+
+def _bootstrap_block(task):
+    """Draw one block of bootstrap readmission-rate differences"""
+    seed, n_draws, k_a, n_a, k_b, n_b = task
+    rng = np.random.default_rng(seed)
+    # Resampling a 0/1 column with replacement is a binomial draw per group
+    rate_a = rng.binomial(n_a, k_a / n_a, size=n_draws) / n_a
+    rate_b = rng.binomial(n_b, k_b / n_b, size=n_draws) / n_b
+    return rate_a - rate_b
+
+
+class ResamplingEngine:
+    """Generate resamples in seeded blocks, optionally across a process pool"""
+
+    def __init__(self, n_jobs=None, block_size=10_000, seed=42):
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+        self.block_size = block_size
+        self.seed = seed
+
+    def _tasks(self, n_resamples, block_args):
+        n_blocks = -(-n_resamples // self.block_size)
+        # One child seed per block (not per worker) so results do not depend on n_jobs
+        seeds = np.random.SeedSequence(self.seed).spawn(n_blocks)
+        for i, seed in enumerate(seeds):
+            n_draws = min(self.block_size, n_resamples - i * self.block_size)
+            yield (seed, n_draws) + tuple(block_args)
+
+    def run(self, block_fn, block_args, n_resamples):
+        """Yield result blocks in order; closing the generator stops the work"""
+        tasks = self._tasks(n_resamples, block_args)
+
+        if self.n_jobs == 1:
+            for task in tasks:
+                yield block_fn(task)
+            return
+
+        pool = ProcessPoolExecutor(max_workers=self.n_jobs)
+        pending = deque()
+        try:
+            # Keep a bounded window of blocks in flight and consume them in order
+            for task in tasks:
+                pending.append(pool.submit(block_fn, task))
+                if len(pending) >= 2 * self.n_jobs:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _split_groups(df, group_col, groups, target):
+    """Return (readmissions, size) for the two compared groups"""
+    if groups is None:
+        groups = tuple(df[group_col].value_counts().index[:2])
+    if len(groups) != 2:
+        raise ValueError(f"Need exactly two groups in '{group_col}' to compare")
+
+    counts = []
+    for group in groups:
+        outcome = df.loc[df[group_col] == group, target].dropna()
+        if len(outcome) == 0:
+            raise ValueError(f"No rows with {group_col} == {group!r}")
+        counts.append((int(outcome.sum()), len(outcome)))
+    return groups, counts
+
+
+def permutation_test_rate_difference(df, group_col='gender', groups=None, target='readmission_30d',
+                                     n_resamples=100_000, precision=0.005, n_jobs=None,
+                                     block_size=10_000, seed=42):
+    """Two-sided permutation p-value for a readmission-rate difference between two groups"""
+    groups, ((k_a, n_a), (k_b, n_b)) = _split_groups(df, group_col, groups, target)
+    observed = k_a / n_a - k_b / n_b
+    n_total, n_readmitted = n_a + n_b, k_a + k_b
+
+    engine = ResamplingEngine(n_jobs=n_jobs, block_size=block_size, seed=seed)
+    blocks = engine.run(_permutation_block, (n_readmitted, n_total, n_a), n_resamples)
+
+    hits = draws = 0
+    p_value = mc_error = 1.0
+    for counts in blocks:
+        diffs = counts / n_a - (n_readmitted - counts) / n_b
+        hits += int(np.count_nonzero(np.abs(diffs) >= abs(observed) - 1e-12))
+        draws += len(counts)
+
+        p_value = (hits + 1) / (draws + 1)
+        mc_error = 1.96 * math.sqrt(p_value * (1 - p_value) / draws)
+        # Stop once the Monte Carlo error on the p-value is within the requested precision
+        if mc_error <= precision:
+            blocks.close()
+            break
+
+    return {
+        'groups': groups,
+        'difference': observed,
+        'p_value': p_value,
+        'mc_error': mc_error,
+        'n_resamples': draws
+    }
+
+
+def bootstrap_rate_difference_ci(df, group_col='gender', groups=None, target='readmission_30d',
+                                 n_resamples=100_000, confidence=0.95, n_jobs=None,
+                                 block_size=10_000, seed=42):
+    """Percentile bootstrap confidence interval for a readmission-rate difference"""
+    groups, ((k_a, n_a), (k_b, n_b)) = _split_groups(df, group_col, groups, target)
+
+    engine = ResamplingEngine(n_jobs=n_jobs, block_size=block_size, seed=seed)
+    diffs = np.concatenate(list(engine.run(_bootstrap_block, (k_a, n_a, k_b, n_b), n_resamples)))
+
+    alpha = (1 - confidence) / 2
+    ci_low, ci_high = np.quantile(diffs, [alpha, 1 - alpha])
+
+    return {
+        'groups': groups,
+        'difference': k_a / n_a - k_b / n_b,
+        'ci': (float(ci_low), float(ci_high)),
+        'confidence': confidence,
+        'n_resamples': len(diffs)
+    }
+
+
+def perform_resampling_tests(df, group_col='gender', groups=None, n_resamples=100_000,
+                             precision=0.005, confidence=0.95, n_jobs=None, seed=42):
+    """Permutation and bootstrap tests of readmission-rate differences"""
+    permutation = permutation_test_rate_difference(
+        df, group_col=group_col, groups=groups, n_resamples=n_resamples,
+        precision=precision, n_jobs=n_jobs, seed=seed
+    )
+    bootstrap = bootstrap_rate_difference_ci(
+        df, group_col=group_col, groups=groups, n_resamples=n_resamples,
+        confidence=confidence, n_jobs=n_jobs, seed=seed
+    )
+
+    group_a, group_b = permutation['groups']
+    ci_low, ci_high = bootstrap['ci']
+
+    print(f"\n🔁 RESAMPLING TEST RESULTS ({group_col}: {group_a} vs {group_b})")
+    print("="*50)
+    print(f"Readmission rate difference: {permutation['difference']:+.4f}")
+    print(f"Permutation p={permutation['p_value']:.4f} "
+          f"(±{permutation['mc_error']:.4f}, {permutation['n_resamples']:,} resamples)")
+    print(f"Bootstrap {confidence:.0%} CI: [{ci_low:+.4f}, {ci_high:+.4f}]")
+
+    if permutation['p_value'] < 0.05:
+        print(f"✅ Significant readmission-rate difference between {group_a} and {group_b}")
 
-            return {
-                't_test': (t_stat, p_value),
-                'chi_square': (chi2, p_chi)
-            }
\ No newline at end of file
+    return {
+        'permutation': permutation,
+        'bootstrap': bootstrap
+    }
@@ -0,0 +1,43 @@
+# test_analytics_cache.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.app.analytics_cache import AnalyticsCache, MomentSums, normalise_filter_key
+
+
+@pytest.fixture(scope='module')
+def frame():
+    rng = np.random.default_rng(1)
+    n = 4000
+    age = rng.integers(18, 95, n).astype(float)
+    df = pd.DataFrame({
+        'age': age,
+        'bmi': 20 + age / 10 + rng.normal(0, 3, n),
+        'length_of_stay': rng.integers(1, 30, n).astype(float),
+        'constant': np.ones(n)
+    })
+    df.loc[rng.choice(n, 200, replace=False), 'bmi'] = np.nan
+    return df
+
+
+def test_moment_sums_match_pandas_corr(frame):
+    X = frame.to_numpy()
+    expected = frame.corr()
+    pd.testing.assert_frame_equal(MomentSums.from_rows(X, frame.columns).corr(), expected, atol=1e-9)
+
+    # Adding and removing rows gives the same matrix as starting over
+    moments = MomentSums.from_rows(X[:3000], frame.columns).subtract(X[:1000]).add(X[3000:])
+    pd.testing.assert_frame_equal(moments.corr(), frame.iloc[1000:].corr(), atol=1e-9)
+
+
+def test_incremental_correlation_matches_pandas(frame):
+    cache = AnalyticsCache()
+    columns = list(frame.columns)
+    for low in (30, 31, 35, 30):
+        positions = np.flatnonzero(frame['age'].between(low, 70).to_numpy())
+        key = normalise_filter_key('explorer', ranges={'age': (low, 70)})
+        result = cache.correlation('data', key, frame, positions, columns)
+        pd.testing.assert_frame_equal(result, frame.take(positions).corr(), atol=1e-9)
+    assert cache.incremental_updates == 2
+    assert cache.stats()['hits'] == 1
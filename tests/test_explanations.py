@@ -0,0 +1,57 @@
+# test_explanations.py
+import numpy as np
+import pytest
+
+from data.synthetic.cohort_generator import generate_cohort
+from src.modeling.model_inference import (
+    BASE_RISK, FEATURE_COLUMNS, MAX_RISK, MIN_RISK, explain_batch, explain_or_score, predict_risk
+)
+from src.modeling.model_registry import LoadedModel
+from src.modeling.model_training import make_estimator
+
+
+@pytest.fixture(scope='module')
+def admissions():
+    df, _ = generate_cohort(800, seed=11, with_labs=False)
+    return df
+
+
+def fitted(admissions, kind, params):
+    X = admissions[FEATURE_COLUMNS].to_numpy(dtype=np.float64)
+    model = make_estimator(kind, params).fit(X, admissions['readmission_30d'])
+    return LoadedModel('readmission', 'v0001', model, {
+        'feature_columns': FEATURE_COLUMNS,
+        'feature_means': X.mean(axis=0).tolist()
+    })
+
+
+def test_heuristic_contributions_add_up(admissions):
+    explanation = explain_batch(admissions)
+    total = np.clip(BASE_RISK + explanation.contributions.sum(axis=1), MIN_RISK, MAX_RISK)
+    np.testing.assert_allclose(explanation.scores, total)
+    np.testing.assert_allclose(explanation.scores, predict_risk(admissions))
+
+
+def test_linear_contributions_add_up_in_log_odds(admissions):
+    loaded = fitted(admissions, 'logistic_regression', {'C': 1.0})
+    explanation = explain_batch(admissions, loaded)
+    assert explanation.units == 'log-odds'
+    log_odds = explanation.base_value + explanation.contributions.sum(axis=1)
+    np.testing.assert_allclose(1 / (1 + np.exp(-log_odds)), predict_risk(admissions, loaded))
+
+
+def test_forest_contributions_add_up_to_probability(admissions):
+    loaded = fitted(admissions, 'random_forest', {'n_estimators': 20, 'max_depth': 6, 'min_samples_leaf': 5})
+    explanation = explain_batch(admissions, loaded)
+    assert explanation.units == 'probability'
+    np.testing.assert_allclose(explanation.base_value + explanation.contributions.sum(axis=1),
+                               predict_risk(admissions, loaded))
+
+
+def test_unexplainable_model_still_scores(admissions):
+    loaded = fitted(admissions, 'hist_gradient_boosting', {'learning_rate': 0.1, 'max_leaf_nodes': 15})
+    with pytest.raises(TypeError):
+        explain_batch(admissions, loaded)
+    explanation = explain_or_score(admissions, loaded)
+    assert explanation.contributions is None
+    np.testing.assert_allclose(explanation.scores, predict_risk(admissions, loaded))
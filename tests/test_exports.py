@@ -0,0 +1,62 @@
+# test_exports.py
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.app.exports import ExportCache, write_export
+
+READERS = {
+    'csv': pd.read_csv,
+    'json': pd.read_json,
+    'xlsx': pd.read_excel,
+    'parquet': pd.read_parquet
+}
+
+
+@pytest.fixture(scope='module')
+def frame():
+    rng = np.random.default_rng(2)
+    n = 2500
+    return pd.DataFrame({
+        'patient_id': np.arange(n),
+        'gender': rng.choice(['Male', 'Female', 'Other'], n),
+        'bmi': rng.normal(27, 5, n).round(2),
+        'readmission_30d': rng.integers(0, 2, n)
+    })
+
+
+@pytest.mark.parametrize('fmt', sorted(READERS))
+def test_chunked_export_round_trips(frame, fmt):
+    buffer = io.BytesIO()
+    size = write_export(frame, fmt, buffer, chunk_rows=700)
+    assert size == len(buffer.getvalue())
+    buffer.seek(0)
+    pd.testing.assert_frame_equal(READERS[fmt](buffer), frame, check_dtype=False)
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'json'])
+def test_chunked_text_export_matches_pandas(frame, fmt):
+    buffer = io.BytesIO()
+    write_export(frame, fmt, buffer, chunk_rows=700)
+    expected = frame.to_csv(index=False) if fmt == 'csv' else frame.to_json(orient='records')
+    assert buffer.getvalue().decode('utf-8') == expected
+
+
+def test_export_cache_serves_files_and_evicts(frame, tmp_path):
+    cache = ExportCache(max_bytes=60_000, directory=str(tmp_path))
+    build = lambda fmt: lambda file: write_export(frame, fmt, file)
+
+    with cache.open_or_build(('data', 'csv'), build('csv')) as served:
+        csv_bytes = served.read()
+    with cache.open_or_build(('data', 'csv'), build('csv')) as served:
+        assert served.read() == csv_bytes
+    assert cache.stats()['hits'] == 1
+
+    # A second payload pushes the first out of the byte budget; its file is removed
+    with cache.open_or_build(('data', 'parquet'), build('parquet')):
+        pass
+    stats = cache.stats()
+    assert stats['entries'] == 1 and stats['bytes'] <= cache.max_bytes
+    assert len(list(tmp_path.iterdir())) == 1
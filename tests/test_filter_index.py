@@ -0,0 +1,62 @@
+# test_filter_index.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.app.filter_index import FilterIndex
+
+
+@pytest.fixture(scope='module')
+def frame():
+    rng = np.random.default_rng(0)
+    n = 5000
+    df = pd.DataFrame({
+        'gender': rng.choice(['Male', 'Female', 'Other'], n),
+        'readmission_30d': rng.integers(0, 2, n),
+        'age': rng.integers(18, 95, n).astype(float),
+        'length_of_stay': rng.integers(1, 30, n),
+        'bmi': rng.normal(27, 5, n).round(1)
+    })
+    df.loc[rng.choice(n, 50, replace=False), 'bmi'] = np.nan
+    return df
+
+
+FILTERS = [
+    ({}, {}),
+    ({'gender': ['Female']}, {}),
+    ({}, {'age': (40, 60)}),
+    ({'gender': ['Male', 'Other'], 'readmission_30d': [1]}, {'age': (18, 90), 'bmi': (25.0, 30.0)}),
+    ({'readmission_30d': [0]}, {'age': (70, 70), 'length_of_stay': (3, 14), 'bmi': (18.5, 40.0)}),
+    ({'gender': []}, {}),
+    ({}, {'age': (200, 300)})
+]
+
+
+@pytest.mark.parametrize('categories, ranges', FILTERS)
+def test_positions_match_pandas_mask(frame, categories, ranges):
+    mask = pd.Series(True, index=frame.index)
+    for col, allowed in categories.items():
+        mask &= frame[col].isin(allowed)
+    for col, (low, high) in ranges.items():
+        mask &= frame[col].between(low, high)
+
+    positions = FilterIndex(frame).positions(categories=categories, ranges=ranges)
+    np.testing.assert_array_equal(positions, np.flatnonzero(mask.to_numpy()))
+
+
+@pytest.mark.parametrize('sort_by, ascending', [(None, True), ('age', True), ('bmi', False), ('gender', True)])
+def test_page_matches_sort_values(frame, sort_by, ascending):
+    index = FilterIndex(frame)
+    positions = index.positions(ranges={'age': (30, 80)})
+    matching = frame.take(positions)
+    if sort_by is not None:
+        matching = matching.sort_values(sort_by, ascending=ascending, kind='stable', na_position='last')
+
+    for page in (0, 3):
+        expected = matching.index[page * 50:(page + 1) * 50].to_numpy()
+        page_positions = index.page(positions, sort_by, ascending, page=page, page_size=50)
+        if ascending:
+            np.testing.assert_array_equal(page_positions, expected)
+        else:
+            # Descending pages reverse the ranks, so ties may come in another row order
+            np.testing.assert_array_equal(frame[sort_by].to_numpy()[page_positions], frame[sort_by].to_numpy()[expected])
@@ -0,0 +1,54 @@
+# test_olap_cube.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.synthetic.cohort_generator import generate_cohort
+from src.app.olap_cube import AGE_BANDS, AGE_BAND_LABELS, OlapCube
+
+
+@pytest.fixture(scope='module')
+def admissions():
+    df, _ = generate_cohort(3000, seed=7, with_labs=False)
+    return df
+
+
+SLICES = [
+    (['Male', 'Female', 'Other'], [0, 1], (18, 90)),
+    (['Female'], [0, 1], (40, 65)),
+    (['Male', 'Other'], [1], (18, 50)),
+    (['Other'], [0], (80, 80))
+]
+
+
+@pytest.mark.parametrize('genders, readmission_status, age_range', SLICES)
+def test_kpis_match_pandas(admissions, genders, readmission_status, age_range):
+    cube = OlapCube(admissions)
+    kpis = cube.kpis(cube.slice(genders, readmission_status, age_range))
+
+    rows = admissions[
+        admissions['gender'].isin(genders) &
+        admissions['readmission_30d'].isin(readmission_status) &
+        admissions['age'].between(*age_range)
+    ]
+    assert kpis['admissions'] == len(rows)
+    assert kpis['readmission_rate'] == pytest.approx(rows['readmission_30d'].mean(), nan_ok=True)
+    assert kpis['avg_length_of_stay'] == pytest.approx(rows['length_of_stay'].mean(), nan_ok=True)
+    assert kpis['avg_age'] == pytest.approx(rows['age'].mean(), nan_ok=True)
+    # Distinct patients come from HyperLogLog sketches: approximate by design
+    assert kpis['patients'] == pytest.approx(rows['patient_id'].nunique(), rel=0.05, abs=2)
+
+
+def test_rollups_match_pandas(admissions):
+    cube = OlapCube(admissions)
+    cells = cube.slice(['Male', 'Female', 'Other'], [0, 1], (0, 120))
+
+    bands = pd.cut(admissions['age'], bins=AGE_BANDS, labels=AGE_BAND_LABELS)
+    expected = admissions.groupby(bands, observed=True)['readmission_30d'].agg(['mean', 'count'])
+    by_band = cube.by_age_band(cells).set_index('age_group')
+    np.testing.assert_allclose(by_band['mean'], expected['mean'])
+    np.testing.assert_array_equal(by_band['count'], expected['count'])
+
+    months = pd.to_datetime(admissions['admission_date']).dt.month
+    expected = admissions.groupby(months)['readmission_30d'].mean()
+    np.testing.assert_allclose(cube.by_month(cells)['readmission_30d'], expected.to_numpy())
@@ -0,0 +1,62 @@
+# test_risk_table.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.synthetic.cohort_generator import generate_cohort
+from src.modeling.model_inference import predict_risk
+from src.modeling.risk_table import RiskTable, build_risk_table, dataset_digest, score_single_patient
+
+
+@pytest.fixture(scope='module')
+def admissions():
+    df, _ = generate_cohort(500, seed=3, with_labs=False)
+    return df
+
+
+@pytest.fixture(scope='module')
+def table(admissions, tmp_path_factory):
+    return RiskTable(build_risk_table(admissions, table_dir=str(tmp_path_factory.mktemp('risk'))))
+
+
+def latest_admissions(df):
+    return df.sort_values('admission_date', kind='stable').drop_duplicates('patient_id', keep='last')
+
+
+def test_lookups_match_pandas_scores(admissions, table):
+    latest = latest_admissions(admissions)
+    expected = pd.Series(predict_risk(latest), index=latest['patient_id']).astype(np.float32)
+    assert len(table) == latest['patient_id'].nunique()
+
+    for patient_id in expected.index[:25]:
+        assert table.lookup(patient_id) == pytest.approx(expected[patient_id])
+        assert table.lookup(patient_id) == pytest.approx(score_single_patient(admissions, patient_id), rel=1e-6)
+
+    unknown = admissions['patient_id'].max() + 1
+    assert table.lookup(unknown) is None
+    looked_up = table.lookup_many(list(expected.index) + [unknown])
+    np.testing.assert_allclose(looked_up[:-1], expected.to_numpy())
+    assert np.isnan(looked_up[-1])
+
+
+def test_top_k_matches_nlargest(admissions, table):
+    latest = latest_admissions(admissions)
+    scores = pd.Series(predict_risk(latest).astype(np.float32), index=latest['patient_id'])
+    top = table.top_k(10)
+    np.testing.assert_allclose(top['risk_score'], scores.nlargest(10).to_numpy())
+    np.testing.assert_allclose(top['risk_score'], scores[top['patient_id']].to_numpy())
+
+
+def test_empty_table_lookup_many(admissions, tmp_path):
+    table = RiskTable(build_risk_table(admissions.iloc[:0], table_dir=str(tmp_path)))
+    assert len(table) == 0
+    assert np.isnan(table.lookup_many([1, 2])).all()
+
+
+def test_digest_ignores_dtypes_but_not_values(admissions):
+    reread = admissions.astype({'age': np.float64, 'previous_admissions': np.float64})
+    assert dataset_digest(reread) == dataset_digest(admissions)
+
+    changed = admissions.copy()
+    changed.loc[changed.index[0], 'bmi'] += 1
+    assert dataset_digest(changed) != dataset_digest(admissions)